@@ -0,0 +1,102 @@
+"""
+Multi-thread throughput benchmark for a shared FrequencyCalculator
+
+Runs the same mix of batch and scalar calculations on 1, 2, 4, ... threads
+sharing one calculator while another thread keeps swapping the band tables,
+and reports rows per second and the speed-up over one thread. On a
+free-threaded (GIL-less) CPython build the speed-up should follow the thread
+count; on a regular build threads only overlap while numpy releases the GIL,
+so expect modest scaling there.
+
+Usage:
+    python examples/thread_benchmark.py [--threads 1 2 4 8] [--seconds 2]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.frequency_calculator import FrequencyCalculator  # noqa: E402
+
+BATCH_ROWS = 2000
+SCALAR_CALLS = 200
+
+
+def gil_enabled() -> bool:
+    """Whether the running interpreter has the GIL enabled"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def run_worker(calc: FrequencyCalculator, seed: int, stop: threading.Event,
+               counts: list, slot: int) -> None:
+    """Calculate batches and scalar calls until stopped, counting rows"""
+    rng = np.random.default_rng(seed)
+    centers = rng.integers(640000, 660000, BATCH_ROWS)
+    bandwidths = rng.choice([20, 40, 50, 100], BATCH_ROWS)
+    rows = 0
+    while not stop.is_set():
+        calc.calculate_carrier_layout_batch('n77', 30, bandwidths, centers)
+        for center in centers[:SCALAR_CALLS].tolist():
+            calc.calculate_point_a_arfcn('n77', 30, 100, center)
+        rows += BATCH_ROWS + SCALAR_CALLS
+    counts[slot] = rows
+
+
+def run_reloader(calc: FrequencyCalculator, stop: threading.Event, interval: float) -> None:
+    """Swap the band tables periodically, like a configuration reload"""
+    while not stop.wait(interval):
+        calc.reload_tables()
+
+
+def measure(threads: int, seconds: float, reload_interval: float) -> float:
+    """Run the workload on a number of threads and return rows per second"""
+    calc = FrequencyCalculator()
+    stop = threading.Event()
+    counts = [0] * threads
+    workers = [threading.Thread(target=run_worker, args=(calc, i, stop, counts, i))
+               for i in range(threads)]
+    reloader = threading.Thread(target=run_reloader, args=(calc, stop, reload_interval))
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    reloader.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers + [reloader]:
+        worker.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared calculator thread scaling benchmark')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Thread counts to measure')
+    parser.add_argument('--seconds', type=float, default=2.0, help='Duration per thread count')
+    parser.add_argument('--reload-interval', type=float, default=0.05,
+                        help='Seconds between band table swaps')
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled() else 'disabled'}, "
+          f"{os.cpu_count()} CPUs")
+    if gil_enabled():
+        print("Note: regular build, threads only overlap inside numpy; "
+              "run on a free-threaded build (python3.13t) to see full scaling")
+
+    baseline = None
+    print(f"{'threads':>7} {'rows/s':>12} {'speed-up':>9}")
+    for threads in args.threads:
+        rate = measure(threads, args.seconds, args.reload_interval)
+        baseline = baseline or rate
+        print(f"{threads:>7} {rate:>12,.0f} {rate / baseline:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+Asyncio facade for the 5G NR frequency calculator
+Lets asyncio services run calculations without blocking the event loop
+"""
+
+import asyncio
+import math
+import os
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .frequency_calculator import FrequencyCalculator, ArrayLike, BandLike
+
+# Batches with fewer rows than this run inline on the event loop
+DEFAULT_OFFLOAD_THRESHOLD = 10000
+
+# Rows per executor task when a batch is offloaded
+DEFAULT_CHUNK_SIZE = 50000
+
+_shared_executor = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_shared_executor() -> Executor:
+    """
+    Get the thread pool shared by all AsyncFrequencyCalculator instances
+
+    numpy releases the GIL in the batch kernels, so a thread pool is enough to
+    keep large batches off the event loop without pickling the inputs.
+
+    Returns:
+        Process-wide ThreadPoolExecutor (created on first use)
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                  thread_name_prefix='nr-calculator')
+        return _shared_executor
+
+
+class AsyncFrequencyCalculator:
+    """
+    Coroutine mirror of FrequencyCalculator
+
+    Scalar methods and batches below the offload threshold run inline. Larger
+    batches are split into chunks that run one after another on the executor;
+    each chunk holds one of max_concurrency slots, so a huge job shares the
+    executor with smaller ones instead of starving them. Cancelling the
+    awaiting task stops the job after the chunk currently running.
+    """
+
+    def __init__(self, calc: Optional[FrequencyCalculator] = None,
+                 executor: Optional[Executor] = None,
+                 offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_concurrency: Optional[int] = None):
+        """
+        Create an async calculator
+
+        Args:
+            calc: Calculator to wrap (default: new FrequencyCalculator)
+            executor: Executor for offloaded chunks (default: get_shared_executor())
+            offload_threshold: Minimum batch size (rows) that is offloaded
+            chunk_size: Rows per offloaded chunk
+            max_concurrency: Maximum chunks running at once per event loop
+                             (default: CPU count)
+
+        Raises:
+            ValueError: If a size or concurrency limit is not positive
+        """
+        if offload_threshold < 1 or chunk_size < 1:
+            raise ValueError("Offload threshold and chunk size must be positive")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"Invalid max_concurrency {max_concurrency}")
+
+        self.calc = calc or FrequencyCalculator()
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    async def calculate_point_a_arfcn(self, band: str, scs_khz: int, bandwidth_mhz: int,
+                                      center_arfcn: int, coreset_zero: int = 0,
+                                      offset_to_carrier_rb: int = 0) -> int:
+        """Async form of FrequencyCalculator.calculate_point_a_arfcn (runs inline)"""
+        return self.calc.calculate_point_a_arfcn(band, scs_khz, bandwidth_mhz, center_arfcn,
+                                                 coreset_zero, offset_to_carrier_rb)
+
+    async def calculate_point_a_arfcn_fdd(self, band: str, scs_khz: int, bandwidth_mhz: int,
+                                          dl_center_arfcn: int, ul_center_arfcn: int,
+                                          offset_to_carrier_rb: int = 0) -> Tuple[int, int]:
+        """Async form of FrequencyCalculator.calculate_point_a_arfcn_fdd (runs inline)"""
+        return self.calc.calculate_point_a_arfcn_fdd(band, scs_khz, bandwidth_mhz,
+                                                     dl_center_arfcn, ul_center_arfcn,
+                                                     offset_to_carrier_rb)
+
+    async def calculate_point_a_arfcn_ul(self, band: str, scs_khz: int, bandwidth_mhz: int,
+                                         ul_center_arfcn: int,
+                                         offset_to_carrier_rb: int = 0) -> int:
+        """Async form of FrequencyCalculator.calculate_point_a_arfcn_ul (runs inline)"""
+        return self.calc.calculate_point_a_arfcn_ul(band, scs_khz, bandwidth_mhz, ul_center_arfcn,
+                                                    offset_to_carrier_rb)
+
+    async def calculate_carrier_layout(self, band: str, scs_khz: int, bandwidth_mhz: int,
+                                       center_arfcn: int, **kwargs: Any) -> Dict[str, Any]:
+        """Async form of FrequencyCalculator.calculate_carrier_layout (runs inline)"""
+        return self.calc.calculate_carrier_layout(band, scs_khz, bandwidth_mhz, center_arfcn,
+                                                  **kwargs)
+
+    async def solve_center_arfcn(self, band: str, point_a_arfcn: int,
+                                 offset_to_carrier_rb: int = 0) -> List[Dict[str, int]]:
+        """Async form of FrequencyCalculator.solve_center_arfcn (runs inline)"""
+        return self.calc.solve_center_arfcn(band, point_a_arfcn, offset_to_carrier_rb)
+
+    async def arfcn_to_frequency(self, band: str, arfcn: int) -> float:
+        """Async form of FrequencyCalculator.arfcn_to_frequency (runs inline)"""
+        return self.calc.arfcn_to_frequency(band, arfcn)
+
+    async def get_band_info(self, band: str) -> Dict[str, Any]:
+        """Async form of FrequencyCalculator.get_band_info (runs inline)"""
+        return self.calc.get_band_info(band)
+
+    async def classify_point_a_batch(self, bands: BandLike, scs_khz: ArrayLike,
+                                     bandwidth_mhz: ArrayLike, center_arfcn: ArrayLike,
+                                     offset_to_carrier_rb: ArrayLike = 0) -> np.ndarray:
+        """Async form of FrequencyCalculator.classify_point_a_batch"""
+        return await self._run_batch(self.calc.classify_point_a_batch, bands, scs_khz,
+                                     bandwidth_mhz, center_arfcn, offset_to_carrier_rb)
+
+    async def calculate_point_a_arfcn_batch(self, bands: BandLike, scs_khz: ArrayLike,
+                                            bandwidth_mhz: ArrayLike, center_arfcn: ArrayLike,
+                                            offset_to_carrier_rb: ArrayLike = 0) -> np.ndarray:
+        """Async form of FrequencyCalculator.calculate_point_a_arfcn_batch"""
+        return await self._run_batch(self.calc.calculate_point_a_arfcn_batch, bands, scs_khz,
+                                     bandwidth_mhz, center_arfcn, offset_to_carrier_rb)
+
+    async def calculate_carrier_layout_batch(self, bands: BandLike, scs_khz: ArrayLike,
+                                             bandwidth_mhz: ArrayLike, center_arfcn: ArrayLike,
+                                             offset_to_carrier_rb: ArrayLike = 0,
+                                             ssb_arfcn: Optional[ArrayLike] = None,
+                                             coreset_zero: Optional[ArrayLike] = None,
+                                             ssb_scs_khz: Optional[ArrayLike] = None,
+                                             pdcch_scs_khz: Optional[ArrayLike] = None
+                                             ) -> Dict[str, np.ndarray]:
+        """Async form of FrequencyCalculator.calculate_carrier_layout_batch"""
+        return await self._run_batch(self.calc.calculate_carrier_layout_batch, bands, scs_khz,
+                                     bandwidth_mhz, center_arfcn, offset_to_carrier_rb,
+                                     ssb_arfcn, coreset_zero, ssb_scs_khz, pdcch_scs_khz)
+
+    async def solve_center_arfcn_batch(self, bands: BandLike, point_a_arfcn: ArrayLike,
+                                       offset_to_carrier_rb: ArrayLike = 0
+                                       ) -> Dict[str, np.ndarray]:
+        """Async form of FrequencyCalculator.solve_center_arfcn_batch"""
+        return await self._run_batch(self.calc.solve_center_arfcn_batch, bands, point_a_arfcn,
+                                     offset_to_carrier_rb, row_key='row')
+
+    async def arfcn_to_frequency_batch(self, bands: Optional[BandLike],
+                                       arfcns: ArrayLike) -> np.ndarray:
+        """Async form of FrequencyCalculator.arfcn_to_frequency_batch"""
+        return await self._run_batch(self.calc.arfcn_to_frequency_batch, bands, arfcns)
+
+    async def _run_batch(self, method: Callable, *args: Any, row_key: Optional[str] = None) -> Any:
+        """
+        Run a batch method inline or in chunks on the executor
+
+        Array arguments (None is passed through) are broadcast and flattened,
+        then processed chunk by chunk in order, so the first invalid row raises
+        the same error as the synchronous method.
+
+        Args:
+            method: Batch method of the wrapped calculator
+            *args: Positional arguments of the method
+            row_key: Result key holding flattened row indexes, for methods whose
+                     results are not one entry per input row
+
+        Returns:
+            The method's result, merged across chunks
+        """
+        columns = [None if arg is None else np.asarray(arg) for arg in args]
+        shape = np.broadcast_shapes(*(column.shape for column in columns if column is not None))
+        size = math.prod(shape)
+        if size < self.offload_threshold:
+            return method(*args)
+
+        flat = [None if column is None else np.broadcast_to(column, shape).ravel()
+                for column in columns]
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(loop)
+        executor = self.executor or get_shared_executor()
+
+        results = []
+        for start in range(0, size, self.chunk_size):
+            chunk = [None if column is None else column[start:start + self.chunk_size]
+                     for column in flat]
+            async with semaphore:
+                results.append(await loop.run_in_executor(executor, method, *chunk))
+
+        return _merge_chunks(results, shape, self.chunk_size, row_key)
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """Get the concurrency limiter of an event loop"""
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+
+def _merge_chunks(results: List[Any], shape: Tuple[int, ...], chunk_size: int,
+                  row_key: Optional[str]) -> Any:
+    """Concatenate per-chunk results and restore the broadcast shape"""
+    if not isinstance(results[0], dict):
+        return np.concatenate(results).reshape(shape)
+
+    if row_key is not None:
+        for i, result in enumerate(results):
+            result[row_key] = result[row_key] + i * chunk_size
+        return {key: np.concatenate([result[key] for result in results]) for key in results[0]}
+
+    return {key: np.concatenate([np.asarray(result[key]).ravel() for result in results]).reshape(shape)
+            for key in results[0]}
@@ -0,0 +1,316 @@
+"""
+gNB configuration dump auditor
+Recomputes Point A for every cell in exported gNB configuration files and
+reports cells whose configured absoluteFrequencyPointA does not match
+"""
+
+import collections
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .band_data import MAX_RB_TABLE
+from .frequency_calculator import FrequencyCalculator
+
+# Accepted field names for each cell parameter (JSON keys, XML attributes or child elements)
+FIELD_ALIASES = {
+    'cell_id': ('cellId', 'cellLocalId', 'nCI'),
+    'band': ('nrBand', 'freqBandIndicatorNR'),
+    'scs_khz': ('subcarrierSpacing',),
+    'carrier_bandwidth_rb': ('carrierBandwidth',),
+    'center_arfcn': ('arfcnDL', 'centerArfcn'),
+    'point_a_arfcn': ('absoluteFrequencyPointA',),
+    'ssb_arfcn': ('absoluteFrequencySSB',),
+    'ssb_scs_khz': ('ssbSubcarrierSpacing', 'subCarrierSpacingCommon'),
+    'offset_to_carrier_rb': ('offsetToCarrier',),
+}
+
+# XML elements that describe one cell
+CELL_TAGS = ('cell', 'NRCellDU', 'nrCell')
+
+# File extensions picked up when auditing a directory
+CONFIG_EXTENSIONS = ('.json', '.xml')
+
+# Integer parameter: optional enumeration prefix (kHz30, n77) and a whole number
+_INT_PATTERN = re.compile(r'[A-Za-z]*(-?\d+)')
+
+_worker_calculator = None
+
+
+def find_config_files(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Expand files and directories into configuration file paths
+
+    Args:
+        paths: Files and/or directories (searched recursively)
+
+    Returns:
+        Iterator over configuration file paths, in sorted order per directory
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(CONFIG_EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def parse_config_file(path: str) -> List[Dict[str, Any]]:
+    """
+    Parse the cells of a gNB configuration dump
+
+    JSON files must contain a list of cell objects or an object with a 'cells'
+    list of them.
+    XML files may nest cell elements (see CELL_TAGS) anywhere; parameters are
+    read from attributes or child elements. Namespaces are ignored.
+
+    Args:
+        path: Path to a .json or .xml file
+
+    Returns:
+        List of raw cell dictionaries (field name to value)
+
+    Raises:
+        ValueError: If the file format is not supported or cannot be parsed
+    """
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON: {e}") from e
+        if isinstance(data, dict):
+            if 'cells' not in data:
+                raise ValueError("Expected a 'cells' list in the JSON object")
+            data = data['cells']
+        if not isinstance(data, list):
+            raise ValueError("Expected a list of cells")
+        for index, cell in enumerate(data):
+            if not isinstance(cell, dict):
+                raise ValueError(f"Cell {index} is not an object: {cell!r}")
+        return data
+
+    if path.lower().endswith('.xml'):
+        try:
+            root = ET.parse(path).getroot()
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid XML: {e}") from e
+        cells = []
+        for element in root.iter():
+            if _local_name(element.tag) in CELL_TAGS:
+                cell = dict(element.attrib)
+                for child in element:
+                    if len(child) == 0 and child.text is not None:
+                        cell[_local_name(child.tag)] = child.text.strip()
+                cells.append(cell)
+        return cells
+
+    raise ValueError(f"Unsupported configuration file: {path}")
+
+
+def audit_cell(calc: FrequencyCalculator, cell: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Audit one cell against the expected Point A
+
+    The expected Point A is recomputed with calculate_point_a_arfcn from the
+    carrier center, SCS, carrierBandwidth (in RBs) and offsetToCarrier. Dumps
+    without a center field (arfcnDL) get the center solved from the configured
+    Point A with solve_center_arfcn, so only the fit of the carrier into the
+    band and onto the raster is checked for them. The whole SSB
+    (absoluteFrequencySSB ± 120 subcarriers of the SSB SCS), if present, must
+    lie inside the carrier.
+
+    Args:
+        calc: Calculator used for the recomputation
+        cell: Raw cell dictionary from parse_config_file
+
+    Returns:
+        Result dictionary with 'cell_id', 'band', 'status' ('ok', 'mismatch'
+        or 'error'), 'configured_point_a', 'expected_point_a' and 'message'
+    """
+    result = {'cell_id': _field(cell, 'cell_id'), 'band': None, 'status': 'error',
+              'configured_point_a': None, 'expected_point_a': None, 'message': ''}
+    try:
+        band = _normalize_band(_required(cell, 'band'))
+        scs_khz = _parse_int(_required(cell, 'scs_khz'))
+        n_rb = _parse_int(_required(cell, 'carrier_bandwidth_rb'))
+        configured = _parse_int(_required(cell, 'point_a_arfcn'))
+        offset_rb = _parse_int(_field(cell, 'offset_to_carrier_rb', 0))
+        ssb = _field(cell, 'ssb_arfcn')
+        if ssb is not None:
+            ssb = _parse_int(ssb)
+
+        result['band'] = band
+        result['configured_point_a'] = configured
+        bandwidth_mhz = _bandwidth_for_rb(scs_khz, n_rb)
+        center_arfcn = _field(cell, 'center_arfcn')
+        if center_arfcn is not None:
+            center_arfcn = _parse_int(center_arfcn)
+        else:
+            center_arfcn = _solve_center(calc, band, scs_khz, bandwidth_mhz, configured,
+                                         offset_rb)
+        expected = calc.calculate_point_a_arfcn(band, scs_khz, bandwidth_mhz, center_arfcn,
+                                                offset_to_carrier_rb=offset_rb)
+        result['expected_point_a'] = expected
+        if ssb is not None:
+            ssb_scs = _field(cell, 'ssb_scs_khz')
+            ssb_scs = int(calc.resolve_ssb_scs_batch(
+                band, scs_khz, None if ssb_scs is None else _parse_int(ssb_scs)))
+            ssb_freq = calc.arfcn_to_frequency(band, ssb)
+            ssb_half_mhz = 120 * ssb_scs / 1000.0
+            carrier_low = (calc.arfcn_to_frequency(band, expected) +
+                           offset_rb * 12 * scs_khz / 1000.0)
+            carrier_high = carrier_low + n_rb * 12 * scs_khz / 1000.0
+    except ValueError as e:
+        result['message'] = str(e)
+        return result
+
+    if configured != expected:
+        result['status'] = 'mismatch'
+        result['message'] = (f"absoluteFrequencyPointA {configured} != expected {expected} "
+                             f"({configured - expected:+d} ARFCN)")
+        return result
+
+    if ssb is not None and not (carrier_low <= ssb_freq - ssb_half_mhz and
+                                ssb_freq + ssb_half_mhz <= carrier_high):
+        result['status'] = 'mismatch'
+        result['message'] = (f"SSB {ssb_freq - ssb_half_mhz:.3f}-{ssb_freq + ssb_half_mhz:.3f} "
+                             f"MHz (absoluteFrequencySSB {ssb}) outside carrier "
+                             f"{carrier_low:.3f}-{carrier_high:.3f} MHz")
+        return result
+
+    result['status'] = 'ok'
+    return result
+
+
+def audit_file(path: str, calc: Optional[FrequencyCalculator] = None) -> List[Dict[str, Any]]:
+    """
+    Parse a configuration file and audit all of its cells
+
+    Args:
+        path: Path to a .json or .xml configuration dump
+        calc: Calculator to use (default: one shared calculator per process)
+
+    Returns:
+        List of result dictionaries (see audit_cell), each with a 'file' key;
+        a file that cannot be parsed yields a single 'error' result
+    """
+    if calc is None:
+        calc = _get_worker_calculator()
+
+    try:
+        cells = parse_config_file(path)
+    except (OSError, ValueError) as e:
+        return [{'file': path, 'cell_id': None, 'band': None, 'status': 'error',
+                 'configured_point_a': None, 'expected_point_a': None, 'message': str(e)}]
+
+    results = []
+    for cell in cells:
+        result = audit_cell(calc, cell)
+        result['file'] = path
+        results.append(result)
+    return results
+
+
+def audit_files(paths: Iterable[str], workers: Optional[int] = None,
+                use_processes: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Audit configuration files in parallel and stream the results
+
+    Files are parsed and audited in a thread or process pool. At most a few
+    files per worker are in flight, so memory stays bounded however many files
+    are audited, and results are yielded in input order as soon as available.
+
+    Args:
+        paths: Files and/or directories to audit
+        workers: Number of pool workers (default: CPU count)
+        use_processes: Use a process pool instead of a thread pool
+
+    Returns:
+        Iterator over result dictionaries (see audit_file)
+    """
+    workers = workers or os.cpu_count() or 1
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        for results in _bounded_map(executor, audit_file, find_config_files(paths), workers * 4):
+            yield from results
+
+
+def _bounded_map(executor: Executor, fn: Callable, items: Iterable,
+                 max_pending: int) -> Iterator[Any]:
+    """Like Executor.map, but only keeps max_pending tasks submitted at a time"""
+    pending = collections.deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _get_worker_calculator() -> FrequencyCalculator:
+    """Get the calculator shared by all audits in this process"""
+    global _worker_calculator
+    if _worker_calculator is None:
+        _worker_calculator = FrequencyCalculator()
+    return _worker_calculator
+
+
+def _bandwidth_for_rb(scs_khz: int, n_rb: int) -> int:
+    """Find the channel bandwidth whose maximum RB number is n_rb"""
+    for bandwidth_mhz, max_rb in MAX_RB_TABLE.get(scs_khz, {}).items():
+        if max_rb == n_rb:
+            return bandwidth_mhz
+    raise ValueError(f"No channel bandwidth with carrierBandwidth {n_rb} RB at SCS {scs_khz} kHz")
+
+
+def _solve_center(calc: FrequencyCalculator, band: str, scs_khz: int, bandwidth_mhz: int,
+                  point_a_arfcn: int, offset_rb: int) -> int:
+    """Solve the center ARFCN of a cell without a center field from its Point A"""
+    for solution in calc.solve_center_arfcn(band, point_a_arfcn, offset_rb):
+        if solution['scs_khz'] == scs_khz and solution['bandwidth_mhz'] == bandwidth_mhz:
+            return solution['center_arfcn']
+    raise ValueError(f"absoluteFrequencyPointA {point_a_arfcn} places the {bandwidth_mhz} MHz "
+                     f"carrier outside band {band}")
+
+
+def _field(cell: Dict[str, Any], name: str, default: Any = None) -> Any:
+    """Get a cell parameter by any of its accepted names"""
+    for alias in FIELD_ALIASES[name]:
+        if alias in cell:
+            return cell[alias]
+    return default
+
+
+def _required(cell: Dict[str, Any], name: str) -> Any:
+    """Get a mandatory cell parameter"""
+    value = _field(cell, name)
+    if value is None:
+        raise ValueError(f"Missing {FIELD_ALIASES[name][0]}")
+    return value
+
+
+def _parse_int(value: Any) -> int:
+    """Parse an integer parameter, accepting enumerated forms such as 'kHz30' or 'n77'"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    match = _INT_PATTERN.fullmatch(str(value).strip())
+    if match is None:
+        raise ValueError(f"Invalid integer value: {value!r}")
+    return int(match.group(1))
+
+
+def _normalize_band(value: Any) -> str:
+    """Normalize a band indicator (77, '77' or 'n77') to 'n77'"""
+    return f"n{_parse_int(value)}"
+
+
+def _local_name(tag: str) -> str:
+    """Strip an XML namespace from a tag"""
+    return tag.rsplit('}', 1)[-1]
@@ -3,9 +3,92 @@
 Based on 3GPP TS 38.104 Release 16
 """
 
+import bisect
+import hashlib
+import json
 from typing import Dict, Any
 
+import numpy as np
+
+# 3GPP TS 38.104 Table 5.4.2.1-1: NR-ARFCN parameters for the global frequency raster
+# Ranges are ordered by ARFCN (and frequency) so they can be binary searched
+GLOBAL_RASTER_RANGES = [
+    {
+        'freq_low': 0.0,            # MHz
+        'freq_high': 3000.0,        # MHz
+        'delta_f_global': 5.0,      # kHz
+        'freq_ref_offset': 0.0,     # F_REF_Offs (MHz)
+        'arfcn_offset': 0,          # N_REF_Offs
+        'arfcn_low': 0,             # First N_REF of the range
+        'arfcn_high': 599999,       # Last N_REF of the range
+    },
+    {
+        'freq_low': 3000.0,
+        'freq_high': 24250.0,
+        'delta_f_global': 15.0,
+        'freq_ref_offset': 3000.0,
+        'arfcn_offset': 600000,
+        'arfcn_low': 600000,
+        'arfcn_high': 2016666,
+    },
+    {
+        'freq_low': 24250.0,
+        'freq_high': 100000.0,
+        'delta_f_global': 60.0,
+        'freq_ref_offset': 24250.08,
+        'arfcn_offset': 2016667,
+        'arfcn_low': 2016667,
+        'arfcn_high': 3279165,
+    },
+]
+
+_RASTER_ARFCN_LOWS = [r['arfcn_low'] for r in GLOBAL_RASTER_RANGES]
+_RASTER_FREQ_LOWS = [r['freq_low'] for r in GLOBAL_RASTER_RANGES]
+
+
+def get_raster_range(arfcn: int) -> Dict[str, Any]:
+    """
+    Get the global raster range containing an NR-ARFCN
+    
+    Args:
+        arfcn: NR-ARFCN value
+        
+    Returns:
+        Raster range parameters (F_REF_Offs, N_REF_Offs, Δf_global)
+        
+    Raises:
+        ValueError: If ARFCN is outside the global raster
+    """
+    index = bisect.bisect_right(_RASTER_ARFCN_LOWS, arfcn) - 1
+    if index < 0 or arfcn > GLOBAL_RASTER_RANGES[index]['arfcn_high']:
+        raise ValueError(f"ARFCN {arfcn} outside the global frequency raster")
+    
+    return GLOBAL_RASTER_RANGES[index].copy()
+
+
+def get_raster_range_for_frequency(frequency_mhz: float) -> Dict[str, Any]:
+    """
+    Get the global raster range containing a frequency
+    
+    Args:
+        frequency_mhz: Frequency in MHz
+        
+    Returns:
+        Raster range parameters (F_REF_Offs, N_REF_Offs, Δf_global)
+        
+    Raises:
+        ValueError: If frequency is outside the global raster
+    """
+    index = bisect.bisect_right(_RASTER_FREQ_LOWS, frequency_mhz) - 1
+    if index < 0 or frequency_mhz >= GLOBAL_RASTER_RANGES[index]['freq_high']:
+        raise ValueError(f"Frequency {frequency_mhz} MHz outside the global frequency raster")
+    
+    return GLOBAL_RASTER_RANGES[index].copy()
+
+
 # 3GPP TS 38.104 Table 5.4.2.1-1: NR operating bands
+# Raster parameters (arfcn_offset, freq_ref_offset, delta_f_global) are taken from
+# the GLOBAL_RASTER_RANGES entry containing dl_freq_low: NR-ARFCNs are global
 NR_BANDS = {
     'n1': {
         'name': 'n1',
@@ -15,12 +98,9 @@ NR_BANDS = {
         'dl_freq_high': 2170.0,     # MHz
         'ul_freq_low': 1920.0,      # MHz  
         'ul_freq_high': 1980.0,     # MHz
-        'arfcn_offset': 0,          # N_REF_Offs (0 for frequency range 0-3000 MHz)
-        'ul_arfcn_offset': 0,       # N_REF_Offs for UL (same as DL for n1)
-        'freq_ref_offset': 0.0,     # F_REF_Offs (0 MHz for frequency range 0-3000 MHz)
-        'delta_f_global': 5.0,      # kHz (5 kHz for frequency range 0-3000 MHz)
         'delta_f_raster': 100.0,    # kHz (100 kHz raster from table)
         'supported_scs': [15, 30],  # kHz
+        'ssb_scs': [15],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
         'supported_bandwidths': [5, 10, 15, 20, 25, 30, 40, 50],  # MHz
     },
     'n5': {
@@ -31,12 +111,9 @@ NR_BANDS = {
         'dl_freq_high': 894.0,      # MHz
         'ul_freq_low': 824.0,       # MHz
         'ul_freq_high': 849.0,      # MHz
-        'arfcn_offset': 0,          # N_REF_Offs (0 for frequency range 0-3000 MHz)
-        'ul_arfcn_offset': 0,       # N_REF_Offs for UL
-        'freq_ref_offset': 0.0,     # F_REF_Offs (0 MHz for frequency range 0-3000 MHz)
-        'delta_f_global': 5.0,      # kHz (5 kHz for frequency range 0-3000 MHz)
         'delta_f_raster': 100.0,    # kHz (100 kHz raster from table)
         'supported_scs': [15, 30],  # kHz
+        'ssb_scs': [15, 30],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
         'supported_bandwidths': [5, 10, 15, 20, 25, 30, 40, 50],  # MHz
     },
     'n7': {
@@ -47,12 +124,9 @@ NR_BANDS = {
         'dl_freq_high': 2690.0,     # MHz
         'ul_freq_low': 2500.0,      # MHz
         'ul_freq_high': 2570.0,     # MHz
-        'arfcn_offset': 0,          # N_REF_Offs (0 for frequency range 0-3000 MHz)
-        'ul_arfcn_offset': 0,       # N_REF_Offs for UL
-        'freq_ref_offset': 0.0,     # F_REF_Offs (0 MHz for frequency range 0-3000 MHz)
-        'delta_f_global': 5.0,      # kHz (5 kHz for frequency range 0-3000 MHz)
         'delta_f_raster': 100.0,    # kHz (100 kHz raster from table)
         'supported_scs': [15, 30],  # kHz
+        'ssb_scs': [15],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
         'supported_bandwidths': [5, 10, 15, 20, 25, 30, 40, 50],  # MHz
     },
     'n8': {
@@ -63,12 +137,9 @@ NR_BANDS = {
         'dl_freq_high': 960.0,      # MHz
         'ul_freq_low': 880.0,       # MHz
         'ul_freq_high': 915.0,      # MHz
-        'arfcn_offset': 0,          # N_REF_Offs (0 for frequency range 0-3000 MHz)
-        'ul_arfcn_offset': 0,       # N_REF_Offs for UL
-        'freq_ref_offset': 0.0,     # F_REF_Offs (0 MHz for frequency range 0-3000 MHz)
-        'delta_f_global': 5.0,      # kHz (5 kHz for frequency range 0-3000 MHz)
         'delta_f_raster': 100.0,    # kHz (100 kHz raster from table)
         'supported_scs': [15, 30],  # kHz
+        'ssb_scs': [15],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
         'supported_bandwidths': [5, 10, 15, 20, 25, 30, 40, 50],  # MHz
     },
     'n12': {
@@ -79,12 +150,9 @@ NR_BANDS = {
         'dl_freq_high': 746.0,      # MHz
         'ul_freq_low': 699.0,       # MHz
         'ul_freq_high': 716.0,      # MHz
-        'arfcn_offset': 0,          # N_REF_Offs (0 for frequency range 0-3000 MHz)
-        'ul_arfcn_offset': 0,       # N_REF_Offs for UL
-        'freq_ref_offset': 0.0,     # F_REF_Offs (0 MHz for frequency range 0-3000 MHz)
-        'delta_f_global': 5.0,      # kHz (5 kHz for frequency range 0-3000 MHz)
         'delta_f_raster': 100.0,    # kHz (100 kHz raster from table)
         'supported_scs': [15, 30],  # kHz
+        'ssb_scs': [15],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
         'supported_bandwidths': [5, 10, 15, 20, 25, 30, 40, 50],  # MHz
     },
     'n2': {
@@ -95,12 +163,9 @@ NR_BANDS = {
         'dl_freq_high': 1990.0,     # MHz
         'ul_freq_low': 1850.0,      # MHz
         'ul_freq_high': 1910.0,     # MHz
-        'arfcn_offset': 0,          # N_REF_Offs (0 for frequency range 0-3000 MHz)
-        'ul_arfcn_offset': 0,       # N_REF_Offs for UL
-        'freq_ref_offset': 0.0,     # F_REF_Offs (0 MHz for frequency range 0-3000 MHz)
-        'delta_f_global': 5.0,      # kHz (5 kHz for frequency range 0-3000 MHz)
         'delta_f_raster': 100.0,    # kHz (100 kHz raster from table)
         'supported_scs': [15, 30],  # kHz
+        'ssb_scs': [15],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
         'supported_bandwidths': [5, 10, 15, 20, 25, 30, 40, 50],  # MHz
     },
     'n3': {
@@ -111,12 +176,9 @@ NR_BANDS = {
         'dl_freq_high': 1880.0,     # MHz
         'ul_freq_low': 1710.0,      # MHz
         'ul_freq_high': 1785.0,     # MHz
-        'arfcn_offset': 0,          # N_REF_Offs (0 for frequency range 0-3000 MHz)
-        'ul_arfcn_offset': 0,       # N_REF_Offs for UL
-        'freq_ref_offset': 0.0,     # F_REF_Offs (0 MHz for frequency range 0-3000 MHz)
-        'delta_f_global': 5.0,      # kHz (5 kHz for frequency range 0-3000 MHz)
         'delta_f_raster': 100.0,    # kHz (100 kHz raster from table)
         'supported_scs': [15, 30],  # kHz
+        'ssb_scs': [15],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
         'supported_bandwidths': [5, 10, 15, 20, 25, 30, 40, 50],  # MHz
     },
     'n48': {
@@ -127,11 +189,9 @@ NR_BANDS = {
         'dl_freq_high': 3700.0,     # MHz
         'ul_freq_low': 3550.0,      # MHz
         'ul_freq_high': 3700.0,     # MHz
-        'arfcn_offset': 600000,     # N_REF_Offs (600000 for frequency range 3000-24250 MHz)
-        'freq_ref_offset': 3000.0,  # F_REF_Offs (3000 MHz for frequency range 3000-24250 MHz)
-        'delta_f_global': 15.0,     # kHz (15 kHz for frequency range 3000-24250 MHz)
         'delta_f_raster': 15.0,     # kHz (15 kHz raster)
         'supported_scs': [15, 30],  # kHz
+        'ssb_scs': [30],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
         'supported_bandwidths': [10, 15, 20, 25, 30, 40, 50, 60, 70, 80, 90, 100],  # MHz
     },
     'n77': {
@@ -142,15 +202,136 @@ NR_BANDS = {
         'dl_freq_high': 4200.0,     # MHz
         'ul_freq_low': 3300.0,      # MHz  
         'ul_freq_high': 4200.0,     # MHz
-        'arfcn_offset': 620000,     # N_REF_Offs
-        'freq_ref_offset': 3000.0,  # F_REF_Offs (MHz)
-        'delta_f_global': 15.0,     # kHz
         'delta_f_raster': 15.0,     # kHz
         'supported_scs': [15, 30, 60],  # kHz
+        'ssb_scs': [30],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
         'supported_bandwidths': [10, 15, 20, 25, 30, 40, 50, 60, 70, 80, 90, 100],  # MHz
+    },
+    # FR2 bands (3GPP TS 38.101-2 Table 5.2-1)
+    'n257': {
+        'name': 'n257',
+        'frequency_range': 'FR2',
+        'duplex_mode': 'TDD',
+        'dl_freq_low': 26500.0,     # MHz
+        'dl_freq_high': 29500.0,    # MHz
+        'ul_freq_low': 26500.0,     # MHz
+        'ul_freq_high': 29500.0,    # MHz
+        'delta_f_raster': 60.0,     # kHz
+        'supported_scs': [120],     # kHz
+        'ssb_scs': [120],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
+        'supported_bandwidths': [50, 100, 200, 400],  # MHz
+    },
+    'n258': {
+        'name': 'n258',
+        'frequency_range': 'FR2',
+        'duplex_mode': 'TDD',
+        'dl_freq_low': 24250.0,     # MHz
+        'dl_freq_high': 27500.0,    # MHz
+        'ul_freq_low': 24250.0,     # MHz
+        'ul_freq_high': 27500.0,    # MHz
+        'delta_f_raster': 60.0,     # kHz
+        'supported_scs': [120],     # kHz
+        'ssb_scs': [120],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
+        'supported_bandwidths': [50, 100, 200, 400],  # MHz
+    },
+    'n260': {
+        'name': 'n260',
+        'frequency_range': 'FR2',
+        'duplex_mode': 'TDD',
+        'dl_freq_low': 37000.0,     # MHz
+        'dl_freq_high': 40000.0,    # MHz
+        'ul_freq_low': 37000.0,     # MHz
+        'ul_freq_high': 40000.0,    # MHz
+        'delta_f_raster': 60.0,     # kHz
+        'supported_scs': [120],     # kHz
+        'ssb_scs': [120],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
+        'supported_bandwidths': [50, 100, 200, 400],  # MHz
+    },
+    'n261': {
+        'name': 'n261',
+        'frequency_range': 'FR2',
+        'duplex_mode': 'TDD',
+        'dl_freq_low': 27500.0,     # MHz
+        'dl_freq_high': 28350.0,    # MHz
+        'ul_freq_low': 27500.0,     # MHz
+        'ul_freq_high': 28350.0,    # MHz
+        'delta_f_raster': 60.0,     # kHz
+        'supported_scs': [120],     # kHz
+        'ssb_scs': [120],  # kHz, SSB (TS 38.104 Table 5.4.3.3-1)
+        'supported_bandwidths': [50, 100, 200, 400],  # MHz
     }
 }
 
+for _band in NR_BANDS.values():
+    _raster = get_raster_range_for_frequency(_band['dl_freq_low'])
+    _band['arfcn_offset'] = _raster['arfcn_offset']
+    _band['freq_ref_offset'] = _raster['freq_ref_offset']
+    _band['delta_f_global'] = _raster['delta_f_global']
+    _band.setdefault('ul_arfcn_offset', _band['arfcn_offset'])
+del _band, _raster
+
+# 3GPP TS 36.101 Table 5.7.3-1: E-UTRA channel numbers of the LTE bands shared with NR
+# bands under DSS. F = F_low + 0.1 (N - N_Offs) MHz for N_Offs <= N <= earfcn_high
+LTE_BANDS = {
+    1: {
+        'nr_band': 'n1',
+        'dl_freq_low': 2110.0,      # MHz
+        'dl_earfcn_offset': 0,      # N_Offs-DL
+        'dl_earfcn_high': 599,
+        'ul_freq_low': 1920.0,      # MHz
+        'ul_earfcn_offset': 18000,  # N_Offs-UL
+        'ul_earfcn_high': 18599,
+    },
+    3: {
+        'nr_band': 'n3',
+        'dl_freq_low': 1805.0,
+        'dl_earfcn_offset': 1200,
+        'dl_earfcn_high': 1949,
+        'ul_freq_low': 1710.0,
+        'ul_earfcn_offset': 19200,
+        'ul_earfcn_high': 19949,
+    },
+    5: {
+        'nr_band': 'n5',
+        'dl_freq_low': 869.0,
+        'dl_earfcn_offset': 2400,
+        'dl_earfcn_high': 2649,
+        'ul_freq_low': 824.0,
+        'ul_earfcn_offset': 20400,
+        'ul_earfcn_high': 20649,
+    },
+    7: {
+        'nr_band': 'n7',
+        'dl_freq_low': 2620.0,
+        'dl_earfcn_offset': 2750,
+        'dl_earfcn_high': 3449,
+        'ul_freq_low': 2500.0,
+        'ul_earfcn_offset': 20750,
+        'ul_earfcn_high': 21449,
+    },
+    8: {
+        'nr_band': 'n8',
+        'dl_freq_low': 925.0,
+        'dl_earfcn_offset': 3450,
+        'dl_earfcn_high': 3799,
+        'ul_freq_low': 880.0,
+        'ul_earfcn_offset': 21450,
+        'ul_earfcn_high': 21799,
+    },
+    12: {
+        'nr_band': 'n12',
+        'dl_freq_low': 729.0,
+        'dl_earfcn_offset': 5010,
+        'dl_earfcn_high': 5179,
+        'ul_freq_low': 699.0,
+        'ul_earfcn_offset': 23010,
+        'ul_earfcn_high': 23179,
+    },
+}
+
+# 3GPP TS 36.101 Table 5.6-1: transmission bandwidth N_RB per LTE channel bandwidth (MHz)
+LTE_BANDWIDTH_RB = {1.4: 6, 3: 15, 5: 25, 10: 50, 15: 75, 20: 100}
+
 # GSCN (Global Synchronization Channel Number) ranges
 # 3GPP TS 38.104 Table 5.4.3.1-1
 GSCN_RANGES = {
@@ -192,6 +373,71 @@ def get_band_info(band: str) -> Dict[str, Any]:
     return NR_BANDS[band].copy()
 
 
+# Synchronization raster, 3GPP TS 38.104 Table 5.4.3.1-1 (frequencies in kHz)
+# Below 3 GHz: SS_REF = N × 1200 kHz + M × 50 kHz, GSCN = 3N + (M - 3) / 2, M in {1, 3, 5}
+# Above 3 GHz: SS_REF = freq_low + (GSCN - gscn_low) × step
+SYNC_RASTER_RANGES = [
+    {'gscn_low': 2, 'gscn_high': 7498, 'freq_low_khz': 1250, 'step_khz': None},
+    {'gscn_low': 7499, 'gscn_high': 22255, 'freq_low_khz': 3000000, 'step_khz': 1440},
+    {'gscn_low': 22256, 'gscn_high': 26639, 'freq_low_khz': 24250080, 'step_khz': 17280},
+]
+
+
+def gscn_to_frequency_khz(gscn: Any) -> np.ndarray:
+    """
+    Convert GSCN(s) to SS_REF frequency in kHz
+    Based on 3GPP TS 38.104 Section 5.4.3.1
+    
+    Args:
+        gscn: GSCN value(s)
+        
+    Returns:
+        int64 array of SS_REF frequencies in kHz
+        
+    Raises:
+        ValueError: If any GSCN is outside the synchronization raster
+    """
+    gscn = np.asarray(gscn, dtype=np.int64)
+    low, mid, high = SYNC_RASTER_RANGES
+    outside = (gscn < low['gscn_low']) | (gscn > high['gscn_high'])
+    if outside.any():
+        raise ValueError(f"GSCN {gscn[outside].ravel()[0]} outside the synchronization raster")
+    
+    n = (gscn + 1) // 3
+    m = 2 * (gscn - 3 * n) + 3
+    return np.select(
+        [gscn < mid['gscn_low'], gscn < high['gscn_low']],
+        [1200 * n + 50 * m, mid['freq_low_khz'] + mid['step_khz'] * (gscn - mid['gscn_low'])],
+        high['freq_low_khz'] + high['step_khz'] * (gscn - high['gscn_low'])
+    )
+
+
+def frequency_khz_to_gscn(frequency_khz: Any) -> np.ndarray:
+    """
+    Convert SS_REF frequency(ies) in kHz to GSCN
+    
+    Args:
+        frequency_khz: Frequency value(s) in kHz
+        
+    Returns:
+        int64 array of GSCNs, -1 where the frequency is not on the synchronization raster
+    """
+    freq = np.asarray(frequency_khz, dtype=np.int64)
+    low, mid, high = SYNC_RASTER_RANGES
+    n, remainder = np.divmod(freq, 1200)
+    mid_steps, mid_remainder = np.divmod(freq - mid['freq_low_khz'], mid['step_khz'])
+    high_steps, high_remainder = np.divmod(freq - high['freq_low_khz'], high['step_khz'])
+    
+    gscn = np.select(
+        [freq < mid['freq_low_khz'], freq < high['freq_low_khz']],
+        [np.where(np.isin(remainder, (50, 150, 250)), 3 * n + (remainder // 50 - 3) // 2, -1),
+         np.where(mid_remainder == 0, mid['gscn_low'] + mid_steps, -1)],
+        np.where(high_remainder == 0, high['gscn_low'] + high_steps, -1)
+    )
+    on_raster = (gscn >= low['gscn_low']) & (gscn <= high['gscn_high'])
+    return np.where(on_raster, gscn, -1)
+
+
 def get_gscn_range(frequency_range: str) -> Dict[str, Any]:
     """
     Get GSCN range information
@@ -272,6 +518,51 @@ def get_max_rb(scs_khz: int, bandwidth_mhz: int) -> int:
     return MAX_RB_TABLE[scs_khz][bandwidth_mhz]
 
 
+# Minimum guard band in kHz per SCS and channel bandwidth
+# 3GPP TS 38.101-1 Table 5.3.3-1 (FR1) and TS 38.101-2 Table 5.3.3-1 (FR2, 120 kHz),
+# for the combinations listed in MAX_RB_TABLE
+MIN_GUARD_BAND_TABLE = {
+    15: {
+        5: 242.5, 10: 312.5, 15: 382.5, 20: 452.5, 25: 522.5, 30: 592.5, 40: 552.5, 50: 692.5
+    },
+    30: {
+        5: 505, 10: 665, 15: 645, 20: 805, 25: 785, 30: 945, 40: 905, 50: 1045,
+        60: 825, 70: 965, 80: 925, 90: 885, 100: 845
+    },
+    60: {
+        10: 1010, 15: 990, 20: 1330, 25: 1310, 30: 1290, 40: 1610, 50: 1570, 60: 1530,
+        70: 1490, 80: 1450, 90: 1410, 100: 1370
+    },
+    120: {
+        50: 1900, 100: 2420, 200: 4900, 400: 9860
+    }
+}
+
+
+def get_min_guard_band(scs_khz: int, bandwidth_mhz: int) -> float:
+    """
+    Get the minimum guard band for given SCS and bandwidth
+    Based on 3GPP TS 38.101-1 Table 5.3.3-1
+    
+    Args:
+        scs_khz: Subcarrier spacing in kHz
+        bandwidth_mhz: Channel bandwidth in MHz
+        
+    Returns:
+        Minimum guard band in kHz
+        
+    Raises:
+        ValueError: If invalid SCS or bandwidth combination
+    """
+    if scs_khz not in MIN_GUARD_BAND_TABLE:
+        raise ValueError(f"Unsupported SCS: {scs_khz} kHz")
+    
+    if bandwidth_mhz not in MIN_GUARD_BAND_TABLE[scs_khz]:
+        raise ValueError(f"Unsupported bandwidth {bandwidth_mhz} MHz for SCS {scs_khz} kHz")
+    
+    return float(MIN_GUARD_BAND_TABLE[scs_khz][bandwidth_mhz])
+
+
 def is_valid_bandwidth(band: str, bandwidth_mhz: int) -> bool:
     """
     Check if bandwidth is valid for given band
@@ -286,4 +577,295 @@ def is_valid_bandwidth(band: str, bandwidth_mhz: int) -> bool:
     if band not in NR_BANDS:
         return False
     
-    return bandwidth_mhz in NR_BANDS[band]['supported_bandwidths']
\ No newline at end of file
+    return bandwidth_mhz in NR_BANDS[band]['supported_bandwidths']
+
+
+# CORESET#0 configurations for controlResourceSetZero indexes 0-15
+# 3GPP TS 38.213 Tables 13-1 to 13-4 (FR1, minimum channel bandwidth 5/10 MHz)
+# Keyed by (SSB SCS, PDCCH SCS) in kHz; entries are
+# (multiplexing pattern, N_RB of CORESET#0, number of symbols, offset in RBs), None if reserved
+CORESET_ZERO_TABLE = {
+    (15, 15): [
+        (1, 24, 2, 0), (1, 24, 2, 2), (1, 24, 2, 4), (1, 24, 3, 0),
+        (1, 24, 3, 2), (1, 24, 3, 4), (1, 48, 1, 12), (1, 48, 1, 16),
+        (1, 48, 2, 12), (1, 48, 2, 16), (1, 48, 3, 12), (1, 48, 3, 16),
+        (1, 96, 1, 38), (1, 96, 2, 38), (1, 96, 3, 38), None,
+    ],
+    (15, 30): [
+        (1, 24, 2, 5), (1, 24, 2, 6), (1, 24, 2, 7), (1, 24, 2, 8),
+        (1, 24, 3, 5), (1, 24, 3, 6), (1, 24, 3, 7), (1, 24, 3, 8),
+        (1, 48, 1, 18), (1, 48, 1, 20), (1, 48, 2, 18), (1, 48, 2, 20),
+        (1, 48, 3, 18), (1, 48, 3, 20), None, None,
+    ],
+    (30, 15): [
+        (1, 48, 1, 2), (1, 48, 1, 6), (1, 48, 2, 2), (1, 48, 2, 6),
+        (1, 48, 3, 2), (1, 48, 3, 6), (1, 96, 1, 28), (1, 96, 2, 28),
+        None, None, None, None, None, None, None, None,
+    ],
+    (30, 30): [
+        (1, 24, 2, 0), (1, 24, 2, 1), (1, 24, 2, 2), (1, 24, 2, 3),
+        (1, 24, 2, 4), (1, 24, 3, 0), (1, 24, 3, 1), (1, 24, 3, 2),
+        (1, 24, 3, 3), (1, 24, 3, 4), (1, 48, 1, 12), (1, 48, 1, 14),
+        (1, 48, 1, 16), (1, 48, 2, 12), (1, 48, 2, 14), (1, 48, 2, 16),
+    ],
+}
+
+
+def get_coreset_zero(ssb_scs_khz: int, pdcch_scs_khz: int, coreset_zero: int) -> Dict[str, int]:
+    """
+    Get the CORESET#0 configuration for a controlResourceSetZero index
+    Based on 3GPP TS 38.213 Section 13
+    
+    Args:
+        ssb_scs_khz: SSB subcarrier spacing in kHz
+        pdcch_scs_khz: PDCCH (subCarrierSpacingCommon) subcarrier spacing in kHz
+        coreset_zero: controlResourceSetZero index (0-15)
+        
+    Returns:
+        Dictionary with 'pattern', 'n_rb', 'symbols' and 'offset_rb'
+        
+    Raises:
+        ValueError: If there is no table for the SCS pair or the index is reserved
+    """
+    if (ssb_scs_khz, pdcch_scs_khz) not in CORESET_ZERO_TABLE:
+        raise ValueError(f"No CORESET#0 table for SSB SCS {ssb_scs_khz} kHz "
+                         f"and PDCCH SCS {pdcch_scs_khz} kHz")
+    
+    table = CORESET_ZERO_TABLE[(ssb_scs_khz, pdcch_scs_khz)]
+    if not 0 <= coreset_zero < len(table) or table[coreset_zero] is None:
+        raise ValueError(f"Invalid controlResourceSetZero {coreset_zero} for SSB SCS "
+                         f"{ssb_scs_khz} kHz and PDCCH SCS {pdcch_scs_khz} kHz")
+    
+    pattern, n_rb, symbols, offset_rb = table[coreset_zero]
+    return {'pattern': pattern, 'n_rb': n_rb, 'symbols': symbols, 'offset_rb': offset_rb}
+
+
+# Validation codes for Point A inputs, in the order the checks are applied
+VALID = 0
+INVALID_BAND = 1            # Band not in NR_BANDS
+INVALID_SCS = 2             # SCS not supported by the band
+INVALID_BANDWIDTH = 3       # Bandwidth not supported by the band
+UNSUPPORTED_BANDWIDTH = 4   # Band-valid SCS/bandwidth combination missing from MAX_RB_TABLE
+INVALID_ARFCN = 5           # ARFCN outside the global frequency raster
+INVALID_OFFSET_TO_CARRIER = 6  # offsetToCarrier outside 0..MAX_OFFSET_TO_CARRIER_RB
+
+# Largest offsetToCarrier in RBs (3GPP TS 38.331 SCS-SpecificCarrier)
+MAX_OFFSET_TO_CARRIER_RB = 2199
+
+
+def describe_invalid(code: int, band: str, scs_khz: int, bandwidth_mhz: int, arfcn: int,
+                     offset_to_carrier_rb: int = 0) -> str:
+    """
+    Get the error message for a validation code
+    
+    Messages are the same as the ones raised by the scalar calculations.
+    
+    Args:
+        code: Validation code (INVALID_BAND, INVALID_SCS, ...)
+        band: Band identifier
+        scs_khz: Subcarrier spacing in kHz
+        bandwidth_mhz: Channel bandwidth in MHz
+        arfcn: ARFCN value
+        
+    Returns:
+        Error message
+        
+    Raises:
+        ValueError: If code is not a known validation code
+    """
+    messages = {
+        VALID: "Valid",
+        INVALID_BAND: f"Unknown band: {band}",
+        INVALID_SCS: f"Invalid SCS {scs_khz} kHz for band {band}",
+        INVALID_BANDWIDTH: f"Invalid bandwidth {bandwidth_mhz} MHz for band {band}",
+        UNSUPPORTED_BANDWIDTH: f"Unsupported bandwidth {bandwidth_mhz} MHz for SCS {scs_khz} kHz",
+        INVALID_ARFCN: f"ARFCN {arfcn} outside the global frequency raster",
+        INVALID_OFFSET_TO_CARRIER: f"Invalid offsetToCarrier {offset_to_carrier_rb} RB",
+    }
+    if code not in messages:
+        raise ValueError(f"Unknown validation code: {code}")
+    
+    return messages[code]
+
+
+# Axes of the validity matrix: bands in NR_BANDS order, sorted SCS and bandwidth values
+N_RB_MATRIX_BANDS = tuple(NR_BANDS)
+N_RB_MATRIX_SCS = tuple(sorted(MAX_RB_TABLE))
+N_RB_MATRIX_BANDWIDTHS = tuple(sorted({bw for band in NR_BANDS.values()
+                                       for bw in band['supported_bandwidths']} |
+                                      {bw for rbs in MAX_RB_TABLE.values() for bw in rbs}))
+
+_BAND_AXIS = {band: i for i, band in enumerate(N_RB_MATRIX_BANDS)}
+_SCS_AXIS = {scs: i for i, scs in enumerate(N_RB_MATRIX_SCS)}
+_BANDWIDTH_AXIS = {bw: i for i, bw in enumerate(N_RB_MATRIX_BANDWIDTHS)}
+
+# Dense band x SCS x bandwidth -> N_RB matrix; 0 marks an invalid combination
+# (SCS or bandwidth not supported by the band, or missing from MAX_RB_TABLE)
+N_RB_MATRIX = np.zeros((len(N_RB_MATRIX_BANDS), len(N_RB_MATRIX_SCS),
+                        len(N_RB_MATRIX_BANDWIDTHS)), dtype=np.int32)
+for _band in NR_BANDS.values():
+    for _scs in _band['supported_scs']:
+        for _bw in _band['supported_bandwidths']:
+            N_RB_MATRIX[_BAND_AXIS[_band['name']], _SCS_AXIS[_scs], _BANDWIDTH_AXIS[_bw]] = \
+                MAX_RB_TABLE[_scs].get(_bw, 0)
+N_RB_MATRIX.flags.writeable = False
+
+
+def lookup_n_rb(band: str, scs_khz: int, bandwidth_mhz: int) -> int:
+    """
+    Get N_RB of a band/SCS/bandwidth combination with one read of N_RB_MATRIX
+    
+    Args:
+        band: Band identifier
+        scs_khz: Subcarrier spacing in kHz
+        bandwidth_mhz: Channel bandwidth in MHz
+        
+    Returns:
+        Maximum RB number, or 0 if the combination is invalid
+    """
+    try:
+        return int(N_RB_MATRIX[_BAND_AXIS[band], _SCS_AXIS[scs_khz], _BANDWIDTH_AXIS[bandwidth_mhz]])
+    except KeyError:
+        return 0
+
+
+def classify_combination(band: str, scs_khz: int, bandwidth_mhz: int) -> int:
+    """
+    Get the validation code of a band/SCS/bandwidth combination
+    
+    Args:
+        band: Band identifier
+        scs_khz: Subcarrier spacing in kHz
+        bandwidth_mhz: Channel bandwidth in MHz
+        
+    Returns:
+        VALID, INVALID_BAND, INVALID_SCS, INVALID_BANDWIDTH or UNSUPPORTED_BANDWIDTH
+    """
+    if lookup_n_rb(band, scs_khz, bandwidth_mhz):
+        return VALID
+    if band not in NR_BANDS:
+        return INVALID_BAND
+    if scs_khz not in NR_BANDS[band]['supported_scs']:
+        return INVALID_SCS
+    if bandwidth_mhz not in NR_BANDS[band]['supported_bandwidths']:
+        return INVALID_BANDWIDTH
+    return UNSUPPORTED_BANDWIDTH
+
+
+def explain_combination(band: str, scs_khz: int, bandwidth_mhz: int) -> Dict[str, Any]:
+    """
+    Explain whether a band/SCS/bandwidth combination is valid, and why not
+    
+    Args:
+        band: Band identifier
+        scs_khz: Subcarrier spacing in kHz
+        bandwidth_mhz: Channel bandwidth in MHz
+        
+    Returns:
+        Dictionary with 'code' (see classify_combination), 'n_rb' (0 if invalid),
+        'reason' (scalar error message, None if valid), 'valid_scs' (SCS values
+        with at least one valid bandwidth in the band) and 'valid_bandwidths'
+        (valid bandwidths of the band at this SCS)
+    """
+    code = classify_combination(band, scs_khz, bandwidth_mhz)
+    valid_scs = []
+    valid_bandwidths = []
+    if band in _BAND_AXIS:
+        rows = N_RB_MATRIX[_BAND_AXIS[band]]
+        valid_scs = [scs for scs, row in zip(N_RB_MATRIX_SCS, rows) if row.any()]
+        if scs_khz in _SCS_AXIS:
+            valid_bandwidths = [bw for bw, n_rb in zip(N_RB_MATRIX_BANDWIDTHS,
+                                                       rows[_SCS_AXIS[scs_khz]]) if n_rb]
+    
+    return {
+        'code': code,
+        'n_rb': lookup_n_rb(band, scs_khz, bandwidth_mhz),
+        'reason': None if code == VALID else describe_invalid(code, band, scs_khz, bandwidth_mhz, 0),
+        'valid_scs': valid_scs,
+        'valid_bandwidths': valid_bandwidths,
+    }
+
+
+def tables_version() -> bytes:
+    """
+    Get the version digest of the current band data
+
+    The digest covers every source of compile_band_tables, so tables
+    compiled from different band data (in shared memory) are detected without
+    compiling anything.
+
+    Returns:
+        32-byte SHA-256 digest
+    """
+    source = json.dumps([NR_BANDS, MAX_RB_TABLE, MIN_GUARD_BAND_TABLE,
+                         sorted(CORESET_ZERO_TABLE.items()), GLOBAL_RASTER_RANGES],
+                        sort_keys=True, default=str)
+    return hashlib.sha256(source.encode('utf-8')).digest()
+
+
+def compile_band_tables() -> Dict[str, np.ndarray]:
+    """
+    Flatten NR_BANDS, MAX_RB_TABLE and GLOBAL_RASTER_RANGES into numpy arrays
+    
+    Bands are indexed in NR_BANDS order. Supported SCS/bandwidth lists become
+    boolean masks over the sorted 'scs_values'/'bandwidth_values' axes
+    ('band_ssb_scs_mask' holds the SSB SCS lists over 'scs_values'), and
+    'n_rb' is a copy of N_RB_MATRIX over the same axes and 'min_guard_band_hz'
+    holds MIN_GUARD_BAND_TABLE in Hz over SCS x bandwidth (-1 where not
+    defined). CORESET_ZERO_TABLE
+    becomes an (SCS pair x index x [N_RB, symbols, offset]) array with N_RB 0
+    for reserved indexes.
+    
+    Returns:
+        Dictionary of table name to numpy array
+    """
+    bands = list(NR_BANDS.values())
+    scs_values = list(N_RB_MATRIX_SCS)
+    bandwidth_values = list(N_RB_MATRIX_BANDWIDTHS)
+    
+    coreset_pairs = sorted(CORESET_ZERO_TABLE)
+    coreset_zero = np.zeros((len(coreset_pairs), 16, 3), dtype=np.int32)
+    for i, pair in enumerate(coreset_pairs):
+        for index, entry in enumerate(CORESET_ZERO_TABLE[pair]):
+            if entry is not None:
+                coreset_zero[i, index] = entry[1:]
+    
+    return {
+        'band_names': np.array([band['name'] for band in bands]),
+        'freq_ref_offset': np.array([band['freq_ref_offset'] for band in bands], dtype=np.float64),
+        'delta_f_global': np.array([band['delta_f_global'] for band in bands], dtype=np.float64),
+        'arfcn_offset': np.array([band['arfcn_offset'] for band in bands], dtype=np.int64),
+        'ul_arfcn_offset': np.array([band.get('ul_arfcn_offset', band['arfcn_offset'])
+                                     for band in bands], dtype=np.int64),
+        'scs_values': np.array(scs_values, dtype=np.int64),
+        'bandwidth_values': np.array(bandwidth_values, dtype=np.int64),
+        'band_scs_mask': np.array([[scs in band['supported_scs'] for scs in scs_values]
+                                   for band in bands], dtype=bool),
+        'band_bandwidth_mask': np.array([[bw in band['supported_bandwidths']
+                                          for bw in bandwidth_values]
+                                         for band in bands], dtype=bool),
+        'band_ssb_scs_mask': np.array([[scs in band['ssb_scs'] for scs in scs_values]
+                                       for band in bands], dtype=bool),
+        'n_rb': N_RB_MATRIX.copy(),
+        'min_guard_band_hz': np.array([[round(MIN_GUARD_BAND_TABLE[scs][bw] * 1000)
+                                        if bw in MIN_GUARD_BAND_TABLE.get(scs, {}) else -1
+                                        for bw in bandwidth_values] for scs in scs_values],
+                                      dtype=np.int64),
+        'dl_freq_low_khz': np.array([round(band['dl_freq_low'] * 1000) for band in bands],
+                                    dtype=np.int64),
+        'dl_freq_high_khz': np.array([round(band['dl_freq_high'] * 1000) for band in bands],
+                                     dtype=np.int64),
+        'band_fr2': np.array([band['frequency_range'] == 'FR2' for band in bands], dtype=bool),
+        'raster_arfcn_low': np.array([r['arfcn_low'] for r in GLOBAL_RASTER_RANGES],
+                                     dtype=np.int64),
+        'raster_arfcn_high': np.array([r['arfcn_high'] for r in GLOBAL_RASTER_RANGES],
+                                      dtype=np.int64),
+        'raster_freq_ref_offset': np.array([r['freq_ref_offset'] for r in GLOBAL_RASTER_RANGES],
+                                           dtype=np.float64),
+        'raster_delta_f_global': np.array([r['delta_f_global'] for r in GLOBAL_RASTER_RANGES],
+                                          dtype=np.float64),
+        'raster_arfcn_offset': np.array([r['arfcn_offset'] for r in GLOBAL_RASTER_RANGES],
+                                        dtype=np.int64),
+        'coreset_zero_scs_pairs': np.array(coreset_pairs, dtype=np.int64).reshape(-1, 2),
+        'coreset_zero': coreset_zero,
+    }
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+Band-scan simulator for UE cell search modelling
+Walks the synchronization raster (GSCN) positions of each band in scan order
+and checks them against a set of deployed SSBs
+"""
+
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+from .band_data import NR_BANDS, SYNC_RASTER_RANGES, get_band_info, gscn_to_frequency_khz
+from .frequency_calculator import FrequencyCalculator, ArrayLike, BandLike
+
+# Time spent on one GSCN position: one 20 ms SSB burst period (initial access default)
+DEFAULT_DWELL_MS = 20.0
+
+SCAN_ORDERS = ('ascending', 'descending')
+
+# Every SS_REF frequency of the synchronization raster, ascending
+_SYNC_GSCN = np.arange(SYNC_RASTER_RANGES[0]['gscn_low'], SYNC_RASTER_RANGES[-1]['gscn_high'] + 1)
+_SYNC_FREQ_KHZ = gscn_to_frequency_khz(_SYNC_GSCN)
+
+
+def band_scan_positions(band: str, ssb_scs_khz: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Get the synchronization raster positions a UE searches in a band
+
+    A position qualifies when the whole SS/PBCH block (240 subcarriers around
+    SS_REF) lies inside the band's downlink range.
+
+    Args:
+        band: 5G NR band (e.g., 'n77')
+        ssb_scs_khz: SSB subcarrier spacing in kHz (default: lowest SSB SCS of the band)
+
+    Returns:
+        Dictionary with ascending 'gscn' and 'frequency_khz' (SS_REF) arrays
+
+    Raises:
+        ValueError: If invalid band or SSB SCS
+    """
+    band_info = get_band_info(band)
+    if ssb_scs_khz is None:
+        ssb_scs_khz = min(band_info['ssb_scs'])
+    elif ssb_scs_khz not in band_info['ssb_scs']:
+        raise ValueError(f"Invalid SSB SCS {ssb_scs_khz} kHz for band {band}")
+
+    half_width_khz = 120 * ssb_scs_khz
+    low = np.searchsorted(_SYNC_FREQ_KHZ, round(band_info['dl_freq_low'] * 1000) + half_width_khz)
+    high = np.searchsorted(_SYNC_FREQ_KHZ, round(band_info['dl_freq_high'] * 1000) - half_width_khz,
+                           side='right')
+    return {'gscn': _SYNC_GSCN[low:high], 'frequency_khz': _SYNC_FREQ_KHZ[low:high]}
+
+
+def simulate_band_scan(calc: FrequencyCalculator, deployed_ssb_arfcn: ArrayLike,
+                       deployed_bands: Optional[BandLike] = None,
+                       bands: Optional[Sequence[str]] = None, order: str = 'ascending',
+                       dwell_ms: float = DEFAULT_DWELL_MS) -> Iterator[Dict[str, Any]]:
+    """
+    Simulate a UE sweeping the synchronization raster band by band
+
+    Bands are scanned in the given order, each with all of its SSB SCS
+    options. Scan positions are matched against the deployed SSB frequencies
+    by sorted-array intersection, so a whole market of carriers is checked in
+    one vectorized pass per band.
+
+    Args:
+        calc: Calculator used to convert the deployed SSB ARFCNs
+        deployed_ssb_arfcn: SSB ARFCN(s) of the deployed carriers
+        deployed_bands: Band(s) of the deployed carriers, for bands with their
+                        own ARFCN numbering (default: global raster)
+        bands: Bands to scan, in scan order (default: all bands)
+        order: GSCN order within a band, 'ascending' or 'descending'
+        dwell_ms: Time spent on each GSCN position in ms
+
+    Returns:
+        Iterator over one dictionary per (band, SSB SCS) with 'band',
+        'ssb_scs_khz', 'gscn' (positions in scan order), 'hit' (bool array),
+        'hit_gscn', 'scan_start' (positions scanned before this band),
+        'first_hit_step' (overall step of the first hit, -1 if none),
+        'time_to_first_hit_ms' (None if no hit) and 'scan_time_ms'
+
+    Raises:
+        ValueError: If invalid band, order or deployed ARFCN
+    """
+    if order not in SCAN_ORDERS:
+        raise ValueError(f"Invalid scan order: {order}")
+
+    deployed_mhz = calc.arfcn_to_frequency_batch(deployed_bands, deployed_ssb_arfcn)
+    deployed_khz = np.unique(np.rint(np.asarray(deployed_mhz).ravel() * 1000).astype(np.int64))
+
+    scan_start = 0
+    for band in (list(NR_BANDS) if bands is None else bands):
+        for ssb_scs_khz in sorted(get_band_info(band)['ssb_scs']):
+            positions = band_scan_positions(band, ssb_scs_khz)
+            gscn, frequency_khz = positions['gscn'], positions['frequency_khz']
+            if order == 'descending':
+                gscn, frequency_khz = gscn[::-1], frequency_khz[::-1]
+
+            index = np.searchsorted(deployed_khz, frequency_khz).clip(0, max(len(deployed_khz) - 1, 0))
+            hit = deployed_khz[index] == frequency_khz if len(deployed_khz) else \
+                np.zeros(len(gscn), dtype=bool)
+            hits = np.flatnonzero(hit)
+            first_hit_step = scan_start + int(hits[0]) if len(hits) else -1
+
+            yield {
+                'band': band,
+                'ssb_scs_khz': ssb_scs_khz,
+                'gscn': gscn,
+                'hit': hit,
+                'hit_gscn': gscn[hits],
+                'scan_start': scan_start,
+                'first_hit_step': first_hit_step,
+                'time_to_first_hit_ms': None if first_hit_step < 0 else
+                (first_hit_step + 1) * dwell_ms,
+                'scan_time_ms': len(gscn) * dwell_ms,
+            }
+            scan_start += len(gscn)
@@ -0,0 +1,265 @@
+"""
+Checkpointed batch jobs for inputs larger than memory
+Streams a carrier CSV through the calculator in numbered chunks, writes every
+chunk's output atomically and records progress in a manifest, so an
+interrupted job can resume where it stopped
+"""
+
+import csv
+import fnmatch
+import hashlib
+import itertools
+import json
+import os
+import shutil
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .band_data import VALID
+from .frequency_calculator import FrequencyCalculator
+
+# Input CSV columns ('offset_to_carrier_rb' is optional and defaults to 0)
+INPUT_COLUMNS = ('band', 'scs_khz', 'bandwidth_mhz', 'center_arfcn')
+
+# Output CSV columns; status is the validation code (band_data.VALID, INVALID_BAND, ...)
+OUTPUT_COLUMNS = ('band', 'scs_khz', 'bandwidth_mhz', 'center_arfcn', 'offset_to_carrier_rb',
+                  'point_a_arfcn', 'point_a_freq_mhz', 'status')
+
+MANIFEST_FORMAT = 'nr-batch-job/1'
+
+# Files a job writes into its work directory (chunk outputs, manifest, partial writes)
+JOB_FILE_PATTERNS = ('chunk_*.csv', 'chunk_*.csv.tmp', 'manifest.json', 'manifest.json.tmp')
+DEFAULT_CHUNK_ROWS = 100000
+
+
+def run_batch_job(calc: FrequencyCalculator, input_path: str, output_path: str,
+                  chunk_rows: int = DEFAULT_CHUNK_ROWS, resume: bool = False,
+                  work_dir: Optional[str] = None,
+                  progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, int]:
+    """
+    Calculate Point A for every row of a carrier CSV, chunk by chunk
+
+    Chunk outputs and the manifest live in work_dir until all chunks are
+    done; they are then concatenated into output_path and removed, together
+    with work_dir if the job created it. Only files matching
+    JOB_FILE_PATTERNS are ever deleted, and a fresh job refuses an existing
+    work_dir that holds other files but no job manifest.
+
+    Every chunk is recorded with the SHA-256 of its input bytes. On resume,
+    completed chunks are re-hashed (not recomputed) and skipped, and a chunk
+    whose input changed stops the job instead of being merged with stale
+    output. Invalid rows do not stop the job; they get a non-zero status and
+    Point A -1.
+
+    Args:
+        calc: Calculator used for the chunks
+        input_path: CSV with a header row containing INPUT_COLUMNS
+        output_path: CSV to write (OUTPUT_COLUMNS)
+        chunk_rows: Input rows per chunk
+        resume: Continue the job recorded in work_dir instead of starting over
+        work_dir: Directory for chunk outputs and the manifest
+                  (default: output_path + '.parts')
+        progress: Called with the manifest entry of every finished or skipped chunk
+
+    Returns:
+        Dictionary with 'chunks', 'processed_chunks', 'skipped_chunks', 'rows'
+        and 'invalid_rows'
+
+    Raises:
+        ValueError: If columns are missing, a value is malformed, the input
+                    changed since the resumed job processed it, or work_dir
+                    holds files of something other than a job
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"Invalid chunk size {chunk_rows}")
+    work_dir = work_dir or f"{output_path}.parts"
+    manifest_path = os.path.join(work_dir, 'manifest.json')
+
+    with open(input_path, 'rb') as f:
+        header = f.readline()
+        columns = header.decode('utf-8').strip().split(',')
+        missing = [name for name in INPUT_COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(f"Missing input columns: {', '.join(missing)}")
+
+        manifest = _load_manifest(manifest_path) if resume else None
+        if manifest is not None:
+            if manifest['chunk_rows'] != chunk_rows or manifest['header'] != columns:
+                raise ValueError(f"Job in {work_dir} was started with a different chunk size "
+                                 f"or input header")
+        else:
+            manifest = {'format': MANIFEST_FORMAT, 'input': os.path.abspath(input_path),
+                        'header': columns, 'chunk_rows': chunk_rows, 'chunks': {},
+                        'created_dir': _prepare_work_dir(work_dir)}
+            _write_json(manifest_path, manifest)
+
+        summary = {'chunks': 0, 'processed_chunks': 0, 'skipped_chunks': 0, 'rows': 0,
+                   'invalid_rows': 0}
+        for index in itertools.count():
+            byte_offset = f.tell()
+            data = b''.join(itertools.islice(f, chunk_rows))
+            if not data:
+                break
+            digest = hashlib.sha256(data).hexdigest()
+            entry = manifest['chunks'].get(str(index))
+
+            if entry is not None and os.path.exists(os.path.join(work_dir, entry['output'])):
+                if entry['input_sha256'] != digest or entry['byte_offset'] != byte_offset:
+                    raise ValueError(f"Input chunk {index} of {input_path} changed since it was "
+                                     f"processed; rerun without resume")
+                summary['skipped_chunks'] += 1
+            else:
+                entry = _process_chunk(calc, columns, data, index, work_dir)
+                entry.update(byte_offset=byte_offset, input_sha256=digest)
+                manifest['chunks'][str(index)] = entry
+                _write_json(manifest_path, manifest)
+                summary['processed_chunks'] += 1
+
+            summary['chunks'] += 1
+            summary['rows'] += entry['rows']
+            summary['invalid_rows'] += entry['invalid_rows']
+            if progress is not None:
+                progress(entry)
+
+    if len(manifest['chunks']) > summary['chunks']:
+        raise ValueError(f"Input {input_path} is shorter than when the job was started; "
+                         f"rerun without resume")
+
+    _atomic_write(output_path, lambda out: _merge_chunks(out, manifest, work_dir))
+    _remove_job_files(work_dir)
+    if manifest.get('created_dir'):
+        try:
+            os.rmdir(work_dir)
+        except OSError:
+            pass  # Not empty: something else put files there meanwhile
+    return summary
+
+
+def parse_carrier_chunk(columns: List[str], data: bytes, index: int = 0) -> Dict[str, np.ndarray]:
+    """
+    Parse CSV rows (without header) of a carrier file into columns
+
+    Args:
+        columns: Header columns of the file (must contain INPUT_COLUMNS)
+        data: Raw CSV rows
+        index: Chunk number, for error messages
+
+    Returns:
+        Dictionary of INPUT_COLUMNS and 'offset_to_carrier_rb' arrays
+        (offsets default to 0 when the file has no such column), plus
+        'site_id' when the file has one
+
+    Raises:
+        ValueError: If a value is malformed
+    """
+    names = [name for name in INPUT_COLUMNS + ('offset_to_carrier_rb', 'site_id')
+             if name in columns]
+    dtype = [(name, 'U8' if name == 'band' else np.int64) for name in names]
+    try:
+        table = np.loadtxt(data.decode('utf-8').splitlines(), delimiter=',', dtype=dtype,
+                           usecols=[columns.index(name) for name in names], ndmin=1)
+    except ValueError as error:
+        raise ValueError(f"Malformed input in chunk {index}: {error}") from error
+    chunk = {name: table[name] for name in names}
+    if 'offset_to_carrier_rb' not in chunk:
+        chunk['offset_to_carrier_rb'] = np.zeros(len(table), dtype=np.int64)
+    return chunk
+
+
+def _process_chunk(calc: FrequencyCalculator, columns: List[str], data: bytes, index: int,
+                   work_dir: str) -> Dict[str, Any]:
+    """Calculate one input chunk and write its output file atomically"""
+    chunk = parse_carrier_chunk(columns, data, index)
+    band, scs, bw, center, offset = (chunk[name] for name in INPUT_COLUMNS +
+                                     ('offset_to_carrier_rb',))
+
+    status = calc.classify_point_a_batch(band, scs, bw, center, offset)
+    valid = status == VALID
+    point_a = np.full(len(band), -1, dtype=np.int64)
+    freq = np.full(len(band), np.nan)
+    point_a[valid] = calc.calculate_point_a_arfcn_batch(band[valid], scs[valid], bw[valid],
+                                                        center[valid], offset[valid])
+    freq[valid] = calc.arfcn_to_frequency_batch(band[valid], point_a[valid])
+
+    name = f"chunk_{index:06d}.csv"
+    rows = zip(band.tolist(), scs.tolist(), bw.tolist(), center.tolist(), offset.tolist(),
+               point_a.tolist(), np.round(freq, 3).tolist(), status.tolist())
+    _atomic_write(os.path.join(work_dir, name), lambda out: csv.writer(out).writerows(rows))
+    return {'index': index, 'rows': len(band), 'invalid_rows': int((~valid).sum()),
+            'output': name}
+
+
+def _merge_chunks(out, manifest: Dict[str, Any], work_dir: str) -> None:
+    """Write the output header and all chunk outputs in chunk order"""
+    csv.writer(out).writerow(OUTPUT_COLUMNS)
+    for index in range(len(manifest['chunks'])):
+        with open(os.path.join(work_dir, manifest['chunks'][str(index)]['output']),
+                  newline='') as chunk:
+            shutil.copyfileobj(chunk, out)
+
+
+def _prepare_work_dir(work_dir: str) -> bool:
+    """
+    Get an empty work directory for a fresh job
+
+    Files left by an earlier job (recognized by its manifest) are removed;
+    anything else in an existing directory stops the job.
+
+    Returns:
+        True if the directory was created for this job (and is removed with it)
+
+    Raises:
+        ValueError: If work_dir exists and holds files but no job manifest
+    """
+    if not os.path.isdir(work_dir):
+        os.makedirs(work_dir)
+        return True
+
+    previous = _load_manifest(os.path.join(work_dir, 'manifest.json'))
+    if previous is None:
+        if os.listdir(work_dir):
+            raise ValueError(f"Work directory {work_dir} is not empty and holds no job "
+                             f"manifest; choose another work directory")
+        return False
+    _remove_job_files(work_dir)
+    return bool(previous.get('created_dir'))
+
+
+def _remove_job_files(work_dir: str) -> None:
+    """Delete the files a job writes (JOB_FILE_PATTERNS) from its work directory"""
+    for name in os.listdir(work_dir):
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in JOB_FILE_PATTERNS):
+            os.remove(os.path.join(work_dir, name))
+
+
+def _load_manifest(path: str) -> Optional[Dict[str, Any]]:
+    """Read a job manifest, None if there is no job to resume"""
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    if manifest.get('format') != MANIFEST_FORMAT:
+        raise ValueError(f"Unsupported job manifest {path}")
+    return manifest
+
+
+def _write_json(path: str, value: Any) -> None:
+    """Write a JSON file atomically"""
+    _atomic_write(path, lambda out: json.dump(value, out, indent=1))
+
+
+def _atomic_write(path: str, write: Callable[[Any], None]) -> None:
+    """Write a text file next to its target, sync it and rename it into place"""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', newline='') as out:
+            write(out)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,107 @@
+"""
+Channel edges and guard bands for emission-mask and coexistence checks
+Derives the channel edges, transmission bandwidth edges and the guard on each
+side of a carrier and compares them with the minimum guard band of
+TS 38.101-1 Table 5.3.3-1
+"""
+
+from typing import Any, Dict
+
+import numpy as np
+
+from .frequency_calculator import FrequencyCalculator, ArrayLike, BandLike
+
+
+def calculate_channel_edges(calc: FrequencyCalculator, band: str, scs_khz: int,
+                            bandwidth_mhz: int, center_arfcn: int,
+                            offset_to_carrier_rb: int = 0) -> Dict[str, Any]:
+    """
+    Calculate the channel edges and guard bands of one carrier
+
+    Args:
+        calc: Calculator used to place the carrier
+        band: 5G NR band (e.g., 'n77')
+        scs_khz: Subcarrier spacing in kHz
+        bandwidth_mhz: Channel bandwidth in MHz
+        center_arfcn: Center ARFCN of the channel
+        offset_to_carrier_rb: offsetToCarrier in RB units (default: 0)
+
+    Returns:
+        Dictionary of Python scalars (see calculate_channel_edges_batch)
+
+    Raises:
+        ValueError: If invalid parameters provided
+    """
+    edges = calculate_channel_edges_batch(calc, band, scs_khz, bandwidth_mhz, center_arfcn,
+                                          offset_to_carrier_rb)
+    return {name: values.item() for name, values in edges.items()}
+
+
+def calculate_channel_edges_batch(calc: FrequencyCalculator, bands: BandLike,
+                                  scs_khz: ArrayLike, bandwidth_mhz: ArrayLike,
+                                  center_arfcn: ArrayLike,
+                                  offset_to_carrier_rb: ArrayLike = 0) -> Dict[str, np.ndarray]:
+    """
+    Calculate the channel edges and guard bands of many carriers
+
+    The channel edges are the center frequency -/+ half the channel
+    bandwidth; the transmission bandwidth edges are the edges of the N_RB
+    resource blocks placed from Point A. The guard on each side is the gap
+    between the two, and guard_ok tells whether both sides keep the minimum
+    guard band. All positions are integer kHz internally.
+
+    Args:
+        calc: Calculator used to place the carriers
+        bands: Band(s), broadcast like FrequencyCalculator.calculate_point_a_arfcn_batch
+        scs_khz: Subcarrier spacing(s) in kHz
+        bandwidth_mhz: Channel bandwidth(s) in MHz
+        center_arfcn: Center ARFCN(s) of the channels
+        offset_to_carrier_rb: offsetToCarrier value(s) in RB units
+
+    Returns:
+        Dictionary of numpy arrays 'point_a_arfcn', 'point_a_freq_mhz',
+        'channel_low_freq_mhz', 'channel_high_freq_mhz', 'tx_low_freq_mhz',
+        'tx_high_freq_mhz', 'guard_low_khz', 'guard_high_khz',
+        'min_guard_khz' and 'guard_ok'
+
+    Raises:
+        ValueError: If any carrier is invalid (message of the first invalid row)
+    """
+    layout = calc.calculate_carrier_layout_batch(bands, scs_khz, bandwidth_mhz, center_arfcn,
+                                                 offset_to_carrier_rb)
+    shape = layout['point_a_arfcn'].shape
+    scs = np.broadcast_to(np.asarray(scs_khz, dtype=np.int64), shape)
+    bw = np.broadcast_to(np.asarray(bandwidth_mhz, dtype=np.int64), shape)
+
+    center_khz = _to_khz(calc.arfcn_to_frequency_batch(bands, np.broadcast_to(
+        np.asarray(center_arfcn, dtype=np.int64), shape)))
+    channel_low_khz = center_khz - bw * 500
+    channel_high_khz = center_khz + bw * 500
+    tx_low_khz = _to_khz(layout['carrier_start_freq_mhz'])
+    tx_high_khz = _to_khz(layout['carrier_end_freq_mhz'])
+
+    tables = calc.tables
+    scs_idx = np.searchsorted(tables['scs_values'], scs)
+    bw_idx = np.searchsorted(tables['bandwidth_values'], bw)
+    min_guard_hz = tables['min_guard_band_hz'][scs_idx, bw_idx]
+    guard_low_hz = (tx_low_khz - channel_low_khz) * 1000
+    guard_high_hz = (channel_high_khz - tx_high_khz) * 1000
+
+    return {
+        'point_a_arfcn': layout['point_a_arfcn'],
+        'point_a_freq_mhz': layout['point_a_freq_mhz'],
+        'channel_low_freq_mhz': channel_low_khz / 1000.0,
+        'channel_high_freq_mhz': channel_high_khz / 1000.0,
+        'tx_low_freq_mhz': layout['carrier_start_freq_mhz'],
+        'tx_high_freq_mhz': layout['carrier_end_freq_mhz'],
+        'guard_low_khz': guard_low_hz / 1000.0,
+        'guard_high_khz': guard_high_hz / 1000.0,
+        'min_guard_khz': min_guard_hz / 1000.0,
+        'guard_ok': (min_guard_hz >= 0) & (guard_low_hz >= min_guard_hz) &
+                    (guard_high_hz >= min_guard_hz),
+    }
+
+
+def _to_khz(freq_mhz: np.ndarray) -> np.ndarray:
+    """Convert exact kHz frequencies given in MHz back to integer kHz"""
+    return np.rint(np.asarray(freq_mhz) * 1000).astype(np.int64)
@@ -5,9 +5,12 @@ Based on 3GPP TS 38.104 Release 16
 """
 
 import argparse
+import json
 import sys
 from typing import Optional
 
+from .audit import audit_files
+from .batch_job import run_batch_job, DEFAULT_CHUNK_ROWS
 from .frequency_calculator import FrequencyCalculator
 
 
@@ -105,6 +108,44 @@ def show_band_info(calc: FrequencyCalculator, args) -> None:
         sys.exit(1)
 
 
+def audit_configs(args) -> None:
+    """Audit gNB configuration dumps"""
+    counts = {'ok': 0, 'mismatch': 0, 'error': 0}
+    
+    for result in audit_files(args.paths, workers=args.workers, use_processes=args.processes):
+        counts[result['status']] += 1
+        if result['status'] == 'ok' and not args.all:
+            continue
+        
+        if args.jsonl:
+            print(json.dumps(result), flush=True)
+        else:
+            print(f"{result['status'].upper()}: {result['file']} cell {result['cell_id']} "
+                  f"({result['band']}): {result['message'] or 'Point A OK'}", flush=True)
+    
+    print(f"Audited {sum(counts.values())} cells: {counts['ok']} OK, "
+          f"{counts['mismatch']} mismatches, {counts['error']} errors", file=sys.stderr)
+    if counts['mismatch'] or counts['error']:
+        sys.exit(1)
+
+
+def run_batch(calc: FrequencyCalculator, args) -> None:
+    """Run a checkpointed Point A batch job over a carrier CSV"""
+    def report(entry):
+        print(f"Chunk {entry['index']}: {entry['rows']} rows, {entry['invalid_rows']} invalid",
+              file=sys.stderr, flush=True)
+    
+    try:
+        summary = run_batch_job(calc, args.input, args.output, chunk_rows=args.chunk_rows,
+                                resume=args.resume, work_dir=args.work_dir, progress=report)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    print(f"Wrote {summary['rows']} rows ({summary['invalid_rows']} invalid) in "
+          f"{summary['chunks']} chunks, {summary['skipped_chunks']} resumed", file=sys.stderr)
+
+
 def main():
     """Main CLI function"""
     parser = argparse.ArgumentParser(
@@ -132,6 +173,12 @@ Examples:
   
   # Show band information
   python src/cli.py band-info --band n7
+  
+  # Audit gNB configuration dumps (files or directories of .json/.xml)
+  python src/cli.py audit dumps/ --workers 8
+  
+  # Point A for a large carrier CSV, resuming an interrupted run
+  python src/cli.py batch carriers.csv point_a.csv --resume
         """
     )
     
@@ -168,6 +215,33 @@ Examples:
     parser_band_info = subparsers.add_parser('band-info', help='Show band information')
     parser_band_info.add_argument('--band', required=True, help='5G NR band (e.g., n77)')
     
+    # gNB configuration audit
+    parser_audit = subparsers.add_parser('audit', help='Audit Point A in gNB configuration dumps')
+    parser_audit.add_argument('paths', nargs='+',
+                              help='Configuration files or directories (.json/.xml)')
+    parser_audit.add_argument('--workers', type=int, default=None,
+                              help='Number of parallel parsing workers (default: CPU count)')
+    parser_audit.add_argument('--processes', action='store_true',
+                              help='Parse in a process pool instead of a thread pool')
+    parser_audit.add_argument('--all', action='store_true',
+                              help='Also report cells whose Point A matches')
+    parser_audit.add_argument('--jsonl', action='store_true',
+                              help='Output one JSON object per result')
+    
+    # Checkpointed batch job
+    parser_batch = subparsers.add_parser('batch', help='Calculate Point A for a carrier CSV in '
+                                                       'resumable chunks')
+    parser_batch.add_argument('input', help='CSV with band,scs_khz,bandwidth_mhz,center_arfcn '
+                                            '[,offset_to_carrier_rb] columns')
+    parser_batch.add_argument('output', help='Output CSV')
+    parser_batch.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS,
+                              help=f'Rows per chunk (default: {DEFAULT_CHUNK_ROWS})')
+    parser_batch.add_argument('--resume', action='store_true',
+                              help='Skip chunks completed by an interrupted run')
+    parser_batch.add_argument('--work-dir', default=None,
+                              help='Directory for chunk outputs and the manifest '
+                                   '(default: OUTPUT.parts)')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -184,6 +258,10 @@ Examples:
         convert_arfcn_to_freq(calc, args)
     elif args.command == 'band-info':
         show_band_info(calc, args)
+    elif args.command == 'audit':
+        audit_configs(args)
+    elif args.command == 'batch':
+        run_batch(calc, args)
 
 
 if __name__ == '__main__':
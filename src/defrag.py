@@ -0,0 +1,303 @@
+"""
+Spectrum defragmentation optimizer
+Re-places existing carriers of a band (keeping SCS and bandwidth) so that the
+largest block of spectrum free on every site of a cluster grows, with as few
+carrier moves as possible
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .band_data import get_band_info
+from .frequency_calculator import FrequencyCalculator, ArrayLike
+
+# Columns of the carrier table passed to the optimizer ('pinned' is optional)
+CARRIER_COLUMNS = ('carrier_id', 'site_id', 'scs_khz', 'bandwidth_mhz', 'center_arfcn')
+
+
+class _BandGrid:
+    """Channel raster and downlink limits of a band in integer kHz"""
+
+    def __init__(self, band_info: Dict[str, Any]):
+        self.freq_ref_khz = round(band_info['freq_ref_offset'] * 1000)
+        self.delta_f_global = int(band_info['delta_f_global'])
+        self.arfcn_offset = band_info['arfcn_offset']
+        self.step = max(1, round(band_info['delta_f_raster'] / band_info['delta_f_global']))
+        self.low_khz = round(band_info['dl_freq_low'] * 1000)
+        self.high_khz = round(band_info['dl_freq_high'] * 1000)
+
+    def to_khz(self, arfcn: Any) -> Any:
+        """Frequency in kHz of raster ARFCN(s)"""
+        return self.freq_ref_khz + self.delta_f_global * (arfcn - self.arfcn_offset)
+
+    def arfcn_at_or_above(self, khz: int) -> int:
+        """Lowest channel raster ARFCN at or above a frequency"""
+        arfcn = self.arfcn_offset - (-(khz - self.freq_ref_khz) // self.delta_f_global)
+        return -(-arfcn // self.step) * self.step
+
+    def arfcn_at_or_below(self, khz: int) -> int:
+        """Highest channel raster ARFCN at or below a frequency"""
+        arfcn = self.arfcn_offset + (khz - self.freq_ref_khz) // self.delta_f_global
+        return arfcn // self.step * self.step
+
+
+def optimize_defragmentation(calc: FrequencyCalculator, band: str, carriers: Dict[str, ArrayLike],
+                             max_moves: Optional[int] = None,
+                             resolution_khz: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Re-place carriers to maximize the largest contiguous free block of a band
+
+    Carriers occupy their channel bandwidth around the center. Carriers of
+    the same site must not overlap; carriers of different sites may (they
+    reuse the spectrum), and the free block has to be free on every site.
+
+    The block width is binary searched. For a width, candidate windows start
+    at the band edge or at a carrier channel edge, and are tried in order of
+    the number of carriers they displace (a lower bound on the moves). The
+    displaced carriers of each site are re-placed best-fit, largest first,
+    into the site's free gaps on the channel raster; if they do not fit, the
+    site's other movable carriers are first slid away from the window
+    towards the band edges, and slides that turn out unnecessary are undone
+    (local search). Among the windows of the widest feasible block the one
+    with the fewest moves wins.
+
+    Args:
+        calc: Calculator used to validate carriers and compute Point A
+        band: 5G NR band (e.g., 'n77')
+        carriers: Columns of the carrier table (see CARRIER_COLUMNS), plus an
+                  optional boolean 'pinned' column for carriers that must stay
+        max_moves: Maximum number of carriers to move (default: unlimited)
+        resolution_khz: Block width resolution of the search
+                        (default: the band's channel raster step)
+
+    Returns:
+        Dictionary with 'band', 'initial_free_block_mhz', 'free_block_mhz',
+        'free_block_low_mhz', 'free_block_high_mhz', 'moves' and 'carriers',
+        a dictionary of arrays 'carrier_id', 'site_id', 'center_arfcn' (new),
+        'point_a_arfcn' (new), 'original_center_arfcn' and 'moved'
+
+    Raises:
+        ValueError: If a column is missing or a carrier is invalid or outside the band
+    """
+    missing = [name for name in CARRIER_COLUMNS if name not in carriers]
+    if missing:
+        raise ValueError(f"Missing carrier columns: {', '.join(missing)}")
+
+    grid = _BandGrid(get_band_info(band))
+    carrier_id = np.asarray(carriers['carrier_id'])
+    site_ids, site = np.unique(np.asarray(carriers['site_id']), return_inverse=True)
+    scs = np.asarray(carriers['scs_khz'], dtype=np.int64)
+    bandwidth = np.asarray(carriers['bandwidth_mhz'], dtype=np.int64)
+    center = np.asarray(carriers['center_arfcn'], dtype=np.int64)
+    pinned = np.broadcast_to(np.asarray(carriers.get('pinned', False), dtype=bool), center.shape)
+
+    for i in range(len(center)):
+        calc.calculate_point_a_arfcn(band, int(scs[i]), int(bandwidth[i]), int(center[i]))
+    half = bandwidth * 500
+    low = grid.to_khz(center) - half
+    outside = (low < grid.low_khz) | (low + 2 * half > grid.high_khz)
+    if outside.any():
+        raise ValueError(f"Carrier {carrier_id[outside][0]} outside band {band}")
+
+    packer = _Packer(grid, site, half, center, pinned,
+                     len(center) if max_moves is None else max_moves)
+    resolution = resolution_khz or grid.step * grid.delta_f_global
+    initial_low, initial_high = _largest_gap(low, low + 2 * half, grid.low_khz, grid.high_khz)
+
+    # Widest feasible block: the current largest gap needs no moves
+    best = (0, center)
+    lo, hi = (initial_high - initial_low) // resolution, (grid.high_khz - grid.low_khz) // resolution
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        found = packer.best_window(mid * resolution, first_only=True)
+        if found is None:
+            hi = mid - 1
+        else:
+            lo = mid
+    if lo * resolution > initial_high - initial_low:
+        best = packer.best_window(lo * resolution, first_only=False)
+
+    moves, new_center = best
+    new_low = grid.to_khz(new_center) - half
+    block_low, block_high = _largest_gap(new_low, new_low + 2 * half, grid.low_khz, grid.high_khz)
+    point_a = np.array([calc.calculate_point_a_arfcn(band, int(scs[i]), int(bandwidth[i]),
+                                                     int(new_center[i]))
+                        for i in range(len(center))], dtype=np.int64)
+    return {
+        'band': band,
+        'initial_free_block_mhz': (initial_high - initial_low) / 1000.0,
+        'free_block_mhz': (block_high - block_low) / 1000.0,
+        'free_block_low_mhz': block_low / 1000.0,
+        'free_block_high_mhz': block_high / 1000.0,
+        'moves': int(moves),
+        'carriers': {
+            'carrier_id': carrier_id,
+            'site_id': site_ids[site],
+            'center_arfcn': new_center,
+            'point_a_arfcn': point_a,
+            'original_center_arfcn': center,
+            'moved': new_center != center,
+        },
+    }
+
+
+class _Packer:
+    """Window evaluation and per-site re-placement for optimize_defragmentation"""
+
+    def __init__(self, grid: _BandGrid, site: np.ndarray, half: np.ndarray, center: np.ndarray,
+                 pinned: np.ndarray, max_moves: int):
+        self.grid = grid
+        self.half = half
+        self.center = center
+        self.pinned = pinned
+        self.max_moves = max_moves
+        self.low = grid.to_khz(center) - half
+        self.high = self.low + 2 * half
+        order = np.argsort(site, kind='stable')
+        bounds = np.searchsorted(site[order], np.arange(site.max() + 2 if len(site) else 1))
+        self.site_carriers = [order[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+        self.site = site
+
+    def best_window(self, width: int,
+                    first_only: bool) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        Find the window of a width needing the fewest moves
+
+        Returns:
+            Tuple of (moves, new center ARFCNs), None if no window is feasible
+        """
+        grid = self.grid
+        starts = np.concatenate([[grid.low_khz, grid.high_khz - width], self.high,
+                                 self.low - width])
+        starts = np.unique(starts[(starts >= grid.low_khz) & (starts <= grid.high_khz - width)])
+        overlap = (self.low[None, :] < starts[:, None] + width) & (self.high[None, :] > starts[:, None])
+        counts = overlap.sum(axis=1)
+        usable = ~(overlap & self.pinned[None, :]).any(axis=1) & (counts <= self.max_moves)
+
+        best = None
+        for index in np.flatnonzero(usable)[np.argsort(counts[usable], kind='stable')]:
+            if best is not None and counts[index] >= best[0]:
+                break
+            result = self._evaluate(int(starts[index]), int(starts[index]) + width, overlap[index])
+            if result is not None and (best is None or result[0] < best[0]):
+                best = result
+                if first_only:
+                    break
+        return best
+
+    def _evaluate(self, start: int, end: int,
+                  displaced: np.ndarray) -> Optional[Tuple[int, np.ndarray]]:
+        """Re-place the carriers displaced by a window, site by site"""
+        new_center = self.center.copy()
+        for site in np.unique(self.site[displaced]).tolist():
+            members = self.site_carriers[site]
+            placed = self._place(members, displaced, new_center, start, end)
+            if placed is None:
+                placed = self._compact_and_place(members, displaced, new_center, start, end)
+                if placed is None:
+                    return None
+        moves = int((new_center != self.center).sum())
+        return (moves, new_center) if moves <= self.max_moves else None
+
+    def _place(self, members: np.ndarray, displaced: np.ndarray, new_center: np.ndarray,
+               start: int, end: int) -> Optional[bool]:
+        """Best-fit the displaced site members into the site's free gaps (largest first)"""
+        grid = self.grid
+        staying = members[~displaced[members]]
+        obstacles = sorted([(start, end)] + list(zip(
+            (grid.to_khz(new_center[staying]) - self.half[staying]).tolist(),
+            (grid.to_khz(new_center[staying]) + self.half[staying]).tolist())))
+        gaps = _free_gaps(obstacles, grid.low_khz, grid.high_khz)
+
+        moving = members[displaced[members]]
+        placements = {}
+        for carrier in moving[np.argsort(-self.half[moving], kind='stable')].tolist():
+            half = int(self.half[carrier])
+            best_gap, best_arfcn, best_slack = None, None, None
+            for i, (gap_low, gap_high) in enumerate(gaps):
+                arfcn = grid.arfcn_at_or_above(gap_low + half)
+                if grid.to_khz(arfcn) + half <= gap_high:
+                    slack = gap_high - gap_low - 2 * half
+                    if best_slack is None or slack < best_slack:
+                        best_gap, best_arfcn, best_slack = i, arfcn, slack
+            if best_gap is None:
+                return None
+            placements[carrier] = best_arfcn
+            gaps[best_gap] = (grid.to_khz(best_arfcn) + half, gaps[best_gap][1])
+
+        for carrier, arfcn in placements.items():
+            new_center[carrier] = arfcn
+        return True
+
+    def _compact_and_place(self, members: np.ndarray, displaced: np.ndarray,
+                           new_center: np.ndarray, start: int, end: int) -> Optional[bool]:
+        """Slide the site's movable carriers towards the band edges, place, then undo needless slides"""
+        grid = self.grid
+        staying = members[~displaced[members]]
+        slid = new_center.copy()
+
+        # Left of the window: pack upwards from the band low edge, never moving up
+        cursor = grid.low_khz
+        left = staying[self.high[staying] <= start]
+        for carrier in left[np.argsort(self.low[left], kind='stable')].tolist():
+            half = int(self.half[carrier])
+            if not self.pinned[carrier]:
+                arfcn = grid.arfcn_at_or_above(cursor + half)
+                if arfcn < slid[carrier]:
+                    slid[carrier] = arfcn
+            cursor = max(cursor, int(grid.to_khz(slid[carrier])) + half)
+
+        # Right of the window: pack downwards from the band high edge, never moving down
+        cursor = grid.high_khz
+        right = staying[self.low[staying] >= end]
+        for carrier in right[np.argsort(-self.high[right], kind='stable')].tolist():
+            half = int(self.half[carrier])
+            if not self.pinned[carrier]:
+                arfcn = grid.arfcn_at_or_below(cursor - half)
+                if arfcn > slid[carrier]:
+                    slid[carrier] = arfcn
+            cursor = min(cursor, int(grid.to_khz(slid[carrier])) - half)
+
+        if self._place(members, displaced, slid, start, end) is None:
+            return None
+
+        # Local search: move slid carriers back where that collides with nothing
+        for carrier in staying[slid[staying] != self.center[staying]].tolist():
+            trial = slid[carrier]
+            slid[carrier] = self.center[carrier]
+            if _site_overlaps(grid, members, carrier, slid, self.half):
+                slid[carrier] = trial
+
+        new_center[members] = slid[members]
+        return True
+
+
+def _site_overlaps(grid: _BandGrid, members: np.ndarray, carrier: int, centers: np.ndarray,
+                   half: np.ndarray) -> bool:
+    """Whether a carrier overlaps another carrier of its site"""
+    others = members[members != carrier]
+    low = grid.to_khz(centers[carrier]) - half[carrier]
+    high = grid.to_khz(centers[carrier]) + half[carrier]
+    other_low = grid.to_khz(centers[others]) - half[others]
+    return bool(((other_low < high) & (other_low + 2 * half[others] > low)).any())
+
+
+def _free_gaps(obstacles: List[Tuple[int, int]], low: int, high: int) -> List[Tuple[int, int]]:
+    """Free intervals of [low, high] around sorted (start, end) obstacles"""
+    gaps = []
+    cursor = low
+    for obstacle_low, obstacle_high in obstacles:
+        if obstacle_low > cursor:
+            gaps.append((cursor, min(obstacle_low, high)))
+        cursor = max(cursor, obstacle_high)
+    if cursor < high:
+        gaps.append((cursor, high))
+    return gaps
+
+
+def _largest_gap(low: np.ndarray, high: np.ndarray, band_low: int, band_high: int) -> Tuple[int, int]:
+    """Largest interval of [band_low, band_high] not covered by any carrier"""
+    order = np.argsort(low, kind='stable')
+    gaps = _free_gaps(list(zip(low[order].tolist(), high[order].tolist())), band_low, band_high)
+    return max(gaps, key=lambda gap: gap[1] - gap[0], default=(band_low, band_low))
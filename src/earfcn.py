@@ -0,0 +1,147 @@
+"""
+LTE EARFCN to NR-ARFCN cross-mapping for DSS bands
+Maps LTE carriers of the bands in band_data.LTE_BANDS onto the NR-ARFCN
+raster of the NR band they share, for overlay planning
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from .band_data import LTE_BANDS, LTE_BANDWIDTH_RB, NR_BANDS
+from .frequency_calculator import FrequencyCalculator, ArrayLike
+
+# One row per (LTE band, direction), sorted by first EARFCN
+_RANGES = sorted(
+    (info[f'{link}_earfcn_offset'], info[f'{link}_earfcn_high'],
+     round(info[f'{link}_freq_low'] * 1000), lte_band, link == 'ul')
+    for lte_band, info in LTE_BANDS.items() for link in ('dl', 'ul')
+)
+_EARFCN_LOW, _EARFCN_HIGH, _FREQ_LOW_KHZ, _LTE_BAND, _UPLINK = (np.array(column)
+                                                                for column in zip(*_RANGES))
+_NR_BAND = np.array([LTE_BANDS[lte_band]['nr_band'] for lte_band in _LTE_BAND.tolist()])
+
+# NR channel raster of each range: first frequency and step in kHz (TS 38.101-1 5.4.2.3)
+_NR_LOW_KHZ = np.array([round(NR_BANDS[nr_band][f"{'ul' if uplink else 'dl'}_freq_low"] * 1000)
+                        for nr_band, uplink in zip(_NR_BAND.tolist(), _UPLINK.tolist())])
+_NR_HIGH_KHZ = np.array([round(NR_BANDS[nr_band][f"{'ul' if uplink else 'dl'}_freq_high"] * 1000)
+                         for nr_band, uplink in zip(_NR_BAND.tolist(), _UPLINK.tolist())])
+_NR_RASTER_KHZ = np.array([round(NR_BANDS[nr_band]['delta_f_raster'])
+                           for nr_band in _NR_BAND.tolist()])
+
+# LTE subcarrier spacing and RB width in kHz
+_LTE_SCS_KHZ = 15
+_LTE_RB_KHZ = 12 * _LTE_SCS_KHZ
+
+
+def earfcn_to_frequency_batch(earfcns: ArrayLike) -> Dict[str, np.ndarray]:
+    """
+    Convert EARFCNs of the DSS bands to carrier frequencies
+    Based on 3GPP TS 36.101 Section 5.7.3
+
+    EARFCN ranges do not overlap, so the LTE band and link direction follow
+    from the EARFCN alone; ranges are found by binary search like the NR
+    global raster in FrequencyCalculator.arfcn_to_frequency_batch.
+
+    Args:
+        earfcns: EARFCN value(s)
+
+    Returns:
+        Dictionary with 'lte_band', 'nr_band', 'uplink' and 'frequency_khz'
+        (int64) arrays
+
+    Raises:
+        ValueError: If any EARFCN is outside the bands of LTE_BANDS
+    """
+    earfcn = np.asarray(earfcns, dtype=np.int64)
+    range_idx = _earfcn_ranges(earfcn)
+    return {
+        'lte_band': _LTE_BAND[range_idx],
+        'nr_band': _NR_BAND[range_idx],
+        'uplink': _UPLINK[range_idx],
+        'frequency_khz': _FREQ_LOW_KHZ[range_idx] + 100 * (earfcn - _EARFCN_LOW[range_idx]),
+    }
+
+
+def map_earfcn_to_nr_batch(calc: FrequencyCalculator, earfcns: ArrayLike,
+                           bandwidth_mhz: Optional[ArrayLike] = None) -> Dict[str, np.ndarray]:
+    """
+    Map LTE carriers onto the NR-ARFCN raster of the shared NR band
+
+    The carrier frequency is converted with the calculator's
+    frequency_to_arfcn_batch. 'raster_aligned' tells whether the LTE carrier
+    frequency is also a point of the NR band's 100 kHz channel raster. LTE
+    uplink subcarriers sit 7.5 kHz off the NR grid, so uplink rows need
+    frequencyShift7p5khz ('shift_7p5khz') for an NR carrier sharing them.
+
+    With bandwidth_mhz, Point A is placed at center - N_RB x 90 kHz, so 15 kHz
+    NR subcarriers coincide with the LTE ones (the NR subcarrier at the LTE DC
+    position stays unused by LTE). This holds for uplink rows too: the
+    7.5 kHz shift moves the NR subcarriers relative to Point A (TS 38.211
+    Section 5.4), not Point A itself, so Point A stays on the unshifted grid
+    and Point A + 7.5 kHz is the lowest LTE uplink subcarrier.
+
+    Args:
+        calc: Calculator used to convert frequencies to NR-ARFCNs
+        earfcns: EARFCN value(s)
+        bandwidth_mhz: LTE channel bandwidth(s) in MHz (1.4, 3, 5, 10, 15, 20),
+                       broadcast against earfcns (default: no Point A)
+
+    Returns:
+        Dictionary with 'lte_band', 'nr_band', 'uplink', 'frequency_mhz',
+        'nr_arfcn', 'raster_aligned' and 'shift_7p5khz' arrays, plus
+        'lte_n_rb', 'point_a_arfcn' and 'point_a_freq_mhz' with bandwidth_mhz
+
+    Raises:
+        ValueError: If any EARFCN or bandwidth is invalid
+    """
+    earfcn = np.asarray(earfcns, dtype=np.int64)
+    if bandwidth_mhz is not None:
+        bandwidth, earfcn = np.broadcast_arrays(np.asarray(bandwidth_mhz, dtype=np.float64),
+                                                earfcn)
+    range_idx = _earfcn_ranges(earfcn)
+    freq_khz = _FREQ_LOW_KHZ[range_idx] + 100 * (earfcn - _EARFCN_LOW[range_idx])
+    above_nr_low_khz = freq_khz - _NR_LOW_KHZ[range_idx]
+    uplink = _UPLINK[range_idx]
+
+    result = {
+        'lte_band': _LTE_BAND[range_idx],
+        'nr_band': _NR_BAND[range_idx],
+        'uplink': uplink,
+        'frequency_mhz': freq_khz / 1000.0,
+        'nr_arfcn': calc.frequency_to_arfcn_batch(freq_khz),
+        'raster_aligned': ((above_nr_low_khz >= 0) & (freq_khz <= _NR_HIGH_KHZ[range_idx]) &
+                           (above_nr_low_khz % _NR_RASTER_KHZ[range_idx] == 0)),
+        'shift_7p5khz': uplink,
+    }
+    if bandwidth_mhz is None:
+        return result
+
+    bandwidth_keys = np.array([round(bw * 10) for bw in LTE_BANDWIDTH_RB])
+    bandwidth_idx = np.searchsorted(bandwidth_keys, np.rint(bandwidth * 10).astype(np.int64))
+    bandwidth_idx = bandwidth_idx.clip(0, len(bandwidth_keys) - 1)
+    valid = bandwidth_keys[bandwidth_idx] == np.rint(bandwidth * 10)
+    if not valid.all():
+        raise ValueError(f"Invalid LTE bandwidth {bandwidth[~valid].ravel()[0]} MHz")
+
+    n_rb = np.array(list(LTE_BANDWIDTH_RB.values()))[bandwidth_idx]
+    point_a_khz = freq_khz - n_rb * _LTE_RB_KHZ // 2
+    result['lte_n_rb'] = n_rb
+    result['point_a_arfcn'] = calc.frequency_to_arfcn_batch(point_a_khz)
+    result['point_a_freq_mhz'] = point_a_khz / 1000.0
+    return result
+
+
+def _earfcn_ranges(earfcn: np.ndarray) -> np.ndarray:
+    """
+    Find the LTE_BANDS range (band and direction) of every EARFCN
+
+    Raises:
+        ValueError: If any EARFCN is outside the bands of LTE_BANDS
+    """
+    range_idx = np.searchsorted(_EARFCN_LOW, earfcn, side='right') - 1
+    outside = (range_idx < 0) | (earfcn > _EARFCN_HIGH[range_idx])
+    if outside.any():
+        raise ValueError(f"EARFCN {earfcn[outside].ravel()[0]} outside the supported DSS bands")
+    return range_idx
+
@@ -3,20 +3,347 @@
 Based on 3GPP TS 38.104 Release 16
 """
 
-from typing import List, Tuple, Dict, Any
-from .band_data import get_band_info, is_valid_scs, is_valid_bandwidth, get_max_rb
+import bisect
+import threading
+from types import MappingProxyType
+from typing import List, Tuple, Dict, Any, Optional, Sequence, Union
+
+import numpy as np
+
+from .band_data import (get_band_info, compile_band_tables, describe_invalid, VALID,
+                        INVALID_BAND, INVALID_SCS, INVALID_BANDWIDTH, UNSUPPORTED_BANDWIDTH,
+                        INVALID_ARFCN, INVALID_OFFSET_TO_CARRIER, MAX_OFFSET_TO_CARRIER_RB,
+                        get_coreset_zero, gscn_to_frequency_khz, frequency_khz_to_gscn)
+from .results import PointAResult, PointAResultSet
+
+ArrayLike = Union[int, Sequence[int], np.ndarray]
+BandLike = Union[str, Sequence[str], np.ndarray]
+
+# Scalar results kept per thread before its cache is reset
+SCALAR_CACHE_SIZE = 4096
+
+
+def _table_index(values: np.ndarray, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the positions of query values in a sorted table axis
+    
+    Returns:
+        Tuple of (index array clipped into range, mask of values present in the axis)
+    """
+    index = np.searchsorted(values, query).clip(0, len(values) - 1)
+    return index, values[index] == query
+
+
+def _raise_first_invalid(codes: np.ndarray, band_arr: np.ndarray, scs: np.ndarray, bw: np.ndarray,
+                         center: np.ndarray, offset: np.ndarray) -> None:
+    """Raise the scalar error message of the first row with a non-zero validation code"""
+    invalid = np.flatnonzero(codes.ravel())
+    if len(invalid):
+        row = invalid[0]
+        raise ValueError(describe_invalid(int(codes.ravel()[row]), str(band_arr.ravel()[row]),
+                                          int(scs.ravel()[row]), int(bw.ravel()[row]),
+                                          int(center.ravel()[row]), int(offset.ravel()[row])))
+
+
+def _carrier_layout(center_khz, n_rb, scs_khz, offset_rb, to_arfcn):
+    """
+    Point A and carrier edges in integer arithmetic
+    
+    Works on Python ints and numpy arrays alike. Positions are computed in kHz
+    and converted by to_arfcn, which maps a frequency in kHz to its ARFCN and
+    the frequency of that ARFCN (on the raster containing the frequency), so
+    Point A and the carrier edges may lie in a different raster range than
+    the center.
+    
+    Returns:
+        Tuple of (Point A frequency in kHz, layout dictionary)
+    """
+    carrier_start_khz = offset_rb * 12 * scs_khz
+    carrier_width_khz = n_rb * 12 * scs_khz
+    point_a_arfcn, point_a_khz = to_arfcn(center_khz - carrier_width_khz // 2 - carrier_start_khz)
+    
+    return point_a_khz, {
+        'n_rb': n_rb,
+        'point_a_arfcn': point_a_arfcn,
+        'carrier_start_arfcn': to_arfcn(point_a_khz + carrier_start_khz)[0],
+        'carrier_end_arfcn': to_arfcn(point_a_khz + carrier_start_khz + carrier_width_khz)[0],
+        'point_a_freq_mhz': point_a_khz / 1000.0,
+        'carrier_start_freq_mhz': (point_a_khz + carrier_start_khz) / 1000.0,
+        'center_freq_mhz': (point_a_khz + carrier_start_khz + carrier_width_khz // 2) / 1000.0,
+        'carrier_end_freq_mhz': (point_a_khz + carrier_start_khz + carrier_width_khz) / 1000.0,
+    }
+
+
+def _ssb_layout(layout, point_a_khz, ssb_khz, ssb_scs_khz, k_ssb_unit_khz, offset_rb_khz,
+                carrier_start_khz, carrier_width_khz):
+    """
+    Add the SSB position relative to Point A to a layout (TS 38.211 Section 7.4.3.1)
+    
+    absoluteFrequencySSB is subcarrier 120 of the SS/PBCH block. offsetToPointA
+    counts RBs of offset_rb_khz (15 kHz SCS in FR1, 60 kHz in FR2) and k_SSB
+    counts subcarriers of k_ssb_unit_khz.
+    
+    Returns:
+        Tuple of (SSB lowest subcarrier in kHz above Point A, validity)
+    """
+    ssb_low_khz = ssb_khz - point_a_khz - 120 * ssb_scs_khz
+    valid = (ssb_low_khz >= 0) & (ssb_low_khz % k_ssb_unit_khz == 0)
+    
+    layout['ssb_scs_khz'] = ssb_scs_khz
+    layout['ssb_freq_mhz'] = (point_a_khz + ssb_low_khz + 120 * ssb_scs_khz) / 1000.0
+    layout['offset_to_point_a'] = ssb_low_khz // offset_rb_khz
+    layout['k_ssb'] = ssb_low_khz % offset_rb_khz // k_ssb_unit_khz
+    layout['ssb_in_carrier'] = ((ssb_low_khz >= carrier_start_khz) &
+                                (ssb_low_khz + 240 * ssb_scs_khz <=
+                                 carrier_start_khz + carrier_width_khz))
+    return ssb_low_khz, valid
+
+
+def _coreset_zero_layout(layout, point_a_khz, ssb_low_khz, pdcch_scs_khz, coreset_n_rb,
+                         coreset_symbols, coreset_offset_rb, carrier_start_khz, carrier_width_khz):
+    """
+    Add the CORESET#0 position to a layout (TS 38.213 Section 13)
+    
+    The CORESET#0 offset counts common RBs (of the PDCCH SCS) from the lowest
+    CORESET#0 RB up to the common RB overlapping the first SSB RB.
+    """
+    rb_khz = 12 * pdcch_scs_khz
+    start_crb = ssb_low_khz // rb_khz - coreset_offset_rb
+    start_khz = start_crb * rb_khz
+    
+    layout['coreset0_n_rb'] = coreset_n_rb
+    layout['coreset0_symbols'] = coreset_symbols
+    layout['coreset0_offset_rb'] = coreset_offset_rb
+    layout['coreset0_start_crb'] = start_crb
+    layout['coreset0_start_freq_mhz'] = (point_a_khz + start_khz) / 1000.0
+    layout['coreset0_in_carrier'] = ((start_khz >= carrier_start_khz) &
+                                     (start_khz + coreset_n_rb * rb_khz <=
+                                      carrier_start_khz + carrier_width_khz))
+
+
+class _TableState:
+    """
+    Immutable snapshot of the compiled tables and the values derived from them
+    
+    Calculators publish a new state with a single attribute store instead of
+    mutating the current one (copy-on-write), so a call that reads the state
+    once sees one consistent set of tables without taking a lock.
+    """
+    
+    __slots__ = ('tables', 'band_index', 'generation', 'scs_index', 'bandwidth_index', 'n_rb',
+                 'scs_mask', 'bandwidth_mask', 'band_delta_f_global', 'raster_lows',
+                 'raster_ranges', 'raster_freq_lows', 'raster_freq_ref_khz',
+                 'raster_delta_f_global')
+    
+    def __init__(self, tables: Dict[str, np.ndarray], generation: int):
+        frozen = {name: _read_only(array) for name, array in tables.items()}
+        self.tables = MappingProxyType(frozen)
+        self.band_index = {name: i for i, name in enumerate(frozen['band_names'].tolist())}
+        self.raster_freq_ref_khz = _read_only(
+            np.rint(frozen['raster_freq_ref_offset'] * 1000).astype(np.int64))
+        self.raster_delta_f_global = _read_only(
+            frozen['raster_delta_f_global'].astype(np.int64))
+        self.generation = generation
+
+        # Python copies of the tables for the scalar methods (no numpy per call)
+        self.scs_index = {scs: i for i, scs in enumerate(frozen['scs_values'].tolist())}
+        self.bandwidth_index = {bw: i for i, bw in enumerate(frozen['bandwidth_values'].tolist())}
+        self.n_rb = frozen['n_rb'].tolist()
+        self.scs_mask = frozen['band_scs_mask'].tolist()
+        self.bandwidth_mask = frozen['band_bandwidth_mask'].tolist()
+        self.band_delta_f_global = frozen['delta_f_global'].astype(np.int64).tolist()
+        # Raster parameters: (F_REF_Offs in MHz, F_REF_Offs in kHz, Δf_global, N_REF_Offs)
+        self.raster_lows = frozen['raster_arfcn_low'].tolist()
+        self.raster_ranges = [
+            (high, (freq_ref, round(freq_ref * 1000), int(delta_f_global), offset))
+            for high, freq_ref, delta_f_global, offset in zip(
+                frozen['raster_arfcn_high'].tolist(), frozen['raster_freq_ref_offset'].tolist(),
+                frozen['raster_delta_f_global'].tolist(), frozen['raster_arfcn_offset'].tolist())
+        ]
+        self.raster_freq_lows = self.raster_freq_ref_khz.tolist()
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Get a read-only view of an array (the caller's array keeps its flags)"""
+    view = np.asarray(array).view()
+    view.flags.writeable = False
+    return view
+
+
+def _band_position(state: _TableState, band: str) -> int:
+    """Row of a band in the state's tables, raising like get_band_info for unknown bands"""
+    band_idx = state.band_index.get(band)
+    if band_idx is None:
+        raise ValueError(f"Unknown band: {band}")
+    return band_idx
+
+
+def _global_raster(state: _TableState, arfcn: int) -> tuple:
+    """
+    Raster parameters of the global raster range containing an ARFCN
+    
+    NR-ARFCNs are global (TS 38.104 Table 5.4.2.1-1): every ARFCN to
+    frequency conversion goes through this lookup (or _raster_arrays),
+    whatever band the ARFCN belongs to.
+    
+    Returns:
+        Tuple of (F_REF_Offs in MHz, F_REF_Offs in kHz, Δf_global in kHz, N_REF_Offs)
+        
+    Raises:
+        ValueError: If the ARFCN is outside the global raster
+    """
+    index = bisect.bisect_right(state.raster_lows, arfcn) - 1
+    if index < 0 or arfcn > state.raster_ranges[index][0]:
+        raise ValueError(f"ARFCN {arfcn} outside the global frequency raster")
+    return state.raster_ranges[index][1]
+
+
+def _frequency_raster(state: _TableState, frequency_khz: int) -> tuple:
+    """Raster parameters of a frequency (see _global_raster); lowest/highest range outside"""
+    index = max(bisect.bisect_right(state.raster_freq_lows, frequency_khz) - 1, 0)
+    return state.raster_ranges[index][1]
+
+
+def _raster_arrays(state: _TableState, range_idx: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Vectorized _global_raster for rows whose global raster range index is known
+    
+    Returns:
+        Tuple of (F_REF_Offs in kHz, Δf_global in kHz, N_REF_Offs) arrays;
+        rows below the global raster get the lowest range
+    """
+    index = range_idx.clip(0)
+    return (state.raster_freq_ref_khz[index], state.raster_delta_f_global[index],
+            state.tables['raster_arfcn_offset'][index])
+
+
+def _arfcn_to_khz(state: _TableState, arfcn: np.ndarray) -> np.ndarray:
+    """Vectorized ARFCN to frequency in kHz (see _global_raster)"""
+    range_idx = np.searchsorted(state.tables['raster_arfcn_low'], arfcn, side='right') - 1
+    freq_ref_khz, delta_f_global, arfcn_offset = _raster_arrays(state, range_idx)
+    return freq_ref_khz + delta_f_global * (arfcn - arfcn_offset)
+
+
+def _khz_to_arfcn(state: _TableState,
+                  frequency_khz: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized frequency in kHz to ARFCN, rounded down onto the raster of
+    _frequency_raster
+    
+    Returns:
+        Tuple of (ARFCNs, their frequencies in kHz)
+    """
+    range_idx = np.searchsorted(state.raster_freq_ref_khz, frequency_khz, side='right') - 1
+    freq_ref_khz, delta_f_global, arfcn_offset = _raster_arrays(state, range_idx)
+    steps = (frequency_khz - freq_ref_khz) // delta_f_global
+    return steps + arfcn_offset, freq_ref_khz + delta_f_global * steps
+
+
+def _resolve_carrier(state: _TableState, band: str, scs_khz: int, bandwidth_mhz: int,
+                     center_arfcn: int, offset_to_carrier_rb: int) -> Tuple[int, int]:
+    """
+    Validate a carrier description against the state's tables
+    
+    Checks run in the same order as FrequencyCalculator.classify_point_a_batch
+    and raise the same messages.
+    
+    Returns:
+        Tuple of (band table index, maximum RB number)
+    
+    Raises:
+        ValueError: If invalid parameters provided
+    """
+    band_idx = state.band_index.get(band)
+    scs_idx = state.scs_index.get(scs_khz)
+    bw_idx = state.bandwidth_index.get(bandwidth_mhz)
+    n_rb = 0
+    if band_idx is not None and scs_idx is not None and bw_idx is not None:
+        n_rb = state.n_rb[band_idx][scs_idx][bw_idx]
+    if not n_rb:
+        if band_idx is None:
+            code = INVALID_BAND
+        elif scs_idx is None or not state.scs_mask[band_idx][scs_idx]:
+            code = INVALID_SCS
+        elif bw_idx is None or not state.bandwidth_mask[band_idx][bw_idx]:
+            code = INVALID_BANDWIDTH
+        else:
+            code = UNSUPPORTED_BANDWIDTH
+        raise ValueError(describe_invalid(code, band, scs_khz, bandwidth_mhz, center_arfcn))
+    
+    _global_raster(state, center_arfcn)
+    
+    if not 0 <= offset_to_carrier_rb <= MAX_OFFSET_TO_CARRIER_RB:
+        raise ValueError(f"Invalid offsetToCarrier {offset_to_carrier_rb} RB")
+    
+    return band_idx, n_rb
+
+
+def _arfcn_to_frequency(state: _TableState, arfcn: int) -> float:
+    """ARFCN to MHz on the raster of _global_raster"""
+    freq_ref_offset, _, delta_f_global, arfcn_offset = _global_raster(state, arfcn)
+    
+    # Same operation order as arfcn_to_frequency_batch so results are identical
+    return freq_ref_offset + (delta_f_global * (arfcn - arfcn_offset) / 1000.0)
 
 
 class FrequencyCalculator:
     """
     Calculator for 5G NR Point A and SSB frequencies
     Based on 3GPP TS 38.104 Release 16
+    
+    Instances are safe to share between threads: the compiled tables are
+    swapped copy-on-write (see reload_tables) and read without locks, and
+    scalar results are cached per thread.
     """
     
-    def __init__(self):
-        """Initialize the frequency calculator"""
+    def __init__(self, tables: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Initialize the frequency calculator
+        
+        Args:
+            tables: Compiled band tables used by the batch methods, as returned by
+                    band_data.compile_band_tables() or attached from shared memory
+                    (default: compile from band_data)
+        """
         # TODO: Load band data from configuration
-        pass
+        self._state = _TableState(tables if tables is not None else compile_band_tables(), 0)
+        self._swap_lock = threading.Lock()
+        self._local = threading.local()
+    
+    def __reduce__(self) -> tuple:
+        # Locks and thread-local caches stay behind; the copy gets the current tables
+        return self.__class__, (dict(self.tables),)
+    
+    @property
+    def tables(self) -> Dict[str, np.ndarray]:
+        """Current compiled tables (read-only)"""
+        return self._state.tables
+    
+    def reload_tables(self, tables: Optional[Dict[str, np.ndarray]] = None) -> None:
+        """
+        Swap in new compiled tables (copy-on-write)
+        
+        The new state is built completely before it is published, so calls
+        already running finish on the tables they started with and later
+        calls see the new ones. Per-thread caches are reset lazily.
+        
+        Args:
+            tables: Compiled band tables (default: compile from band_data)
+        """
+        with self._swap_lock:
+            self._state = _TableState(tables if tables is not None else compile_band_tables(),
+                                      self._state.generation + 1)
+    
+    def _scalar_cache(self, state: _TableState) -> Dict[tuple, Any]:
+        """Get this thread's scalar result cache for a table state, reset after a table swap"""
+        local = self._local
+        generation = state.generation
+        if getattr(local, 'generation', None) != generation:
+            local.cache = {}
+            local.generation = generation
+        elif len(local.cache) >= SCALAR_CACHE_SIZE:
+            local.cache.clear()
+        return local.cache
     
     def calculate_point_a_arfcn(self, band: str, scs_khz: int, bandwidth_mhz: int, 
                                center_arfcn: int, coreset_zero: int = 0, 
@@ -28,7 +355,7 @@ class FrequencyCalculator:
         Method: Calculate via frequency domain
         1. Convert center ARFCN to frequency
         2. Calculate HalfGrid = (N_RB × 12 × Δf) / 2
-        3. Point A frequency = Center frequency - HalfGrid
+        3. Point A frequency = Center frequency - HalfGrid - offsetToCarrier × 12 × Δf
         4. Convert Point A frequency back to ARFCN
         
         Args:
@@ -37,44 +364,149 @@ class FrequencyCalculator:
             bandwidth_mhz: Channel bandwidth in MHz
             center_arfcn: Center ARFCN of the carrier
             coreset_zero: Control Resource Set Zero configuration (not used in this method)
-            offset_to_carrier_rb: offsetToCarrier in RB units (default: 0)
+            offset_to_carrier_rb: offsetToCarrier in RB units, i.e. the offset from
+                                  Point A to the lowest usable subcarrier (default: 0)
             
         Returns:
             Point A ARFCN
             
         Raises:
-            ValueError: If invalid parameters provided
+            ValueError: If invalid parameters provided (unknown band, SCS or bandwidth
+                        not supported by the band or MAX_RB_TABLE, center ARFCN
+                        outside the global raster, or offsetToCarrier out of range)
         """
-        # Validate inputs
-        if not is_valid_scs(band, scs_khz):
-            raise ValueError(f"Invalid SCS {scs_khz} kHz for band {band}")
+        return self._point_a(self._state, band, scs_khz, bandwidth_mhz, center_arfcn,
+                             offset_to_carrier_rb)[1]
+    
+    def _point_a(self, state: _TableState, band: str, scs_khz: int, bandwidth_mhz: int,
+                 center_arfcn: int, offset_to_carrier_rb: int) -> Tuple[int, int]:
+        """
+        Validate a carrier and calculate its Point A on one table state (cached)
         
-        if not is_valid_bandwidth(band, bandwidth_mhz):
-            raise ValueError(f"Invalid bandwidth {bandwidth_mhz} MHz for band {band}")
+        The center is converted on its raster, HalfGrid and offsetToCarrier are
+        subtracted in integer kHz and Point A goes back to an ARFCN on the raster
+        containing its frequency, exactly like the batch method.
         
-        # Get band information
-        band_info = get_band_info(band)
+        Returns:
+            Tuple of (maximum RB number, Point A ARFCN)
+        """
+        cache = self._scalar_cache(state)
+        key = (band, scs_khz, bandwidth_mhz, center_arfcn, offset_to_carrier_rb)
+        if key in cache:
+            return cache[key]
         
-        # Step 1: Convert center ARFCN to frequency (MHz)
-        center_freq_mhz = self.arfcn_to_frequency(band, center_arfcn)
+        band_idx, n_rb = _resolve_carrier(state, band, scs_khz, bandwidth_mhz, center_arfcn,
+                                          offset_to_carrier_rb)
+        _, freq_ref_khz, delta_f_global, arfcn_offset = _global_raster(state, center_arfcn)
+        point_a_khz = (freq_ref_khz + delta_f_global * (center_arfcn - arfcn_offset) -
+                       n_rb * 6 * scs_khz - offset_to_carrier_rb * 12 * scs_khz)
+        _, freq_ref_khz, delta_f_global, arfcn_offset = _frequency_raster(state, point_a_khz)
+        point_a_arfcn = (point_a_khz - freq_ref_khz) // delta_f_global + arfcn_offset
         
-        # Step 2: Get maximum RB number and calculate HalfGrid
-        n_rb = get_max_rb(scs_khz, bandwidth_mhz)
-        half_grid_khz = (n_rb * 12 * scs_khz) / 2
+        cache[key] = n_rb, point_a_arfcn
+        return n_rb, point_a_arfcn
         
-        # Step 3: Calculate Point A frequency
-        point_a_freq_mhz = center_freq_mhz - (half_grid_khz / 1000.0)  # Convert kHz to MHz
+    def calculate_point_a_result(self, band: str, scs_khz: int, bandwidth_mhz: int,
+                                 center_arfcn: int, offset_to_carrier_rb: int = 0) -> PointAResult:
+        """
+        Calculate Point A and return it as a compact result record
+        
+        Args:
+            band: 5G NR band (e.g., 'n77')
+            scs_khz: Subcarrier spacing in kHz
+            bandwidth_mhz: Channel bandwidth in MHz
+            center_arfcn: Center ARFCN of the carrier
+            offset_to_carrier_rb: offsetToCarrier in RB units (default: 0)
+            
+        Returns:
+            PointAResult with the inputs, N_RB, Point A ARFCN and frequency
+            
+        Raises:
+            ValueError: If invalid parameters provided
+        """
+        state = self._state
+        n_rb, point_a_arfcn = self._point_a(state, band, scs_khz, bandwidth_mhz, center_arfcn,
+                                            offset_to_carrier_rb)
+        return PointAResult(band, scs_khz, bandwidth_mhz, center_arfcn, offset_to_carrier_rb,
+                            n_rb, point_a_arfcn,
+                            _arfcn_to_frequency(state, point_a_arfcn))
+    
+    def calculate_carrier_layout(self, band: str, scs_khz: int, bandwidth_mhz: int,
+                                 center_arfcn: int, offset_to_carrier_rb: int = 0,
+                                 ssb_arfcn: Optional[int] = None, coreset_zero: Optional[int] = None,
+                                 ssb_scs_khz: Optional[int] = None,
+                                 pdcch_scs_khz: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Calculate the full carrier layout in a single pass
+        Based on 3GPP TS 38.104, TS 38.211 Section 7.4.3.1 and TS 38.213 Section 13
         
-        # Step 4: Convert Point A frequency back to ARFCN
-        # Using inverse of ARFCN to frequency formula
-        freq_ref_offset = band_info['freq_ref_offset']  # MHz
-        delta_f_global = band_info['delta_f_global']    # kHz
-        arfcn_offset = band_info['arfcn_offset']        # N_REF_Offs
+        Chain: center → Point A → carrier start/end → SSB offset (offsetToPointA,
+        k_SSB) → CORESET#0. The band is resolved once and all positions are
+        computed in integer kHz relative to Point A; frequencies in MHz are
+        only produced for the output.
         
-        point_a_arfcn = round((point_a_freq_mhz - freq_ref_offset) * 1000 / delta_f_global + arfcn_offset)
+        Args:
+            band: 5G NR band (e.g., 'n77')
+            scs_khz: Carrier subcarrier spacing in kHz
+            bandwidth_mhz: Channel bandwidth in MHz
+            center_arfcn: Center ARFCN of the carrier
+            offset_to_carrier_rb: offsetToCarrier in RB units (default: 0)
+            ssb_arfcn: absoluteFrequencySSB (default: no SSB/CORESET#0 quantities)
+            coreset_zero: controlResourceSetZero index (requires ssb_arfcn)
+            ssb_scs_khz: SSB subcarrier spacing in kHz, one of the band's SSB SCS
+                         (default: the carrier SCS if the band allows it for SSBs,
+                         else the band's lowest SSB SCS)
+            pdcch_scs_khz: subCarrierSpacingCommon in kHz (default: carrier SCS)
+            
+        Returns:
+            Dictionary of derived quantities: 'n_rb', 'point_a_arfcn',
+            'carrier_start_arfcn', 'carrier_end_arfcn' and the matching '*_freq_mhz'
+            values; with an SSB also 'ssb_scs_khz', 'ssb_freq_mhz', 'offset_to_point_a',
+            'k_ssb', 'ssb_in_carrier'; with CORESET#0 also 'coreset0_n_rb',
+            'coreset0_symbols', 'coreset0_offset_rb', 'coreset0_start_crb',
+            'coreset0_start_freq_mhz', 'coreset0_in_carrier'
+            
+        Raises:
+            ValueError: If invalid parameters provided, the SSB SCS is not allowed in
+                        the band, the SSB is below Point A or off its subcarrier
+                        grid, or the CORESET#0 index is invalid
+        """
+        layout = self.calculate_carrier_layout_batch(band, scs_khz, bandwidth_mhz, center_arfcn,
+                                                     offset_to_carrier_rb, ssb_arfcn, coreset_zero,
+                                                     ssb_scs_khz, pdcch_scs_khz)
+        return {name: value.item() for name, value in layout.items()}
+    
+    def solve_center_arfcn(self, band: str, point_a_arfcn: int,
+                           offset_to_carrier_rb: int = 0) -> List[Dict[str, int]]:
+        """
+        Find every carrier configuration that produces a given Point A
         
-        return point_a_arfcn
+        Inverse of calculate_point_a_arfcn. For each SCS/bandwidth supported by
+        the band the center ARFCN follows in closed form,
+        center = Point A + N_RB × 6 × SCS + offsetToCarrier × 12 × SCS (in kHz),
+        converted back on the raster containing the center. Configurations whose
+        channel (center ± bandwidth / 2, guard bands included) would extend
+        outside the band's downlink range are dropped.
         
+        Args:
+            band: 5G NR band (e.g., 'n77')
+            point_a_arfcn: Target Point A ARFCN
+            offset_to_carrier_rb: offsetToCarrier in RB units (default: 0)
+            
+        Returns:
+            List of dictionaries with 'scs_khz', 'bandwidth_mhz', 'n_rb' and
+            'center_arfcn', ordered by SCS then bandwidth
+            
+        Raises:
+            ValueError: If invalid band, Point A ARFCN or offsetToCarrier
+        """
+        solutions = self.solve_center_arfcn_batch(band, point_a_arfcn, offset_to_carrier_rb)
+        return [{'scs_khz': scs_khz, 'bandwidth_mhz': bandwidth_mhz, 'n_rb': n_rb,
+                 'center_arfcn': center_arfcn}
+                for scs_khz, bandwidth_mhz, n_rb, center_arfcn in zip(
+                    solutions['scs_khz'].tolist(), solutions['bandwidth_mhz'].tolist(),
+                    solutions['n_rb'].tolist(), solutions['center_arfcn'].tolist())]
+    
     def calculate_point_a_arfcn_fdd(self, band: str, scs_khz: int, bandwidth_mhz: int, 
                                    dl_center_arfcn: int, ul_center_arfcn: int,
                                    offset_to_carrier_rb: int = 0) -> Tuple[int, int]:
@@ -96,14 +528,7 @@ class FrequencyCalculator:
         Raises:
             ValueError: If invalid parameters provided
         """
-        # Validate inputs
-        if not is_valid_scs(band, scs_khz):
-            raise ValueError(f"Invalid SCS {scs_khz} kHz for band {band}")
-        
-        if not is_valid_bandwidth(band, bandwidth_mhz):
-            raise ValueError(f"Invalid bandwidth {bandwidth_mhz} MHz for band {band}")
-        
-        # Calculate DL Point A
+        # Calculate DL Point A (validates the inputs)
         dl_point_a = self.calculate_point_a_arfcn(
             band, scs_khz, bandwidth_mhz, dl_center_arfcn, 0, offset_to_carrier_rb
         )
@@ -129,35 +554,28 @@ class FrequencyCalculator:
             
         Returns:
             UL Point A ARFCN
+            
+        Raises:
+            ValueError: If invalid parameters provided
         """
-        # Get band information
-        band_info = get_band_info(band)
-        
-        # Convert UL center ARFCN to frequency (MHz)
-        # For UL, we need to use UL frequency calculation
-        freq_ref_offset = band_info['freq_ref_offset']
-        delta_f_global = band_info['delta_f_global']
-        arfcn_offset = band_info.get('ul_arfcn_offset', band_info['arfcn_offset'])
+        state = self._state
+        band_idx, n_rb = _resolve_carrier(state, band, scs_khz, bandwidth_mhz, ul_center_arfcn,
+                                          offset_to_carrier_rb)
+        delta_f_global = state.band_delta_f_global[band_idx]
         
-        ul_center_freq_mhz = freq_ref_offset + (delta_f_global * (ul_center_arfcn - arfcn_offset) / 1000.0)
-        
-        # Calculate HalfGrid
-        n_rb = get_max_rb(scs_khz, bandwidth_mhz)
-        half_grid_khz = (n_rb * 12 * scs_khz) / 2
-        
-        # Calculate UL Point A frequency
-        ul_point_a_freq_mhz = ul_center_freq_mhz - (half_grid_khz / 1000.0)
-        
-        # Convert back to ARFCN
-        ul_point_a_arfcn = round((ul_point_a_freq_mhz - freq_ref_offset) * 1000 / delta_f_global + arfcn_offset)
-        
-        return ul_point_a_arfcn
+        # UL ARFCNs are numbered from the band's UL N_REF_Offs on the same raster step,
+        # so HalfGrid and offsetToCarrier subtract in Δf_global steps as on the DL
+        return ul_center_arfcn - (n_rb * 6 * scs_khz +
+                                  offset_to_carrier_rb * 12 * scs_khz) // delta_f_global
     
     def arfcn_to_frequency(self, band: str, arfcn: int) -> float:
         """
         Convert ARFCN to frequency in MHz
         Based on 3GPP TS 38.104 Section 5.4.2.1
         
+        The raster parameters come from the global raster range containing the
+        ARFCN; the band is only validated.
+        
         Args:
             band: 5G NR band (e.g., 'n77')
             arfcn: ARFCN value
@@ -168,7 +586,7 @@ class FrequencyCalculator:
         Raises:
             ValueError: If invalid band or ARFCN
         """
-        band_info = get_band_info(band)
+        state = self._state
         
         # Formula: F_REF = F_REF_Offs + Δf_global(N_REF - N_REF_Offs) / 1000
         # Where:
@@ -176,14 +594,8 @@ class FrequencyCalculator:
         # - Δf_global: Global frequency grid step (kHz) 
         # - N_REF: NR-ARFCN
         # - N_REF_Offs: ARFCN offset
-        
-        freq_ref_offset = band_info['freq_ref_offset']  # MHz
-        delta_f_global = band_info['delta_f_global']    # kHz
-        arfcn_offset = band_info['arfcn_offset']        # N_REF_Offs
-        
-        frequency = freq_ref_offset + (delta_f_global * (arfcn - arfcn_offset) / 1000.0)
-        
-        return frequency
+        _band_position(state, band)
+        return _arfcn_to_frequency(state, arfcn)
     
     def get_band_info(self, band: str) -> Dict[str, Any]:
         """
@@ -200,16 +612,455 @@ class FrequencyCalculator:
         """
         return get_band_info(band)
     
-    # TODO: Implement SSB and GSCN related methods later
+    def classify_point_a_batch(self, bands: BandLike, scs_khz: ArrayLike,
+                               bandwidth_mhz: ArrayLike, center_arfcn: ArrayLike,
+                               offset_to_carrier_rb: ArrayLike = 0) -> np.ndarray:
+        """
+        Validate Point A inputs row by row without raising
+        
+        Checks are applied in the same order as calculate_point_a_arfcn, so each
+        row gets the code of the error the scalar method would raise.
+        
+        Args:
+            bands: Band identifier or array of band identifiers
+            scs_khz: Subcarrier spacing(s) in kHz
+            bandwidth_mhz: Channel bandwidth(s) in MHz
+            center_arfcn: Center ARFCN(s) of the carriers
+            offset_to_carrier_rb: offsetToCarrier(s) in RB units (default: 0)
+            
+        Returns:
+            int8 array of validation codes (band_data.VALID, INVALID_BAND, ...)
+        """
+        return self._point_a_lookup(self._state, bands, scs_khz, bandwidth_mhz, center_arfcn,
+                                    offset_to_carrier_rb)[0]
+    
+    def calculate_point_a_arfcn_batch(self, bands: BandLike, scs_khz: ArrayLike,
+                                      bandwidth_mhz: ArrayLike, center_arfcn: ArrayLike,
+                                      offset_to_carrier_rb: ArrayLike = 0) -> np.ndarray:
+        """
+        Vectorized Point A ARFCN calculation for many carriers at once
+        
+        Inputs are broadcast against each other, so a single band or SCS can be
+        combined with arrays of center ARFCNs. The calculation is done in integer
+        kHz on the same rasters as arfcn_to_frequency (the global raster range
+        of each ARFCN), so the result matches
+        calculate_point_a_arfcn exactly without a float round-trip.
+        
+        Args:
+            bands: Band identifier or array of band identifiers
+            scs_khz: Subcarrier spacing(s) in kHz
+            bandwidth_mhz: Channel bandwidth(s) in MHz
+            center_arfcn: Center ARFCN(s) of the carriers
+            offset_to_carrier_rb: offsetToCarrier(s) in RB units (default: 0)
+            
+        Returns:
+            int64 array of Point A ARFCNs
+            
+        Raises:
+            ValueError: If any row is invalid (message of the first invalid row)
+        """
+        state = self._state
+        codes, band_arr, scs, bw, center, offset, band_idx, n_rb = self._point_a_lookup(
+            state, bands, scs_khz, bandwidth_mhz, center_arfcn, offset_to_carrier_rb
+        )
+        _raise_first_invalid(codes, band_arr, scs, bw, center, offset)
+        
+        # Center minus HalfGrid and offsetToCarrier in kHz, back on the raster of Point A
+        point_a_khz = (_arfcn_to_khz(state, center) -
+                       n_rb * 6 * scs - offset * 12 * scs)
+        return _khz_to_arfcn(state, point_a_khz)[0]
+    
+    def calculate_point_a_result_set(self, bands: BandLike, scs_khz: ArrayLike,
+                                     bandwidth_mhz: ArrayLike, center_arfcn: ArrayLike,
+                                     offset_to_carrier_rb: ArrayLike = 0) -> PointAResultSet:
+        """
+        Vectorized Point A calculation returning a compact struct-of-arrays result set
+        
+        Returns:
+            PointAResultSet with one (flattened) row per broadcast input row
+            
+        Raises:
+            ValueError: If any row is invalid (message of the first invalid row)
+        """
+        point_a = self.calculate_point_a_arfcn_batch(bands, scs_khz, bandwidth_mhz, center_arfcn,
+                                                     offset_to_carrier_rb)
+        return PointAResultSet.from_arrays(self, bands, scs_khz, bandwidth_mhz, center_arfcn,
+                                           point_a, offset_to_carrier_rb)
+    
+    def _point_a_lookup(self, state: _TableState, bands: BandLike, scs_khz: ArrayLike,
+                        bandwidth_mhz: ArrayLike, center_arfcn: ArrayLike,
+                        offset_to_carrier_rb: ArrayLike = 0) -> Tuple[np.ndarray, ...]:
+        """
+        Broadcast Point A inputs and resolve them against the compiled tables
+        
+        Returns:
+            Tuple of (validation codes, bands, SCS, bandwidths, center ARFCNs,
+            offsetToCarrier, band table indexes, N_RB); indexes and N_RB are 0
+            on invalid rows
+        """
+        band_arr, scs, bw, center, offset = np.broadcast_arrays(
+            np.asarray(bands, dtype=str), np.asarray(scs_khz, dtype=np.int64),
+            np.asarray(bandwidth_mhz, dtype=np.int64), np.asarray(center_arfcn, dtype=np.int64),
+            np.asarray(offset_to_carrier_rb, dtype=np.int64)
+        )
+        tables = state.tables
+        band_idx = self._band_codes(state, band_arr, strict=False)
+        scs_idx, scs_found = _table_index(tables['scs_values'], scs)
+        bw_idx, bw_found = _table_index(tables['bandwidth_values'], bw)
+        band_ok = band_idx >= 0
+        band_idx = np.where(band_ok, band_idx, 0)
+        
+        # Validation and N_RB in one read of the band x SCS x bandwidth matrix
+        n_rb = np.where(band_ok & scs_found & bw_found,
+                        tables['n_rb'][band_idx, scs_idx, bw_idx], 0).astype(np.int64)
+        rb_ok = n_rb > 0
+        arfcn_ok = (center >= tables['raster_arfcn_low'][0]) & \
+            (center <= tables['raster_arfcn_high'][-1])
+        offset_ok = (offset >= 0) & (offset <= MAX_OFFSET_TO_CARRIER_RB)
+        
+        codes = np.where(rb_ok, np.where(arfcn_ok, np.where(offset_ok, VALID,
+                                                            INVALID_OFFSET_TO_CARRIER),
+                                         INVALID_ARFCN), UNSUPPORTED_BANDWIDTH).astype(np.int8)
+        if not rb_ok.all():
+            # Only invalid combinations need the per-check breakdown
+            bad = ~rb_ok
+            bad_band, bad_scs, bad_bw = band_idx[bad], scs_idx[bad], bw_idx[bad]
+            scs_ok = band_ok[bad] & scs_found[bad] & tables['band_scs_mask'][bad_band, bad_scs]
+            bw_ok = bw_found[bad] & tables['band_bandwidth_mask'][bad_band, bad_bw]
+            codes[bad] = np.select([~band_ok[bad], ~scs_ok, ~bw_ok],
+                                   [INVALID_BAND, INVALID_SCS, INVALID_BANDWIDTH],
+                                   UNSUPPORTED_BANDWIDTH)
+        return codes, band_arr, scs, bw, center, offset, band_idx, n_rb
+    
+    def calculate_carrier_layout_batch(self, bands: BandLike, scs_khz: ArrayLike,
+                                       bandwidth_mhz: ArrayLike, center_arfcn: ArrayLike,
+                                       offset_to_carrier_rb: ArrayLike = 0,
+                                       ssb_arfcn: Optional[ArrayLike] = None,
+                                       coreset_zero: Optional[ArrayLike] = None,
+                                       ssb_scs_khz: Optional[ArrayLike] = None,
+                                       pdcch_scs_khz: Optional[ArrayLike] = None
+                                       ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized form of calculate_carrier_layout
+        
+        Arguments broadcast against each other like calculate_point_a_arfcn_batch;
+        ssb_arfcn and coreset_zero apply to all rows when given.
+        
+        Returns:
+            Dictionary of quantity name to numpy array (see calculate_carrier_layout)
+            
+        Raises:
+            ValueError: If any row is invalid (message of the first invalid row)
+        """
+        state = self._state
+        tables = state.tables
+        codes, band_arr, scs, bw, center, offset, band_idx, n_rb = self._point_a_lookup(
+            state, bands, scs_khz, bandwidth_mhz, center_arfcn, offset_to_carrier_rb
+        )
+        _raise_first_invalid(codes, band_arr, scs, bw, center, offset)
+        
+        point_a_khz, layout = _carrier_layout(
+            _arfcn_to_khz(state, center), n_rb, scs, offset,
+            lambda frequency_khz: _khz_to_arfcn(state, frequency_khz)
+        )
+        
+        if ssb_arfcn is None:
+            if coreset_zero is not None:
+                raise ValueError("CORESET#0 requires the SSB ARFCN")
+            return layout
+        
+        shape = center.shape
+        ssb = np.broadcast_to(np.asarray(ssb_arfcn, dtype=np.int64), shape)
+        ssb_scs = self._ssb_scs(state, band_arr, band_idx, scs, ssb_scs_khz)
+        pdcch_scs = np.broadcast_to(np.asarray(scs if pdcch_scs_khz is None else pdcch_scs_khz,
+                                               dtype=np.int64), shape)
+        fr2 = tables['band_fr2'][band_idx]
+        carrier_start_khz = offset * 12 * scs
+        carrier_width_khz = n_rb * 12 * scs
+        ssb_low_khz, ssb_valid = _ssb_layout(
+            layout, point_a_khz, _arfcn_to_khz(state, ssb), ssb_scs,
+            np.where(fr2, pdcch_scs, 15), np.where(fr2, 720, 180), carrier_start_khz,
+            carrier_width_khz
+        )
+        if not ssb_valid.all():
+            row = np.flatnonzero(~ssb_valid.ravel())[0]
+            raise ValueError(f"SSB ARFCN {ssb.ravel()[row]} is below Point A or off its "
+                             f"subcarrier grid")
+        
+        if coreset_zero is not None:
+            index = np.broadcast_to(np.asarray(coreset_zero, dtype=np.int64), shape)
+            pairs = tables['coreset_zero_scs_pairs']
+            pair_idx = np.zeros(shape, dtype=np.int64)
+            pair_found = np.zeros(shape, dtype=bool)
+            for i, (pair_ssb, pair_pdcch) in enumerate(pairs.tolist()):
+                match = (ssb_scs == pair_ssb) & (pdcch_scs == pair_pdcch)
+                pair_idx[match] = i
+                pair_found |= match
+            index_ok = (index >= 0) & (index < tables['coreset_zero'].shape[1])
+            entry = tables['coreset_zero'][pair_idx, np.where(index_ok, index, 0)]
+            valid = pair_found & index_ok & (entry[..., 0] > 0)
+            if not valid.all():
+                row = np.flatnonzero(~valid.ravel())[0]
+                get_coreset_zero(int(ssb_scs.ravel()[row]), int(pdcch_scs.ravel()[row]),
+                                 int(index.ravel()[row]))
+            _coreset_zero_layout(layout, point_a_khz, ssb_low_khz, pdcch_scs,
+                                 entry[..., 0].astype(np.int64), entry[..., 1].astype(np.int64),
+                                 entry[..., 2].astype(np.int64), carrier_start_khz,
+                                 carrier_width_khz)
+        
+        return layout
+    
+    def resolve_ssb_scs_batch(self, bands: BandLike, scs_khz: ArrayLike,
+                              ssb_scs_khz: Optional[ArrayLike] = None) -> np.ndarray:
+        """
+        Vectorized SSB SCS of carriers, defaulted as in calculate_carrier_layout
+        
+        Args:
+            bands: Band identifier(s)
+            scs_khz: Carrier subcarrier spacing(s) in kHz
+            ssb_scs_khz: SSB subcarrier spacing(s) in kHz (default: the carrier
+                         SCS where the band allows it for SSBs, else the band's
+                         lowest SSB SCS)
+            
+        Returns:
+            int64 array of SSB SCS in kHz, broadcast over bands and scs_khz
+            
+        Raises:
+            ValueError: If any band is unknown or an explicit SSB SCS is not
+                        allowed in its band
+        """
+        state = self._state
+        band_arr, scs = np.broadcast_arrays(np.asarray(bands, dtype=str),
+                                            np.asarray(scs_khz, dtype=np.int64))
+        return self._ssb_scs(state, band_arr, self._band_codes(state, band_arr), scs,
+                             ssb_scs_khz)
+    
+    def _ssb_scs(self, state: _TableState, band_arr: np.ndarray, band_idx: np.ndarray,
+                 scs: np.ndarray, ssb_scs_khz: Optional[ArrayLike]) -> np.ndarray:
+        """
+        Resolve the SSB SCS of every row against the band's SSB SCS list
+        
+        Returns:
+            int64 array of SSB SCS in kHz, shaped like scs
+            
+        Raises:
+            ValueError: If an explicit SSB SCS is not allowed in its band
+        """
+        tables = state.tables
+        ssb_mask = tables['band_ssb_scs_mask']
+        if ssb_scs_khz is None:
+            # Carrier SCS where the band allows it for SSBs, else the band's lowest SSB SCS
+            scs_idx, _ = _table_index(tables['scs_values'], scs)
+            lowest = tables['scs_values'][ssb_mask.argmax(axis=1)][band_idx]
+            return np.where(ssb_mask[band_idx, scs_idx], scs, lowest)
+        
+        ssb_scs = np.broadcast_to(np.asarray(ssb_scs_khz, dtype=np.int64), scs.shape)
+        ssb_idx, found = _table_index(tables['scs_values'], ssb_scs)
+        invalid = ~(found & ssb_mask[band_idx, ssb_idx])
+        if invalid.any():
+            row = np.flatnonzero(invalid.ravel())[0]
+            raise ValueError(f"Invalid SSB SCS {ssb_scs.ravel()[row]} kHz for band "
+                             f"{band_arr.ravel()[row]}")
+        return ssb_scs
+    
+    def solve_center_arfcn_batch(self, bands: BandLike, point_a_arfcn: ArrayLike,
+                                 offset_to_carrier_rb: ArrayLike = 0) -> Dict[str, np.ndarray]:
+        """
+        Vectorized form of solve_center_arfcn
+        
+        Every query row is expanded over the compiled SCS x bandwidth axes at
+        once; the valid solutions are returned flattened in the same order as
+        the scalar method, tagged with the (flattened) query row they answer.
+        
+        Args:
+            bands: Band identifier(s)
+            point_a_arfcn: Target Point A ARFCN(s)
+            offset_to_carrier_rb: offsetToCarrier(s) in RB units (default: 0)
+            
+        Returns:
+            Dictionary with 'row', 'scs_khz', 'bandwidth_mhz', 'n_rb' and
+            'center_arfcn' arrays, one entry per solution
+            
+        Raises:
+            ValueError: If any band, Point A ARFCN or offsetToCarrier is invalid
+        """
+        band_arr, point_a, offset = (column.ravel() for column in np.broadcast_arrays(
+            np.asarray(bands, dtype=str), np.asarray(point_a_arfcn, dtype=np.int64),
+            np.asarray(offset_to_carrier_rb, dtype=np.int64)
+        ))
+        state = self._state
+        tables = state.tables
+        band_idx = self._band_codes(state, band_arr)
+        raster_low, raster_high = tables['raster_arfcn_low'][0], tables['raster_arfcn_high'][-1]
+        outside = (point_a < raster_low) | (point_a > raster_high)
+        if outside.any():
+            raise ValueError(f"ARFCN {point_a[outside][0]} outside the global frequency raster")
+        bad_offset = (offset < 0) | (offset > MAX_OFFSET_TO_CARRIER_RB)
+        if bad_offset.any():
+            raise ValueError(f"Invalid offsetToCarrier {offset[bad_offset][0]} RB")
+        
+        # Axes: (query row, SCS, bandwidth)
+        scs = tables['scs_values'][None, :, None]
+        bandwidth = tables['bandwidth_values'][None, None, :]
+        n_rb = tables['n_rb'].astype(np.int64)[band_idx]
+        point_a_khz = _arfcn_to_khz(state, point_a)
+        
+        carrier_start_khz = point_a_khz[:, None, None] + offset[:, None, None] * 12 * scs
+        center, center_khz = _khz_to_arfcn(state, carrier_start_khz + n_rb * 6 * scs)
+        # The channel, not just the RB span, has to fit into the band
+        valid = ((n_rb > 0) &
+                 (center_khz - bandwidth * 500 >=
+                  tables['dl_freq_low_khz'][band_idx][:, None, None]) &
+                 (center_khz + bandwidth * 500 <=
+                  tables['dl_freq_high_khz'][band_idx][:, None, None]) &
+                 (center <= raster_high))
+        
+        row, scs_idx, bw_idx = np.nonzero(valid)
+        return {
+            'row': row,
+            'scs_khz': tables['scs_values'][scs_idx],
+            'bandwidth_mhz': tables['bandwidth_values'][bw_idx],
+            'n_rb': n_rb[row, scs_idx, bw_idx],
+            'center_arfcn': center[row, scs_idx, bw_idx],
+        }
+    
+    def arfcn_to_frequency_batch(self, bands: Optional[BandLike], arfcns: ArrayLike) -> np.ndarray:
+        """
+        Vectorized ARFCN to frequency conversion
+        
+        The global raster range of every ARFCN is found by binary search over
+        the range partition, so mixed FR1/FR2 batches convert in one pass.
+        
+        Args:
+            bands: Band identifier(s), or None to convert on the global raster only
+            arfcns: ARFCN value(s)
+            
+        Returns:
+            float64 array of frequencies in MHz
+            
+        Raises:
+            ValueError: If any band is unknown or any ARFCN is outside the global raster
+        """
+        state = self._state
+        tables = state.tables
+        arfcn = np.asarray(arfcns, dtype=np.int64)
+        if bands is not None:
+            band_arr, arfcn = np.broadcast_arrays(np.asarray(bands, dtype=str), arfcn)
+            self._band_codes(state, band_arr)
+        
+        range_idx = np.searchsorted(tables['raster_arfcn_low'], arfcn, side='right') - 1
+        outside = (range_idx < 0) | (arfcn > tables['raster_arfcn_high'][range_idx])
+        range_idx = range_idx.clip(0)
+        freq_ref_offset = tables['raster_freq_ref_offset'][range_idx]
+        delta_f_global = tables['raster_delta_f_global'][range_idx]
+        arfcn_offset = tables['raster_arfcn_offset'][range_idx]
+        
+        if outside.any():
+            raise ValueError(f"ARFCN {arfcn[outside].ravel()[0]} outside the global frequency raster")
+        
+        # Same operation order as arfcn_to_frequency so results are identical
+        return freq_ref_offset + (delta_f_global * (arfcn - arfcn_offset) / 1000.0)
+    
+    def frequency_to_arfcn_batch(self, frequency_khz: ArrayLike) -> np.ndarray:
+        """
+        Vectorized frequency to ARFCN conversion, the inverse of arfcn_to_frequency_batch
+        
+        N_REF = N_REF_Offs + (F_REF - F_REF_Offs) / Δf_global in integer kHz,
+        rounded down for frequencies between two raster points.
+        
+        Args:
+            frequency_khz: Frequency (frequencies) in kHz
+            
+        Returns:
+            int64 array of ARFCNs
+            
+        Raises:
+            ValueError: If any frequency is outside the global raster
+        """
+        state = self._state
+        frequency = np.asarray(frequency_khz, dtype=np.int64)
+        arfcn, _ = _khz_to_arfcn(state, frequency)
+        highest_khz = _arfcn_to_khz(state, state.tables['raster_arfcn_high'][-1:])[0]
+        outside = (frequency < state.raster_freq_ref_khz[0]) | (frequency > highest_khz)
+        if outside.any():
+            raise ValueError(f"Frequency {frequency[outside].ravel()[0] / 1000.0} MHz outside the "
+                             f"global frequency raster")
+        return arfcn
+    
+    def _band_codes(self, state: _TableState, band_arr: np.ndarray,
+                    strict: bool = True) -> np.ndarray:
+        """
+        Map an array of band identifiers to row indexes of the compiled tables
+        
+        Args:
+            state: Table state the indexes refer to
+            band_arr: Array of band identifiers
+            strict: Raise on unknown bands instead of mapping them to -1
+        
+        Raises:
+            ValueError: If strict and any band is unknown
+        """
+        names, inverse = np.unique(band_arr, return_inverse=True)
+        lookup = np.empty(len(names), dtype=np.int64)
+        for i, name in enumerate(names.tolist()):
+            if strict and name not in state.band_index:
+                raise ValueError(f"Unknown band: {name}")
+            lookup[i] = state.band_index.get(name, -1)
+        return lookup[inverse].reshape(band_arr.shape)
+    
+    # TODO: Implement SSB candidate calculation later
     def calculate_ssb_candidates(self, band: str, scs_khz: int, bandwidth_mhz: int,
                                 center_arfcn: int, coreset_zero: int) -> List[Tuple[int, int]]:
         """SSB candidate calculation - to be implemented"""
         raise NotImplementedError("SSB candidate calculation not implemented yet")
     
     def arfcn_to_gscn(self, band: str, arfcn: int) -> int:
-        """ARFCN to GSCN conversion - to be implemented"""
-        raise NotImplementedError("ARFCN to GSCN conversion not implemented yet")
+        """
+        Convert an SSB ARFCN to GSCN
+        Based on 3GPP TS 38.104 Section 5.4.3.1
+        
+        Args:
+            band: 5G NR band (e.g., 'n77')
+            arfcn: ARFCN of the SSB center (SS_REF)
+            
+        Returns:
+            GSCN
+            
+        Raises:
+            ValueError: If invalid band or ARFCN, or the ARFCN is not on the
+                        synchronization raster
+        """
+        frequency_khz = round(self.arfcn_to_frequency(band, arfcn) * 1000)
+        gscn = int(frequency_khz_to_gscn(frequency_khz))
+        if gscn < 0:
+            raise ValueError(f"ARFCN {arfcn} is not on the synchronization raster")
+        
+        return gscn
     
     def gscn_to_arfcn(self, band: str, gscn: int) -> int:
-        """GSCN to ARFCN conversion - to be implemented"""
-        raise NotImplementedError("GSCN to ARFCN conversion not implemented yet")
\ No newline at end of file
+        """
+        Convert a GSCN to the ARFCN of its SS_REF frequency
+        Based on 3GPP TS 38.104 Section 5.4.3.1
+        
+        Args:
+            band: 5G NR band (e.g., 'n77')
+            gscn: GSCN value
+            
+        Returns:
+            ARFCN
+            
+        Raises:
+            ValueError: If invalid band or GSCN
+        """
+        frequency_khz = int(gscn_to_frequency_khz(gscn))
+        state = self._state
+        _band_position(state, band)
+        # Global raster range whose frequency span contains SS_REF
+        index = max(bisect.bisect_right(state.raster_freq_lows, frequency_khz) - 1, 0)
+        arfcn_high, (_, freq_ref_khz, delta_f_global, arfcn_offset) = state.raster_ranges[index]
+        if (frequency_khz < freq_ref_khz or
+                (frequency_khz - freq_ref_khz) // delta_f_global + arfcn_offset > arfcn_high):
+            raise ValueError(f"Frequency {frequency_khz / 1000.0} MHz outside the global "
+                             f"frequency raster")
+        
+        return (frequency_khz - freq_ref_khz) // delta_f_global + arfcn_offset
@@ -0,0 +1,170 @@
+"""
+Neighbor-cell measurement object planner
+Derives the deduplicated SSB frequencies each cell has to measure from a
+site adjacency graph and the carrier configuration of every cell
+"""
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .frequency_calculator import FrequencyCalculator, ArrayLike
+
+# Columns of the cell table passed to the planner ('ssb_scs_khz' is optional)
+CELL_COLUMNS = ('cell_id', 'site_id', 'band', 'scs_khz', 'bandwidth_mhz', 'center_arfcn',
+                'ssb_arfcn')
+
+# Source sites expanded per output chunk
+DEFAULT_CHUNK_SITES = 20000
+
+
+def plan_measurement_object_chunks(calc: FrequencyCalculator, cells: Dict[str, ArrayLike],
+                                   site_edges: ArrayLike,
+                                   chunk_sites: int = DEFAULT_CHUNK_SITES
+                                   ) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Plan measurement objects per cell, streamed as columnar chunks
+
+    A cell measures every SSB frequency (ARFCN, SCS and band) used by a cell
+    on its own site or on an adjacent site. The band is part of the key, so
+    overlapping bands (n48 inside n77) on one ARFCN stay separate objects.
+    Cells are grouped into sites and SSB frequencies, and the site graph is
+    expanded over a CSR site -> frequency index with numpy, so no Python
+    code runs per edge. Output is produced for chunk_sites source sites at
+    a time.
+
+    Args:
+        calc: Calculator used to validate the carriers and place the SSBs
+        cells: Columns of the cell table (see CELL_COLUMNS); 'ssb_scs_khz'
+               defaults per cell as in FrequencyCalculator.calculate_carrier_layout
+        site_edges: (E, 2) array of adjacent site id pairs (undirected);
+                    edges to sites without cells are ignored
+        chunk_sites: Number of source sites per yielded chunk
+
+    Returns:
+        Iterator over dictionaries of equal-length arrays 'cell_id',
+        'ssb_arfcn', 'ssb_scs_khz', 'ssb_freq_mhz', 'band' and 'serving'
+        (True for the cell's own SSB frequency), grouped by cell
+
+    Raises:
+        ValueError: If a column is missing, a carrier is invalid or its SSB
+                    is not on the carrier's subcarrier grid
+    """
+    missing = [name for name in CELL_COLUMNS if name not in cells]
+    if missing:
+        raise ValueError(f"Missing cell columns: {', '.join(missing)}")
+    if chunk_sites < 1:
+        raise ValueError(f"Invalid chunk size {chunk_sites}")
+
+    cell_id = np.asarray(cells['cell_id'])
+    bands = np.asarray(cells['band'], dtype=str)
+    scs = np.asarray(cells['scs_khz'], dtype=np.int64)
+    ssb_arfcn = np.asarray(cells['ssb_arfcn'], dtype=np.int64)
+    layout = calc.calculate_carrier_layout_batch(bands, scs, cells['bandwidth_mhz'],
+                                                 cells['center_arfcn'], ssb_arfcn=ssb_arfcn,
+                                                 ssb_scs_khz=cells.get('ssb_scs_khz'))
+    ssb_scs = layout['ssb_scs_khz']
+
+    # Group cells into SSB frequencies (ordered by ARFCN) and sites
+    band_names, band_code = np.unique(bands, return_inverse=True)
+    freq_keys, first_cell, cell_freq = np.unique(
+        np.stack([ssb_arfcn, ssb_scs, band_code.reshape(-1)], axis=1), axis=0,
+        return_index=True, return_inverse=True)
+    cell_freq = cell_freq.reshape(-1)
+    freq_arfcn, freq_scs = freq_keys[:, 0], freq_keys[:, 1]
+    freq_mhz = layout['ssb_freq_mhz'][first_cell]
+    freq_band = band_names[freq_keys[:, 2]]
+    site_ids, cell_site = np.unique(np.asarray(cells['site_id']), return_inverse=True)
+    num_sites, num_freqs = len(site_ids), len(freq_keys)
+
+    site_freq_ptr, site_freq = _group_pairs(cell_site, cell_freq, num_sites, num_freqs)
+    edge_ptr, edge_dst = _site_graph(site_ids, site_edges)
+    cell_order = np.argsort(cell_site, kind='stable')
+    cell_ptr = np.searchsorted(cell_site[cell_order], np.arange(num_sites + 1))
+
+    for start in range(0, num_sites, chunk_sites):
+        stop = min(start + chunk_sites, num_sites)
+
+        # Frequencies reachable from each source site: union over its neighbors
+        edge_src, edge_site = _expand(edge_ptr, edge_dst, np.arange(start, stop))
+        reach_src, reach_freq = _expand(site_freq_ptr, site_freq, edge_site, edge_src)
+        reach_ptr, reach = _group_pairs(reach_src - start, reach_freq, stop - start, num_freqs)
+
+        # One row per (cell, reachable frequency)
+        chunk_cells = cell_order[cell_ptr[start]:cell_ptr[stop]]
+        row_cell, row_freq = _expand(reach_ptr, reach, cell_site[chunk_cells] - start, chunk_cells)
+        yield {
+            'cell_id': cell_id[row_cell],
+            'ssb_arfcn': freq_arfcn[row_freq],
+            'ssb_scs_khz': freq_scs[row_freq],
+            'ssb_freq_mhz': freq_mhz[row_freq],
+            'band': freq_band[row_freq],
+            'serving': row_freq == cell_freq[row_cell],
+        }
+
+
+def plan_measurement_objects(calc: FrequencyCalculator, cells: Dict[str, ArrayLike],
+                             site_edges: ArrayLike,
+                             chunk_sites: int = DEFAULT_CHUNK_SITES) -> Iterator[Dict[str, Any]]:
+    """
+    Plan measurement objects per cell, streamed one cell at a time
+
+    Args:
+        calc: Calculator used to validate the carriers and place the SSBs
+        cells: Columns of the cell table (see CELL_COLUMNS)
+        site_edges: (E, 2) array of adjacent site id pairs
+        chunk_sites: Number of source sites processed at a time
+
+    Returns:
+        Iterator over dictionaries with 'cell_id' and 'measurement_objects', a
+        list of dictionaries with 'ssb_arfcn', 'ssb_scs_khz', 'ssb_freq_mhz',
+        'band' and 'serving', ordered by SSB ARFCN
+
+    Raises:
+        ValueError: See plan_measurement_object_chunks
+    """
+    fields = ('ssb_arfcn', 'ssb_scs_khz', 'ssb_freq_mhz', 'band', 'serving')
+    for chunk in plan_measurement_object_chunks(calc, cells, site_edges, chunk_sites):
+        cell_ids = chunk['cell_id']
+        if len(cell_ids) == 0:
+            continue
+        bounds = np.flatnonzero(cell_ids[1:] != cell_ids[:-1]) + 1
+        rows = list(zip(*(chunk[field].tolist() for field in fields)))
+        for begin, end in zip(np.r_[0, bounds].tolist(), np.r_[bounds, len(rows)].tolist()):
+            yield {'cell_id': cell_ids[begin].item(),
+                   'measurement_objects': [dict(zip(fields, row)) for row in rows[begin:end]]}
+
+
+def _group_pairs(rows: np.ndarray, values: np.ndarray, num_rows: int,
+                 num_values: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Deduplicate (row, value) pairs into a CSR index (row pointer, sorted values)"""
+    keys = np.sort(rows.astype(np.int64) * num_values + values)
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+    ptr = np.searchsorted(keys, np.arange(num_rows + 1, dtype=np.int64) * num_values)
+    return ptr, keys % num_values
+
+
+def _expand(ptr: np.ndarray, values: np.ndarray, rows: np.ndarray,
+            labels: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gather the CSR entries of many rows at once
+
+    Returns:
+        Tuple of (label of each gathered entry, entry values); labels default
+        to the queried rows
+    """
+    counts = ptr[rows + 1] - ptr[rows]
+    total = int(counts.sum())
+    offsets = np.repeat(ptr[rows] - (np.cumsum(counts) - counts), counts)
+    return np.repeat(rows if labels is None else labels, counts), values[offsets + np.arange(total)]
+
+
+def _site_graph(site_ids: np.ndarray, site_edges: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """Build the symmetric site adjacency (with self loops) as a CSR index"""
+    edges = np.asarray(site_edges).reshape(-1, 2)
+    index = np.searchsorted(site_ids, edges).clip(0, max(len(site_ids) - 1, 0))
+    known = (site_ids[index] == edges).all(axis=1) if len(site_ids) else np.zeros(len(edges), bool)
+    u, v = index[known, 0], index[known, 1]
+    loops = np.arange(len(site_ids))
+    return _group_pairs(np.concatenate([u, v, loops]), np.concatenate([v, u, loops]),
+                        len(site_ids), len(site_ids))
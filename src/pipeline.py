@@ -0,0 +1,471 @@
+"""
+Streaming pipeline for chained calculator stages
+Stages exchange column chunks (dictionaries of equal-length numpy arrays)
+through bounded queues, run in worker threads or processes, and report
+per-stage throughput and queue depth to find the bottleneck
+"""
+
+import csv
+import itertools
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+import numpy as np
+
+from .band_data import VALID
+from .band_scan import band_scan_positions
+from .batch_job import DEFAULT_CHUNK_ROWS, parse_carrier_chunk
+from .channel_edges import calculate_channel_edges_batch
+from .frequency_calculator import FrequencyCalculator
+
+Chunk = Dict[str, np.ndarray]
+
+DEFAULT_QUEUE_SIZE = 4
+
+# Columns written by the standard stages, in order
+PIPELINE_COLUMNS = ('band', 'scs_khz', 'bandwidth_mhz', 'center_arfcn', 'offset_to_carrier_rb',
+                    'status', 'point_a_arfcn', 'point_a_freq_mhz', 'ssb_gscn', 'ssb_in_channel',
+                    'guard_ok', 'conflict')
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+_POLL_SECONDS = 0.05
+
+
+class Stage:
+    """
+    One step of a pipeline
+
+    func(calc, chunk) returns the transformed chunk, or None to drop it.
+    Process stages run func in a pool of `workers` processes, each holding a
+    copy of the calculator sent once at start-up; func must then be a
+    module-level function. Thread stages share the caller's calculator.
+    """
+
+    def __init__(self, name: str, func: Callable[[FrequencyCalculator, Chunk], Optional[Chunk]],
+                 workers: int = 1, processes: bool = False):
+        if workers < 1:
+            raise ValueError(f"Invalid worker count {workers} for stage {name}")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.processes = processes
+
+    def __repr__(self) -> str:
+        kind = 'processes' if self.processes else 'threads'
+        return f"Stage({self.name!r}, {self.func.__name__}, {self.workers} {kind})"
+
+
+def run_pipeline(calc: FrequencyCalculator, source: Iterable[Chunk], stages: Sequence[Stage],
+                 sink: Callable[[Chunk], None],
+                 queue_size: int = DEFAULT_QUEUE_SIZE) -> Dict[str, Any]:
+    """
+    Stream chunks from source through the stages into sink
+
+    Every stage reads from a bounded queue, so a slow stage blocks the ones
+    before it (backpressure) instead of letting chunks pile up; the number of
+    chunks in flight is capped as well, so memory use depends on queue_size,
+    worker counts and chunk size, not on the input size. Chunks reach the
+    sink in source order. The first error in any stage stops the pipeline
+    and is re-raised.
+
+    Args:
+        calc: Calculator passed to the stage functions
+        source: Iterable of chunks (e.g., csv_chunks)
+        stages: Stages in processing order
+        sink: Called with every processed chunk, in source order
+        queue_size: Capacity of each queue between stages, in chunks
+
+    Returns:
+        Dictionary with 'elapsed_seconds', 'chunks', 'rows', 'bottleneck'
+        (name of the stage with the highest utilization) and 'stages', the
+        metrics of 'source', every stage and 'sink': 'workers', 'chunks',
+        'rows' (rows received), 'busy_seconds', 'utilization' (busy time per
+        worker over elapsed time), 'rows_per_second' (rows per busy
+        worker-second), 'blocked_seconds' (waiting on a full output queue),
+        'queue_depth_mean' and 'queue_depth_max' (input queue depth seen by
+        each read)
+
+    Raises:
+        ValueError: If the stage names are not unique or queue_size < 1
+    """
+    names = ['source'] + [stage.name for stage in stages] + ['sink']
+    if len(set(names)) != len(names):
+        raise ValueError(f"Stage names must be unique and not 'source' or 'sink': {names[1:-1]}")
+    if queue_size < 1:
+        raise ValueError(f"Invalid queue size {queue_size}")
+
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    in_flight = threading.Semaphore(queue_size * len(queues) + sum(s.workers for s in stages))
+    run = _Run(names, [1] + [stage.workers for stage in stages] + [1])
+    pools = [ProcessPoolExecutor(stage.workers, initializer=_init_worker, initargs=(calc,))
+             if stage.processes else None for stage in stages]
+
+    threads = [threading.Thread(target=run.guard, args=(_feed, source, queues[0], in_flight, run),
+                                name='pipeline-source', daemon=True)]
+    for i, stage in enumerate(stages):
+        call = _pool_call(pools[i], stage.func) if pools[i] else \
+            (lambda chunk, func=stage.func: func(calc, chunk))
+        for worker in range(stage.workers):
+            threads.append(threading.Thread(
+                target=run.guard, args=(_work, stage.name, call, queues[i], queues[i + 1], run),
+                name=f"pipeline-{stage.name}-{worker}", daemon=True))
+
+    start = time.perf_counter()
+    try:
+        for thread in threads:
+            thread.start()
+        run.guard(_drain, queues[-1], sink, in_flight, run)
+    finally:
+        run.stop.set()
+        for thread in threads:
+            thread.join()
+        for pool in pools:
+            if pool is None:
+                continue
+            if sys.version_info >= (3, 9):
+                pool.shutdown(cancel_futures=True)
+            else:
+                pool.shutdown()  # Queued chunks still run; cancel_futures needs 3.9
+    if run.errors:
+        raise run.errors[0]
+    return run.report(time.perf_counter() - start)
+
+
+def csv_chunks(file: TextIO, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Chunk]:
+    """
+    Read a carrier CSV (see batch_job.INPUT_COLUMNS) as chunks
+
+    Args:
+        file: Text file opened for reading, with a header row
+        chunk_rows: Rows per chunk
+
+    Returns:
+        Iterator over chunks of the input columns, 'offset_to_carrier_rb' and
+        'site_id' if the file has one (see conflict_chunk)
+
+    Raises:
+        ValueError: If columns are missing or a value is malformed
+    """
+    columns = file.readline().strip().split(',')
+    for index in itertools.count():
+        lines = list(itertools.islice(file, chunk_rows))
+        if not lines:
+            return
+        yield parse_carrier_chunk(columns, ''.join(lines).encode('utf-8'), index)
+
+
+class CsvSink:
+    """Pipeline sink writing chunks as CSV rows"""
+
+    def __init__(self, file: TextIO, columns: Sequence[str] = PIPELINE_COLUMNS):
+        """
+        Args:
+            file: Text file opened for writing
+            columns: Chunk columns to write, in order (header row written first)
+        """
+        self.columns = tuple(columns)
+        self.rows = 0
+        self._writer = csv.writer(file)
+        self._writer.writerow(self.columns)
+
+    def __call__(self, chunk: Chunk) -> None:
+        values = [np.round(chunk[name], 3) if chunk[name].dtype.kind == 'f' else chunk[name]
+                  for name in self.columns]
+        self._writer.writerows(zip(*(column.tolist() for column in values)))
+        self.rows += len(values[0]) if values else 0
+
+
+def validate_chunk(calc: FrequencyCalculator, chunk: Chunk) -> Chunk:
+    """Stage adding the validation code 'status' (band_data.VALID, INVALID_BAND, ...)"""
+    status = calc.classify_point_a_batch(chunk['band'], chunk['scs_khz'], chunk['bandwidth_mhz'],
+                                         chunk['center_arfcn'], chunk['offset_to_carrier_rb'])
+    return dict(chunk, status=status)
+
+
+def point_a_chunk(calc: FrequencyCalculator, chunk: Chunk) -> Chunk:
+    """Stage adding 'point_a_arfcn' and 'point_a_freq_mhz' (-1 / NaN for invalid rows)"""
+    valid = chunk['status'] == VALID
+    point_a = np.full(len(valid), -1, dtype=np.int64)
+    freq = np.full(len(valid), np.nan)
+    point_a[valid] = calc.calculate_point_a_arfcn_batch(
+        *(chunk[name][valid] for name in ('band', 'scs_khz', 'bandwidth_mhz', 'center_arfcn',
+                                          'offset_to_carrier_rb')))
+    freq[valid] = calc.arfcn_to_frequency_batch(chunk['band'][valid], point_a[valid])
+    return dict(chunk, point_a_arfcn=point_a, point_a_freq_mhz=freq)
+
+
+def ssb_chunk(calc: FrequencyCalculator, chunk: Chunk) -> Chunk:
+    """
+    Stage adding 'ssb_gscn', the band's synchronization raster position
+    (band_scan.band_scan_positions) closest to the carrier center, and
+    'ssb_in_channel', whether an SS/PBCH block there fits in the channel
+
+    The SSB SCS defaults per carrier as in calculate_carrier_layout. Invalid
+    rows, and bands without a position for their SSB SCS, get -1 / False.
+    """
+    valid = np.flatnonzero(chunk['status'] == VALID)
+    band = chunk['band'][valid]
+    center_khz = np.rint(calc.arfcn_to_frequency_batch(band, chunk['center_arfcn'][valid]) *
+                         1000).astype(np.int64)
+    ssb_scs = calc.resolve_ssb_scs_batch(band, chunk['scs_khz'][valid])
+    channel_half_khz = 500 * chunk['bandwidth_mhz'][valid]
+
+    gscn = np.full(len(chunk['status']), -1, dtype=np.int64)
+    in_channel = np.zeros(len(chunk['status']), dtype=bool)
+    groups, group = np.unique(np.char.add(np.char.add(band, '/'), ssb_scs.astype(str)),
+                              return_inverse=True)
+    for i, key in enumerate(groups.tolist()):
+        name, scs = key.rsplit('/', 1)
+        positions = band_scan_positions(name, int(scs))
+        if len(positions['gscn']) == 0:
+            continue
+        rows = group.reshape(-1) == i
+        freq_khz = positions['frequency_khz']
+        # Nearest position: the first one at or above the center, or the one below it
+        index = np.searchsorted(freq_khz, center_khz[rows]).clip(0, len(freq_khz) - 1)
+        below = (index - 1).clip(0)
+        index = np.where(center_khz[rows] - freq_khz[below] <= freq_khz[index] - center_khz[rows],
+                         below, index)
+        gscn[valid[rows]] = positions['gscn'][index]
+        in_channel[valid[rows]] = (np.abs(freq_khz[index] - center_khz[rows]) +
+                                   120 * ssb_scs[rows] <= channel_half_khz[rows])
+    return dict(chunk, ssb_gscn=gscn, ssb_in_channel=in_channel)
+
+
+def guard_chunk(calc: FrequencyCalculator, chunk: Chunk) -> Chunk:
+    """Stage adding 'guard_ok', the minimum guard band check of channel_edges (False if invalid)"""
+    valid = chunk['status'] == VALID
+    guard_ok = np.zeros(len(valid), dtype=bool)
+    if valid.any():
+        guard_ok[valid] = calculate_channel_edges_batch(
+            calc, *(chunk[name][valid] for name in ('band', 'scs_khz', 'bandwidth_mhz',
+                                                    'center_arfcn', 'offset_to_carrier_rb'))
+        )['guard_ok']
+    return dict(chunk, guard_ok=guard_ok)
+
+
+def conflict_chunk(calc: FrequencyCalculator, chunk: Chunk) -> Chunk:
+    """
+    Stage adding 'conflict', True for a valid carrier whose channel (center ±
+    bandwidth / 2) overlaps the channel of another valid carrier of its site
+
+    Sites come from the optional 'site_id' column; without it every carrier
+    is a site of its own. Carriers are only compared within a chunk, so a
+    site's carriers have to arrive in one chunk to be checked against each
+    other.
+    """
+    status = chunk['status']
+    valid = np.flatnonzero(status == VALID)
+    conflict = np.zeros(len(status), dtype=bool)
+    if 'site_id' not in chunk or len(valid) < 2:
+        return dict(chunk, conflict=conflict)
+
+    center_khz = np.rint(calc.arfcn_to_frequency_batch(chunk['band'][valid],
+                                                       chunk['center_arfcn'][valid]) *
+                         1000).astype(np.int64)
+    half_khz = 500 * chunk['bandwidth_mhz'][valid].astype(np.int64)
+    _, site = np.unique(chunk['site_id'][valid], return_inverse=True)
+    site = site.reshape(-1)
+
+    # Sort by site, then low edge; lift every site above the previous one so
+    # running maxima never carry over from one site to the next
+    order = np.lexsort((center_khz - half_khz, site))
+    base = (center_khz - half_khz).min()
+    span = int((center_khz + half_khz).max() - base) + 1
+    low = site[order] * span + (center_khz - half_khz)[order] - base
+    high = site[order] * span + (center_khz + half_khz)[order] - base
+    # A carrier overlaps an earlier one if it starts below their highest upper
+    # edge, and a later one if the next carrier (lowest later start) starts
+    # below its own upper edge
+    overlaps = np.zeros(len(order), dtype=bool)
+    overlaps[1:] = low[1:] < np.maximum.accumulate(high)[:-1]
+    overlaps[:-1] |= low[1:] < high[:-1]
+    conflict[valid[order]] = overlaps
+    return dict(chunk, conflict=conflict)
+
+
+def standard_stages(workers: int = 1, processes: bool = False) -> List[Stage]:
+    """
+    Get the validate -> Point A -> SSB/GSCN -> guard band -> conflict check stages
+
+    Args:
+        workers: Workers per stage
+        processes: Run the stages in worker processes instead of threads
+
+    Returns:
+        List of stages producing PIPELINE_COLUMNS
+    """
+    return [Stage(name, func, workers, processes) for name, func in
+            (('validate', validate_chunk), ('point_a', point_a_chunk), ('ssb', ssb_chunk),
+             ('guard', guard_chunk), ('conflict', conflict_chunk))]
+
+
+class _Run:
+    """Shared state of one pipeline run: stop flag, first errors and stage metrics"""
+
+    def __init__(self, names: List[str], workers: List[int]):
+        self.stop = threading.Event()
+        self.errors = []
+        self._lock = threading.Lock()
+        self._metrics = {name: {'workers': count, 'chunks': 0, 'rows': 0, 'busy_seconds': 0.0,
+                                'blocked_seconds': 0.0, 'depth_total': 0, 'queue_depth_max': 0}
+                         for name, count in zip(names, workers)}
+        self._running = dict(zip(names, workers))
+
+    def guard(self, target: Callable, *args: Any) -> None:
+        """Run a pipeline loop, recording its error and stopping the other loops"""
+        try:
+            target(*args)
+        except BaseException as error:
+            with self._lock:
+                self.errors.append(error)
+            self.stop.set()
+
+    def record(self, name: str, rows: int, busy: float, blocked: float, depth: int) -> None:
+        """Add one processed chunk to a stage's metrics"""
+        with self._lock:
+            metrics = self._metrics[name]
+            metrics['chunks'] += 1
+            metrics['rows'] += rows
+            metrics['busy_seconds'] += busy
+            metrics['blocked_seconds'] += blocked
+            metrics['depth_total'] += depth
+            metrics['queue_depth_max'] = max(metrics['queue_depth_max'], depth)
+
+    def worker_done(self, name: str) -> bool:
+        """Count a stage worker as finished; True for the last one"""
+        with self._lock:
+            self._running[name] -= 1
+            return self._running[name] == 0
+
+    def put(self, target: queue.Queue, item: Any) -> float:
+        """Put an item on a bounded queue unless stopped; returns the time blocked"""
+        start = time.perf_counter()
+        while not self.stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_SECONDS)
+                break
+            except queue.Full:
+                pass
+        return time.perf_counter() - start
+
+    def get(self, source: queue.Queue) -> Any:
+        """Get the next item, _DONE once stopped"""
+        while not self.stop.is_set():
+            try:
+                return source.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                pass
+        return _DONE
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """Summarize the metrics of a finished run"""
+        stages = {}
+        for name, metrics in self._metrics.items():
+            busy = metrics['busy_seconds']
+            stages[name] = {
+                'workers': metrics['workers'],
+                'chunks': metrics['chunks'],
+                'rows': metrics['rows'],
+                'busy_seconds': busy,
+                'utilization': busy / (elapsed * metrics['workers']) if elapsed else 0.0,
+                'rows_per_second': metrics['rows'] / busy if busy else 0.0,
+                'blocked_seconds': metrics['blocked_seconds'],
+                'queue_depth_mean': metrics['depth_total'] / metrics['chunks']
+                if metrics['chunks'] else 0.0,
+                'queue_depth_max': metrics['queue_depth_max'],
+            }
+        return {
+            'elapsed_seconds': elapsed,
+            'chunks': stages['sink']['chunks'],
+            'rows': stages['sink']['rows'],
+            'bottleneck': max(stages, key=lambda name: stages[name]['utilization']),
+            'stages': stages,
+        }
+
+
+def _rows(chunk: Optional[Chunk]) -> int:
+    """Number of rows of a chunk"""
+    return len(next(iter(chunk.values()))) if chunk else 0
+
+
+def _feed(source: Iterable[Chunk], target: queue.Queue, in_flight: threading.Semaphore,
+          run: _Run) -> None:
+    """Number the source chunks and put them on the first queue"""
+    chunks = iter(source)
+    for seq in itertools.count():
+        while not in_flight.acquire(timeout=_POLL_SECONDS):
+            if run.stop.is_set():
+                return
+        start = time.perf_counter()
+        chunk = next(chunks, _DONE)
+        busy = time.perf_counter() - start
+        if chunk is _DONE:
+            run.put(target, _DONE)
+            return
+        run.record('source', _rows(chunk), busy, run.put(target, (seq, chunk)), 0)
+
+
+def _work(name: str, call: Callable[[Chunk], Optional[Chunk]], source: queue.Queue,
+          target: queue.Queue, run: _Run) -> None:
+    """Worker loop of a stage; the last worker to finish passes the end marker on"""
+    while True:
+        depth = source.qsize()
+        item = run.get(source)
+        if item is _DONE:
+            if not run.stop.is_set():
+                run.put(target if run.worker_done(name) else source, _DONE)
+            return
+        seq, chunk = item
+        start = time.perf_counter()
+        result = call(chunk) if chunk is not None else None
+        busy = time.perf_counter() - start
+        run.record(name, _rows(chunk), busy, run.put(target, (seq, result)), depth)
+
+
+def _drain(source: queue.Queue, sink: Callable[[Chunk], None], in_flight: threading.Semaphore,
+           run: _Run) -> None:
+    """Hand chunks to the sink in source order"""
+    pending = {}
+    next_seq = 0
+    while True:
+        depth = source.qsize()
+        item = run.get(source)
+        if item is _DONE:
+            return
+        seq, chunk = item
+        pending[seq] = chunk
+        while next_seq in pending:
+            chunk = pending.pop(next_seq)
+            start = time.perf_counter()
+            if chunk is not None:
+                sink(chunk)
+            run.record('sink', _rows(chunk), time.perf_counter() - start, 0.0, depth)
+            in_flight.release()
+            next_seq += 1
+
+
+_worker_calc = None
+
+
+def _init_worker(calc: FrequencyCalculator) -> None:
+    """Process pool initializer keeping the calculator for the stage calls"""
+    global _worker_calc
+    _worker_calc = calc
+
+
+def _call_in_worker(func: Callable[[FrequencyCalculator, Chunk], Optional[Chunk]],
+                    chunk: Chunk) -> Optional[Chunk]:
+    """Run a stage function in a worker process"""
+    return func(_worker_calc, chunk)
+
+
+def _pool_call(pool: ProcessPoolExecutor,
+               func: Callable[[FrequencyCalculator, Chunk], Optional[Chunk]]) -> Callable:
+    """Call a stage function in a process pool, blocking the calling stage thread"""
+    return lambda chunk: pool.submit(_call_in_worker, func, chunk).result()
@@ -0,0 +1,191 @@
+"""
+SQLite-backed store for computed Point A results
+Keeps batch results around for reporting and range queries
+"""
+
+import sqlite3
+from typing import Dict, Optional
+
+import numpy as np
+
+from .frequency_calculator import FrequencyCalculator, ArrayLike, BandLike
+
+# Column order used for inserts and query results
+RESULT_COLUMNS = ('band', 'scs_khz', 'bandwidth_mhz', 'center_arfcn',
+                  'point_a_arfcn', 'frequency_mhz')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS point_a_results (
+    band TEXT NOT NULL,
+    scs_khz INTEGER NOT NULL,
+    bandwidth_mhz INTEGER NOT NULL,
+    center_arfcn INTEGER NOT NULL,
+    point_a_arfcn INTEGER NOT NULL,
+    frequency_mhz REAL NOT NULL
+);
+-- Covering indexes: range queries per band are answered from the index alone
+CREATE INDEX IF NOT EXISTS idx_results_band_point_a
+    ON point_a_results (band, point_a_arfcn, frequency_mhz, center_arfcn, scs_khz, bandwidth_mhz);
+CREATE INDEX IF NOT EXISTS idx_results_band_frequency
+    ON point_a_results (band, frequency_mhz, point_a_arfcn, center_arfcn, scs_khz, bandwidth_mhz);
+"""
+
+_COLUMN_DTYPES = {
+    'band': str,
+    'scs_khz': np.int64,
+    'bandwidth_mhz': np.int64,
+    'center_arfcn': np.int64,
+    'point_a_arfcn': np.int64,
+    'frequency_mhz': np.float64,
+}
+
+
+class ResultStore:
+    """
+    Persistent store of Point A calculation results
+
+    Rows are bulk-inserted with executemany inside a single transaction and
+    the database runs in WAL mode, so ingest is limited by SQLite itself
+    rather than per-row Python overhead.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        """
+        Open (or create) a result store
+
+        Args:
+            path: SQLite database path (default: in-memory database)
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> 'ResultStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        self._conn.close()
+
+    def insert_batch(self, bands: BandLike, scs_khz: ArrayLike, bandwidth_mhz: ArrayLike,
+                     center_arfcn: ArrayLike, point_a_arfcn: ArrayLike,
+                     frequency_mhz: ArrayLike) -> int:
+        """
+        Bulk-insert computed results in one transaction
+
+        Args:
+            bands: Band identifier(s)
+            scs_khz: Subcarrier spacing(s) in kHz
+            bandwidth_mhz: Channel bandwidth(s) in MHz
+            center_arfcn: Center ARFCN(s)
+            point_a_arfcn: Point A ARFCN(s)
+            frequency_mhz: Point A frequency(ies) in MHz
+
+        Returns:
+            Number of rows inserted
+        """
+        columns = np.broadcast_arrays(
+            np.asarray(bands, dtype=str), np.asarray(scs_khz, dtype=np.int64),
+            np.asarray(bandwidth_mhz, dtype=np.int64), np.asarray(center_arfcn, dtype=np.int64),
+            np.asarray(point_a_arfcn, dtype=np.int64), np.asarray(frequency_mhz, dtype=np.float64)
+        )
+        # tolist() converts to native Python values in C, far cheaper than per-element casts
+        rows = zip(*(column.ravel().tolist() for column in columns))
+
+        with self._conn:
+            self._conn.executemany(
+                'INSERT INTO point_a_results VALUES (?, ?, ?, ?, ?, ?)', rows
+            )
+        return columns[0].size
+
+    def compute_and_insert(self, calc: FrequencyCalculator, bands: BandLike, scs_khz: ArrayLike,
+                           bandwidth_mhz: ArrayLike, center_arfcn: ArrayLike) -> int:
+        """
+        Calculate Point A for a batch of carriers and store the results
+
+        Args:
+            calc: Calculator used for the batch calculation
+            bands: Band identifier(s)
+            scs_khz: Subcarrier spacing(s) in kHz
+            bandwidth_mhz: Channel bandwidth(s) in MHz
+            center_arfcn: Center ARFCN(s)
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            ValueError: If any row has invalid parameters (nothing is inserted)
+        """
+        point_a = calc.calculate_point_a_arfcn_batch(bands, scs_khz, bandwidth_mhz, center_arfcn)
+        frequency = calc.arfcn_to_frequency_batch(bands, point_a)
+        return self.insert_batch(bands, scs_khz, bandwidth_mhz, center_arfcn, point_a, frequency)
+
+    def query_point_a_range(self, band: str, low_arfcn: int,
+                            high_arfcn: int) -> Dict[str, np.ndarray]:
+        """
+        Get all stored carriers of a band with Point A ARFCN in [low, high]
+
+        Args:
+            band: Band identifier (e.g., 'n77')
+            low_arfcn: Lowest Point A ARFCN (inclusive)
+            high_arfcn: Highest Point A ARFCN (inclusive)
+
+        Returns:
+            Dictionary of column name to numpy array, ordered by Point A ARFCN
+        """
+        return self._query(
+            'WHERE band = ? AND point_a_arfcn BETWEEN ? AND ? ORDER BY point_a_arfcn',
+            (band, int(low_arfcn), int(high_arfcn))
+        )
+
+    def query_frequency_range(self, band: str, low_mhz: float,
+                              high_mhz: float) -> Dict[str, np.ndarray]:
+        """
+        Get all stored carriers of a band with Point A frequency in [low, high]
+
+        Args:
+            band: Band identifier (e.g., 'n77')
+            low_mhz: Lowest Point A frequency in MHz (inclusive)
+            high_mhz: Highest Point A frequency in MHz (inclusive)
+
+        Returns:
+            Dictionary of column name to numpy array, ordered by frequency
+        """
+        return self._query(
+            'WHERE band = ? AND frequency_mhz BETWEEN ? AND ? ORDER BY frequency_mhz',
+            (band, float(low_mhz), float(high_mhz))
+        )
+
+    def count(self, band: Optional[str] = None) -> int:
+        """
+        Count stored results
+
+        Args:
+            band: Only count this band (default: all bands)
+
+        Returns:
+            Number of stored rows
+        """
+        if band is None:
+            cursor = self._conn.execute('SELECT COUNT(*) FROM point_a_results')
+        else:
+            cursor = self._conn.execute('SELECT COUNT(*) FROM point_a_results WHERE band = ?',
+                                        (band,))
+        return cursor.fetchone()[0]
+
+    def _query(self, where: str, params: tuple) -> Dict[str, np.ndarray]:
+        """Run a SELECT over all result columns and return columnar numpy arrays"""
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(RESULT_COLUMNS)} FROM point_a_results {where}", params
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return {name: np.array([], dtype=_COLUMN_DTYPES[name]) for name in RESULT_COLUMNS}
+
+        return {name: np.array(column, dtype=_COLUMN_DTYPES[name])
+                for name, column in zip(RESULT_COLUMNS, zip(*rows))}
@@ -0,0 +1,282 @@
+"""
+Compact result objects for Point A calculations
+A __slots__ record for scalar results and a struct-of-arrays collection for
+batches, so large result sets cost a few bytes per row instead of one Python
+object per row
+"""
+
+import csv
+from typing import Any, Dict, Iterator, Optional, TextIO, Union
+
+import numpy as np
+
+# Columns exported by PointAResultSet.to_arrays / write_csv, in order
+RESULT_SET_COLUMNS = ('band', 'scs_khz', 'bandwidth_mhz', 'center_arfcn', 'offset_to_carrier_rb',
+                      'n_rb', 'point_a_arfcn', 'point_a_freq_mhz')
+
+
+class PointAResult:
+    """Point A result of one carrier"""
+
+    __slots__ = ('band', 'scs_khz', 'bandwidth_mhz', 'center_arfcn', 'offset_to_carrier_rb',
+                 'n_rb', 'point_a_arfcn', 'point_a_freq_mhz')
+
+    def __init__(self, band: str, scs_khz: int, bandwidth_mhz: int, center_arfcn: int,
+                 offset_to_carrier_rb: int, n_rb: int, point_a_arfcn: int,
+                 point_a_freq_mhz: float):
+        self.band = band
+        self.scs_khz = scs_khz
+        self.bandwidth_mhz = bandwidth_mhz
+        self.center_arfcn = center_arfcn
+        self.offset_to_carrier_rb = offset_to_carrier_rb
+        self.n_rb = n_rb
+        self.point_a_arfcn = point_a_arfcn
+        self.point_a_freq_mhz = point_a_freq_mhz
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"PointAResult({fields})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PointAResult):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary of field name to value"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PointAResultSet:
+    """
+    Struct-of-arrays collection of Point A results
+
+    Rows are stored as narrow numpy columns (band code, SCS, bandwidth,
+    center and Point A ARFCN, about 12 bytes per row); offsetToCarrier is only
+    stored when non-zero, and N_RB and frequencies are derived on access from
+    the calculator that produced the rows and the tables it used then.
+    Slicing and filtering return views or compact copies, never per-row
+    objects.
+    """
+
+    __slots__ = ('_calc', '_tables', '_band_code', 'scs_khz', 'bandwidth_mhz', 'center_arfcn',
+                 'point_a_arfcn', '_offset')
+
+    def __init__(self, calc: Any, band_code: np.ndarray, scs_khz: np.ndarray,
+                 bandwidth_mhz: np.ndarray, center_arfcn: np.ndarray, point_a_arfcn: np.ndarray,
+                 offset_to_carrier_rb: Optional[np.ndarray] = None,
+                 tables: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Wrap existing compact columns (see from_arrays to build from raw inputs)
+
+        Args:
+            calc: FrequencyCalculator the rows were calculated with
+            band_code: uint8 row index into the tables' 'band_names'
+            scs_khz: uint8 subcarrier spacings in kHz
+            bandwidth_mhz: uint16 channel bandwidths in MHz
+            center_arfcn: uint32 center ARFCNs
+            point_a_arfcn: uint32 Point A ARFCNs
+            offset_to_carrier_rb: uint16 offsetToCarrier values (None if all zero)
+            tables: Compiled tables the band codes refer to (default: calc.tables)
+        """
+        self._calc = calc
+        self._tables = calc.tables if tables is None else tables
+        self._band_code = band_code
+        self.scs_khz = scs_khz
+        self.bandwidth_mhz = bandwidth_mhz
+        self.center_arfcn = center_arfcn
+        self.point_a_arfcn = point_a_arfcn
+        self._offset = offset_to_carrier_rb
+
+    @classmethod
+    def from_arrays(cls, calc: Any, bands: Any, scs_khz: Any, bandwidth_mhz: Any,
+                    center_arfcn: Any, point_a_arfcn: Any,
+                    offset_to_carrier_rb: Any = 0) -> 'PointAResultSet':
+        """
+        Build a result set from (broadcastable) result columns
+
+        Args:
+            calc: FrequencyCalculator the rows were calculated with
+
+        Raises:
+            ValueError: If a band is unknown to the calculator
+        """
+        columns = np.broadcast_arrays(np.asarray(bands, dtype=str), np.asarray(scs_khz),
+                                      np.asarray(bandwidth_mhz), np.asarray(center_arfcn),
+                                      np.asarray(point_a_arfcn), np.asarray(offset_to_carrier_rb))
+        band_arr, scs, bw, center, point_a, offset = (column.ravel() for column in columns)
+
+        tables = calc.tables
+        band_codes = {name: i for i, name in enumerate(tables['band_names'].tolist())}
+        names, inverse = np.unique(band_arr, return_inverse=True)
+        for name in names.tolist():
+            if name not in band_codes:
+                raise ValueError(f"Unknown band: {name}")
+        codes = np.array([band_codes[name] for name in names.tolist()], dtype=np.uint8)
+
+        return cls(calc, codes[inverse], scs.astype(np.uint8), bw.astype(np.uint16),
+                   center.astype(np.uint32), point_a.astype(np.uint32),
+                   offset.astype(np.uint16) if offset.any() else None, tables)
+
+    def __len__(self) -> int:
+        return len(self.point_a_arfcn)
+
+    def __getitem__(self, index: Any) -> Union[PointAResult, 'PointAResultSet']:
+        """Get one row as a PointAResult, or a slice / index array / mask as a result set"""
+        if isinstance(index, (int, np.integer)):
+            row = self[np.array([index])]
+            return next(iter(row))
+        return PointAResultSet(self._calc, self._band_code[index], self.scs_khz[index],
+                               self.bandwidth_mhz[index], self.center_arfcn[index],
+                               self.point_a_arfcn[index],
+                               None if self._offset is None else self._offset[index],
+                               self._tables)
+
+    def __iter__(self) -> Iterator[PointAResult]:
+        """Iterate over rows as PointAResult records (created on the fly)"""
+        for chunk in self.iter_chunks():
+            columns = chunk.to_arrays()
+            for row in zip(*(columns[name].tolist() for name in RESULT_SET_COLUMNS)):
+                yield PointAResult(*row)
+
+    def __getstate__(self) -> tuple:
+        # The tables are a read-only mapping proxy, which does not pickle
+        return tuple(dict(self._tables) if name == '_tables' else getattr(self, name)
+                     for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator['PointAResultSet']:
+        """Iterate over consecutive row ranges as result set views"""
+        for start in range(0, len(self), chunk_size):
+            yield self[start:start + chunk_size]
+
+    @property
+    def band(self) -> np.ndarray:
+        """Band names"""
+        return self._tables['band_names'][self._band_code]
+
+    @property
+    def offset_to_carrier_rb(self) -> np.ndarray:
+        """offsetToCarrier values in RB units"""
+        if self._offset is None:
+            return np.zeros(len(self), dtype=np.uint16)
+        return self._offset
+
+    @property
+    def n_rb(self) -> np.ndarray:
+        """Maximum RB numbers from the band x SCS x bandwidth table of the tables"""
+        tables = self._tables
+        scs_idx = np.searchsorted(tables['scs_values'], self.scs_khz)
+        bw_idx = np.searchsorted(tables['bandwidth_values'], self.bandwidth_mhz)
+        return tables['n_rb'][self._band_code, scs_idx, bw_idx].astype(np.int64)
+
+    @property
+    def point_a_freq_mhz(self) -> np.ndarray:
+        """Point A frequencies in MHz, converted by the producing calculator"""
+        return self._calc.arfcn_to_frequency_batch(self.band, self.point_a_arfcn.astype(np.int64))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the stored columns"""
+        columns = [self._band_code, self.scs_khz, self.bandwidth_mhz, self.center_arfcn,
+                   self.point_a_arfcn] + ([] if self._offset is None else [self._offset])
+        return sum(column.nbytes for column in columns)
+
+    def filter(self, mask: np.ndarray) -> 'PointAResultSet':
+        """
+        Get the rows where mask is True
+
+        Args:
+            mask: Boolean array with one entry per row
+
+        Returns:
+            Compact result set of the selected rows
+        """
+        return self[np.asarray(mask, dtype=bool)]
+
+    def select(self, band: Optional[str] = None, scs_khz: Optional[int] = None,
+               bandwidth_mhz: Optional[int] = None) -> 'PointAResultSet':
+        """
+        Get the rows matching all given band / SCS / bandwidth values
+
+        Returns:
+            Compact result set of the selected rows (empty for an unknown band)
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if band is not None:
+            codes = np.flatnonzero(self._tables['band_names'] == band)
+            mask &= self._band_code == (codes[0] if len(codes) else -1)
+        if scs_khz is not None:
+            mask &= self.scs_khz == scs_khz
+        if bandwidth_mhz is not None:
+            mask &= self.bandwidth_mhz == bandwidth_mhz
+        return self.filter(mask)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Export all columns (see RESULT_SET_COLUMNS) as numpy arrays"""
+        return {
+            'band': self.band,
+            'scs_khz': self.scs_khz.astype(np.int64),
+            'bandwidth_mhz': self.bandwidth_mhz.astype(np.int64),
+            'center_arfcn': self.center_arfcn.astype(np.int64),
+            'offset_to_carrier_rb': self.offset_to_carrier_rb.astype(np.int64),
+            'n_rb': self.n_rb,
+            'point_a_arfcn': self.point_a_arfcn.astype(np.int64),
+            'point_a_freq_mhz': self.point_a_freq_mhz,
+        }
+
+    def write_csv(self, file: TextIO, chunk_size: int = 65536) -> int:
+        """
+        Export to CSV chunk by chunk
+
+        Args:
+            file: Text file opened for writing
+            chunk_size: Rows converted per chunk
+
+        Returns:
+            Number of rows written
+        """
+        writer = csv.writer(file)
+        writer.writerow(RESULT_SET_COLUMNS)
+        for chunk in self.iter_chunks(chunk_size):
+            columns = chunk.to_arrays()
+            writer.writerows(zip(*(columns[name].tolist() for name in RESULT_SET_COLUMNS)))
+        return len(self)
+
+    def save(self, path: str) -> None:
+        """Save the compact columns to an .npz file"""
+        arrays = {'band_code': self._band_code, 'scs_khz': self.scs_khz,
+                  'bandwidth_mhz': self.bandwidth_mhz, 'center_arfcn': self.center_arfcn,
+                  'point_a_arfcn': self.point_a_arfcn}
+        if self._offset is not None:
+            arrays['offset_to_carrier_rb'] = self._offset
+        np.savez(path, band_names=self._tables['band_names'], **arrays)
+
+    @classmethod
+    def load(cls, path: str, calc: Any) -> 'PointAResultSet':
+        """
+        Load a result set saved with save
+
+        Args:
+            path: File written by save
+            calc: FrequencyCalculator to derive N_RB and frequencies with
+
+        Raises:
+            ValueError: If the file was written with a different band order
+        """
+        with np.load(path) as data:
+            if data['band_names'].tolist() != calc.tables['band_names'].tolist():
+                raise ValueError(f"Band table of {path} does not match the calculator's bands")
+            return cls(calc, data['band_code'], data['scs_khz'], data['bandwidth_mhz'],
+                       data['center_arfcn'], data['point_a_arfcn'],
+                       data['offset_to_carrier_rb'] if 'offset_to_carrier_rb' in data else None)
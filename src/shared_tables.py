@@ -0,0 +1,181 @@
+"""
+Shared-memory band tables for multi-process consumers
+A parent process publishes the compiled band tables once and worker
+processes attach to them read-only instead of building their own copies
+"""
+
+import json
+import struct
+import threading
+import weakref
+from multiprocessing import parent_process, resource_tracker, shared_memory
+from typing import Dict, Optional
+
+import numpy as np
+
+from .band_data import compile_band_tables, tables_version
+from .frequency_calculator import FrequencyCalculator
+
+# Segment layout: magic, version digest, directory length, JSON directory, aligned arrays
+SEGMENT_MAGIC = b'NRTBL001'
+_HEADER = struct.Struct('<8s32sI')
+_ALIGNMENT = 64
+
+# Names of the segments published by this process and not closed yet
+_PUBLISHED = set()
+_PUBLISHED_LOCK = threading.Lock()
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the array alignment"""
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class SharedBandTables:
+    """
+    Handle to a shared-memory segment holding compiled band tables
+
+    The arrays in `tables` are read-only views into the segment. Calculators
+    created from them keep the mapping alive, so closing the handle while
+    they are still in use is safe.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, tables: Dict[str, np.ndarray],
+                 owner: bool):
+        self._shm = shm
+        self.tables = tables
+        self.owner = owner
+
+    @property
+    def name(self) -> str:
+        """Name of the shared-memory segment (pass this to workers)"""
+        return self._shm.name
+
+    def calculator(self) -> FrequencyCalculator:
+        """Create a calculator backed by the shared tables"""
+        return FrequencyCalculator(tables=self.tables)
+
+    def close(self) -> None:
+        """
+        Detach from the segment, and remove it if this process published it
+
+        The segment name is removed at once, but the mapping stays valid for
+        as long as calculators (or other views) still use the tables; the
+        segment is closed when the last of them is garbage collected (see
+        _map_arrays).
+        """
+        self.tables = {}
+        if self.owner:
+            with _PUBLISHED_LOCK:
+                _PUBLISHED.discard(self._shm.name)
+            self._shm.unlink()
+
+    def __enter__(self) -> 'SharedBandTables':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def publish_tables(name: Optional[str] = None) -> SharedBandTables:
+    """
+    Compile the band tables and publish them into a new shared-memory segment
+
+    Args:
+        name: Segment name (default: generated by the OS)
+
+    Returns:
+        Owning handle; closing it unlinks the segment
+    """
+    tables = compile_band_tables()
+
+    directory = []
+    offset = 0
+    for table_name, array in tables.items():
+        directory.append({'name': table_name, 'dtype': array.dtype.str,
+                          'shape': list(array.shape), 'offset': offset})
+        offset = _align(offset + array.nbytes)
+    directory_bytes = json.dumps(directory).encode('utf-8')
+    data_start = _align(_HEADER.size + len(directory_bytes))
+
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(data_start + offset, 1))
+    _HEADER.pack_into(shm.buf, 0, SEGMENT_MAGIC, tables_version(), len(directory_bytes))
+    shm.buf[_HEADER.size:_HEADER.size + len(directory_bytes)] = directory_bytes
+
+    with _PUBLISHED_LOCK:
+        _PUBLISHED.add(shm.name)
+    shared = _map_arrays(shm, directory, data_start)
+    for table_name, array in tables.items():
+        shared[table_name].flags.writeable = True
+        shared[table_name][...] = array
+        shared[table_name].flags.writeable = False
+
+    return SharedBandTables(shm, shared, owner=True)
+
+
+def attach_tables(name: str) -> SharedBandTables:
+    """
+    Attach read-only to band tables published by another process
+
+    Args:
+        name: Segment name from SharedBandTables.name
+
+    Returns:
+        Non-owning handle; closing it leaves the segment in place
+
+    Raises:
+        ValueError: If the segment is not a band table segment or was published
+                    from different band data
+        FileNotFoundError: If no segment with this name exists
+    """
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers attached segments with the resource tracker,
+        # which would unlink the segment when this process exits. Processes
+        # started by multiprocessing share their parent's tracker, where the
+        # registration is the publisher's own, so only unrelated processes
+        # take it back.
+        shm = shared_memory.SharedMemory(name=name)
+        with _PUBLISHED_LOCK:
+            if shm.name not in _PUBLISHED and parent_process() is None:
+                resource_tracker.unregister(shm._name, 'shared_memory')
+
+    try:
+        magic, version, directory_len = _HEADER.unpack_from(shm.buf, 0)
+        if magic != SEGMENT_MAGIC:
+            raise ValueError(f"Shared memory segment {name} does not contain band tables")
+        if version != tables_version():
+            raise ValueError(f"Stale band tables in shared memory segment {name}")
+
+        directory = json.loads(bytes(shm.buf[_HEADER.size:_HEADER.size + directory_len]))
+        tables = _map_arrays(shm, directory, _align(_HEADER.size + directory_len))
+    except Exception:
+        shm.close()
+        raise
+
+    return SharedBandTables(shm, tables, owner=False)
+
+
+def _map_arrays(shm: shared_memory.SharedMemory, directory: list,
+                data_start: int) -> Dict[str, np.ndarray]:
+    """
+    Create read-only numpy views over the arrays described by the directory
+
+    Every view is a slice of one byte array over the segment, whose buffer
+    keeps the mapping alive. The segment handle is closed once that buffer
+    is released, i.e. when the last view (of any calculator) is gone.
+    """
+    raw = np.frombuffer(shm.buf, dtype=np.uint8)
+    finalizer = weakref.finalize(raw.base, shm.close)
+    finalizer.atexit = False
+
+    tables = {}
+    for entry in directory:
+        dtype = np.dtype(entry['dtype'])
+        start = data_start + entry['offset']
+        nbytes = int(np.prod(entry['shape'], dtype=np.int64)) * dtype.itemsize
+        array = raw[start:start + nbytes].view(dtype).reshape(entry['shape'])
+        array.flags.writeable = False
+        tables[entry['name']] = array
+    return tables
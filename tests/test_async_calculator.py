@@ -0,0 +1,153 @@
+"""
+Unit tests for the asyncio calculator facade
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.async_calculator import AsyncFrequencyCalculator
+from src.frequency_calculator import FrequencyCalculator
+
+
+class _TrackingCalculator(FrequencyCalculator):
+    """Calculator whose batch method is slow and records how many chunks overlap"""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def calculate_point_a_arfcn_batch(self, *args, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(self.delay)
+            return super().calculate_point_a_arfcn_batch(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+class TestAsyncFrequencyCalculator(unittest.TestCase):
+    """Test cases for inline and offloaded async calculations"""
+
+    def setUp(self):
+        """Set up a synchronous reference calculator and a private executor"""
+        self.calc = FrequencyCalculator()
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.centers = np.arange(650000, 651000)
+
+    def tearDown(self):
+        """Shut down the executor"""
+        self.executor.shutdown()
+
+    def test_inline_calls_match_sync(self):
+        """Test that small calls run inline and match the synchronous calculator"""
+        tracking = _TrackingCalculator()
+        async_calc = AsyncFrequencyCalculator(tracking, executor=self.executor)
+
+        async def run():
+            point_a = await async_calc.calculate_point_a_arfcn('n77', 30, 100, 650000)
+            batch = await async_calc.calculate_point_a_arfcn_batch('n77', 30, 100, self.centers)
+            return point_a, batch
+
+        point_a, batch = asyncio.run(run())
+        self.assertEqual(point_a, 646724)
+        np.testing.assert_array_equal(
+            batch, self.calc.calculate_point_a_arfcn_batch('n77', 30, 100, self.centers)
+        )
+        self.assertEqual(tracking.calls, 1)
+
+    def test_offloaded_batches_match_sync(self):
+        """Test that chunked batches merge back to the synchronous results"""
+        async_calc = AsyncFrequencyCalculator(executor=self.executor, offload_threshold=100,
+                                              chunk_size=64)
+        centers = self.centers.reshape(10, 100)
+
+        async def run():
+            return await asyncio.gather(
+                async_calc.calculate_point_a_arfcn_batch('n77', 30, [[100], [50]] * 5, centers),
+                async_calc.calculate_carrier_layout_batch('n77', 30, 100, centers),
+                async_calc.solve_center_arfcn_batch('n1', np.arange(431000, 431300)),
+                async_calc.arfcn_to_frequency_batch(None, self.centers),
+            )
+
+        point_a, layout, solutions, freqs = asyncio.run(run())
+        np.testing.assert_array_equal(
+            point_a, self.calc.calculate_point_a_arfcn_batch('n77', 30, [[100], [50]] * 5, centers)
+        )
+        expected_layout = self.calc.calculate_carrier_layout_batch('n77', 30, 100, centers)
+        for key, values in expected_layout.items():
+            np.testing.assert_array_equal(layout[key], values)
+        expected_solutions = self.calc.solve_center_arfcn_batch('n1', np.arange(431000, 431300))
+        for key, values in expected_solutions.items():
+            np.testing.assert_array_equal(solutions[key], values)
+        np.testing.assert_array_equal(freqs, self.calc.arfcn_to_frequency_batch(None, self.centers))
+
+    def test_offloaded_errors_match_sync(self):
+        """Test that the first invalid row raises the synchronous error message"""
+        async_calc = AsyncFrequencyCalculator(executor=self.executor, offload_threshold=10,
+                                              chunk_size=8)
+        bands = np.array(['n77'] * 50, dtype='<U4')
+        bands[30] = 'n999'
+
+        with self.assertRaisesRegex(ValueError, 'Unknown band: n999'):
+            asyncio.run(async_calc.calculate_point_a_arfcn_batch(bands, 30, 100, 650000))
+
+    def test_bounded_concurrency(self):
+        """Test that chunks of concurrent jobs never exceed max_concurrency"""
+        tracking = _TrackingCalculator(delay=0.01)
+        async_calc = AsyncFrequencyCalculator(tracking, executor=self.executor,
+                                              offload_threshold=10, chunk_size=100,
+                                              max_concurrency=2)
+
+        async def run():
+            return await asyncio.gather(*(
+                async_calc.calculate_point_a_arfcn_batch('n77', 30, 100, self.centers)
+                for _ in range(4)
+            ))
+
+        results = asyncio.run(run())
+        self.assertEqual(tracking.calls, 40)
+        self.assertLessEqual(tracking.max_running, 2)
+        self.assertEqual(len(results), 4)
+
+    def test_cancellation_stops_remaining_chunks(self):
+        """Test that cancelling a job stops it after the running chunk"""
+        tracking = _TrackingCalculator(delay=0.05)
+        async_calc = AsyncFrequencyCalculator(tracking, executor=self.executor,
+                                              offload_threshold=10, chunk_size=10)
+
+        async def run():
+            task = asyncio.create_task(
+                async_calc.calculate_point_a_arfcn_batch('n77', 30, 100, self.centers)
+            )
+            await asyncio.sleep(0.08)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        time.sleep(0.1)
+        self.assertLess(tracking.calls, 5)
+
+    def test_invalid_limits(self):
+        """Test that non-positive limits are rejected"""
+        with self.assertRaises(ValueError):
+            AsyncFrequencyCalculator(offload_threshold=0)
+        with self.assertRaises(ValueError):
+            AsyncFrequencyCalculator(max_concurrency=0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
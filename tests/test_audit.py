@@ -0,0 +1,136 @@
+"""
+Unit tests for the gNB configuration auditor
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from src.audit import audit_file, audit_files, parse_config_file
+
+JSON_DUMP = {
+    'cells': [
+        # n77 100 MHz: expected Point A 646724
+        {'cellId': 1, 'nrBand': 77, 'subcarrierSpacing': 30, 'carrierBandwidth': 273,
+         'arfcnDL': 650000, 'absoluteFrequencyPointA': 646724,
+         'absoluteFrequencySSB': 650000, 'offsetToCarrier': 0},
+        # Wrong Point A
+        {'cellId': 2, 'nrBand': 'n77', 'subcarrierSpacing': 'kHz30', 'carrierBandwidth': 273,
+         'arfcnDL': 650000, 'absoluteFrequencyPointA': 646700},
+        # SSB outside the carrier
+        {'cellId': 3, 'nrBand': 77, 'subcarrierSpacing': 30, 'carrierBandwidth': 273,
+         'arfcnDL': 650000, 'absoluteFrequencyPointA': 646724,
+         'absoluteFrequencySSB': 660000},
+        # carrierBandwidth that is no standard channel bandwidth
+        {'cellId': 4, 'nrBand': 1, 'subcarrierSpacing': 15, 'carrierBandwidth': 99,
+         'arfcnDL': 432000, 'absoluteFrequencyPointA': 431064},
+        # No arfcnDL: center solved from Point A
+        {'cellId': 5, 'nrBand': 77, 'subcarrierSpacing': 30, 'carrierBandwidth': 273,
+         'absoluteFrequencyPointA': 646724, 'absoluteFrequencySSB': 650000},
+        # SSB center (3797.01 MHz) inside the carrier, its upper edge (3800.61 MHz) not
+        {'cellId': 6, 'nrBand': 77, 'subcarrierSpacing': 30, 'carrierBandwidth': 273,
+         'arfcnDL': 650000, 'absoluteFrequencyPointA': 646724,
+         'absoluteFrequencySSB': 653134},
+    ]
+}
+
+# n48 50 MHz with offsetToCarrier 10 RB: 641668 - (23940 + 3600) kHz / 15 kHz = 639832
+XML_DUMP = """<gNB xmlns="urn:example">
+  <NRCellDU cellLocalId="7">
+    <nrBand>48</nrBand>
+    <subcarrierSpacing>30</subcarrierSpacing>
+    <carrierBandwidth>133</carrierBandwidth>
+    <arfcnDL>641668</arfcnDL>
+    <absoluteFrequencyPointA>639832</absoluteFrequencyPointA>
+    <offsetToCarrier>10</offsetToCarrier>
+  </NRCellDU>
+</gNB>
+"""
+
+
+class TestAudit(unittest.TestCase):
+    """Test cases for auditing configuration dumps"""
+
+    def setUp(self):
+        """Write a small set of configuration dumps"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        root = self.tmp_dir.name
+        os.makedirs(os.path.join(root, 'site'))
+        with open(os.path.join(root, 'a.json'), 'w') as f:
+            json.dump(JSON_DUMP, f)
+        with open(os.path.join(root, 'site', 'b.xml'), 'w') as f:
+            f.write(XML_DUMP)
+        with open(os.path.join(root, 'broken.json'), 'w') as f:
+            f.write('{not json')
+        with open(os.path.join(root, 'notes.txt'), 'w') as f:
+            f.write('ignored')
+
+    def tearDown(self):
+        """Remove the dumps"""
+        self.tmp_dir.cleanup()
+
+    def test_parse_xml(self):
+        """Test reading cell parameters from XML attributes and child elements"""
+        cells = parse_config_file(os.path.join(self.tmp_dir.name, 'site', 'b.xml'))
+        self.assertEqual(len(cells), 1)
+        self.assertEqual(cells[0]['cellLocalId'], '7')
+        self.assertEqual(cells[0]['offsetToCarrier'], '10')
+
+    def test_audit_results(self):
+        """Test statuses for matching, mismatching and invalid cells"""
+        results = list(audit_files([self.tmp_dir.name], workers=2))
+        statuses = {(os.path.basename(r['file']), r['cell_id']): r['status'] for r in results}
+
+        self.assertEqual(statuses, {
+            ('a.json', 1): 'ok',
+            ('a.json', 2): 'mismatch',
+            ('a.json', 3): 'mismatch',
+            ('a.json', 4): 'error',
+            ('a.json', 5): 'ok',
+            ('a.json', 6): 'mismatch',
+            ('broken.json', None): 'error',
+            ('b.xml', '7'): 'ok',
+        })
+
+        mismatch = next(r for r in results if r['cell_id'] == 2)
+        self.assertEqual(mismatch['expected_point_a'], 646724)
+        self.assertEqual(mismatch['configured_point_a'], 646700)
+        ssb_outside = next(r for r in results if r['cell_id'] == 6)
+        self.assertIn('3793.410-3800.610 MHz', ssb_outside['message'])
+
+    def test_invalid_cells(self):
+        """Test that malformed values give per-cell errors and malformed dumps are rejected"""
+        # n1 20 MHz: 428000 - 9540 kHz / 5 kHz = 426092
+        cell = {'cellId': 5, 'nrBand': 1, 'subcarrierSpacing': 15, 'carrierBandwidth': 106,
+                'arfcnDL': 428000, 'absoluteFrequencyPointA': 426092}
+        cells = [dict(cell, absoluteFrequencySSB=4000000),
+                 dict(cell, absoluteFrequencySSB='428000abc'),
+                 dict(cell, carrierBandwidth='106 RB'), dict(cell, arfcnDL='428000.5'),
+                # Without arfcnDL, a Point A 5 MHz below the top of n1 leaves no room for 20 MHz
+                {'cellId': 6, 'nrBand': 1, 'subcarrierSpacing': 15, 'carrierBandwidth': 106,
+                 'absoluteFrequencyPointA': 433000}]
+        path = os.path.join(self.tmp_dir.name, 'bad.json')
+        with open(path, 'w') as f:
+            json.dump(cells, f)
+        results = audit_file(path)
+        self.assertEqual([r['status'] for r in results], ['error'] * 5)
+        self.assertIn('outside the global frequency raster', results[0]['message'])
+        self.assertIn('outside band n1', results[4]['message'])
+
+        for dump, message in (({'cell': []}, "'cells'"), ([cell, [1, 2]], 'Cell 1')):
+            with open(path, 'w') as f:
+                json.dump(dump, f)
+            with self.assertRaises(ValueError) as ctx:
+                parse_config_file(path)
+            self.assertIn(message, str(ctx.exception))
+
+    def test_process_pool(self):
+        """Test that the process pool gives the same results as the thread pool"""
+        threaded = list(audit_files([self.tmp_dir.name], workers=2))
+        processes = list(audit_files([self.tmp_dir.name], workers=2, use_processes=True))
+        self.assertEqual(processes, threaded)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,94 @@
+"""
+Unit tests for the band-scan simulator and GSCN conversions
+"""
+
+import unittest
+
+import numpy as np
+
+from src.band_data import gscn_to_frequency_khz, frequency_khz_to_gscn
+from src.band_scan import band_scan_positions, simulate_band_scan
+from src.frequency_calculator import FrequencyCalculator
+
+
+class TestBandScan(unittest.TestCase):
+    """Test cases for synchronization raster scans"""
+
+    def setUp(self):
+        """Set up a calculator"""
+        self.calc = FrequencyCalculator()
+
+    def test_sync_raster_conversion(self):
+        """Test GSCN <-> SS_REF conversion in all three raster ranges"""
+        self.assertEqual(gscn_to_frequency_khz([2, 3, 4, 7498]).tolist(),
+                         [1250, 1350, 1450, 2999050])
+        self.assertEqual(gscn_to_frequency_khz([7499, 7711, 22256]).tolist(),
+                         [3000000, 3305280, 24250080])
+
+        gscn = np.arange(2, 26640)
+        np.testing.assert_array_equal(frequency_khz_to_gscn(gscn_to_frequency_khz(gscn)), gscn)
+        self.assertEqual(frequency_khz_to_gscn([1300, 3450000, 24250000]).tolist(), [-1, -1, -1])
+        with self.assertRaises(ValueError):
+            gscn_to_frequency_khz(26640)
+
+    def test_calculator_gscn_methods(self):
+        """Test ARFCN <-> GSCN on the calculator in every global raster range"""
+        for band, gscn, frequency in [('n1', 5279, 2112.05), ('n77', 7711, 3305.28),
+                                      ('n257', 22388, 26531.04)]:
+            with self.subTest(band=band):
+                arfcn = self.calc.gscn_to_arfcn(band, gscn)
+                self.assertAlmostEqual(self.calc.arfcn_to_frequency(band, arfcn), frequency, places=6)
+                self.assertEqual(self.calc.arfcn_to_gscn(band, arfcn), gscn)
+
+        with self.assertRaises(ValueError):
+            self.calc.arfcn_to_gscn('n77', 650000)
+
+    def test_band_scan_positions(self):
+        """Test that scan positions keep the whole SSB inside the band"""
+        positions = band_scan_positions('n1')
+        self.assertEqual(positions['gscn'][[0, -1]].tolist(), [5279, 5419])
+        positions = band_scan_positions('n257')
+        self.assertEqual(positions['gscn'][[0, -1]].tolist(), [22388, 22558])
+        self.assertLess(len(band_scan_positions('n5', 30)['gscn']), len(band_scan_positions('n5')['gscn']))
+        with self.assertRaises(ValueError):
+            band_scan_positions('n1', 30)
+
+    def test_simulate_band_scan(self):
+        """Test scan order, hits and time to first hit"""
+        deployed = [self.calc.gscn_to_arfcn('n1', 5300), self.calc.gscn_to_arfcn('n77', 8000),
+                    650000]
+        results = list(simulate_band_scan(self.calc, deployed, ['n1', 'n77', 'n77'],
+                                          bands=['n1', 'n77'], dwell_ms=10.0))
+
+        self.assertEqual([r['band'] for r in results], ['n1', 'n77'])
+        n1, n77 = results
+        self.assertEqual(n1['hit_gscn'].tolist(), [5300])
+        self.assertEqual(n1['first_hit_step'], 21)
+        self.assertEqual(n1['time_to_first_hit_ms'], 220.0)
+        self.assertEqual(n77['scan_start'], len(n1['gscn']))
+        self.assertEqual(n77['hit_gscn'].tolist(), [8000])
+        self.assertEqual(int(n77['hit'].sum()), 1)
+
+        descending = list(simulate_band_scan(self.calc, deployed, ['n1', 'n77', 'n77'],
+                                             bands=['n77'], order='descending'))
+        self.assertEqual(descending[0]['gscn'][0], 8329)
+        self.assertEqual(descending[0]['first_hit_step'], 329)
+
+    def test_market_scale_scan(self):
+        """Test a large deployed set against all bands in one pass per band"""
+        positions = np.concatenate([band_scan_positions(band)['gscn'] for band in ('n3', 'n48')])
+        gscn = np.random.default_rng(1).choice(positions, 100000)
+        deployed_mhz = gscn_to_frequency_khz(gscn) / 1000.0
+        deployed = np.rint((deployed_mhz - 3000.0) * 1000 / 15 + 600000).astype(np.int64)
+        deployed[deployed_mhz < 3000] = np.rint(deployed_mhz[deployed_mhz < 3000] * 1000 / 5)
+
+        results = {r['band']: r for r in simulate_band_scan(self.calc, deployed)}
+        self.assertEqual(set(results['n3']['hit_gscn'].tolist()) |
+                         set(results['n48']['hit_gscn'].tolist()), set(gscn.tolist()))
+        self.assertEqual(len(results['n257']['hit_gscn']), 0)
+        with self.assertRaises(ValueError):
+            next(simulate_band_scan(self.calc, deployed, order='random'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
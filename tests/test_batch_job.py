@@ -0,0 +1,145 @@
+"""
+Unit tests for checkpointed batch jobs
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.band_data import INVALID_BANDWIDTH, VALID
+from src.batch_job import OUTPUT_COLUMNS, run_batch_job
+from src.frequency_calculator import FrequencyCalculator
+
+
+class _FailingCalculator(FrequencyCalculator):
+    """Calculator that dies after a number of chunks and counts the chunks it computed"""
+
+    def __init__(self, fail_after=None):
+        super().__init__()
+        self.fail_after = fail_after
+        self.chunks = 0
+
+    def classify_point_a_batch(self, *args, **kwargs):
+        if self.fail_after is not None and self.chunks >= self.fail_after:
+            raise RuntimeError('worker died')
+        self.chunks += 1
+        return super().classify_point_a_batch(*args, **kwargs)
+
+
+class TestBatchJob(unittest.TestCase):
+    """Test cases for chunked, resumable Point A jobs"""
+
+    def setUp(self):
+        """Write a 25-row carrier CSV with two invalid rows"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.tmp.name, 'carriers.csv')
+        self.output = os.path.join(self.tmp.name, 'point_a.csv')
+        self.centers = np.arange(650000, 650025) * 2
+        self.bandwidths = [100] * 25
+        self.bandwidths[3] = self.bandwidths[17] = 7
+        with open(self.input, 'w') as f:
+            f.write('center_arfcn,band,scs_khz,bandwidth_mhz\n')
+            for center, bw in zip(self.centers.tolist(), self.bandwidths):
+                f.write(f"{center},n77,30,{bw}\n")
+
+    def tearDown(self):
+        """Remove the job files"""
+        self.tmp.cleanup()
+
+    def read_output(self):
+        """Read the output CSV as a list of rows"""
+        with open(self.output, newline='') as f:
+            return list(csv.reader(f))
+
+    def test_full_run(self):
+        """Test that the merged output matches the batch calculation"""
+        calc = FrequencyCalculator()
+        summary = run_batch_job(calc, self.input, self.output, chunk_rows=10)
+        self.assertEqual(summary, {'chunks': 3, 'processed_chunks': 3, 'skipped_chunks': 0,
+                                   'rows': 25, 'invalid_rows': 2})
+        rows = self.read_output()
+        self.assertEqual(tuple(rows[0]), OUTPUT_COLUMNS)
+        self.assertEqual(len(rows), 26)
+        self.assertFalse(os.path.exists(self.output + '.parts'))
+
+        expected = calc.calculate_point_a_arfcn_batch('n77', 30, 100, self.centers)
+        for row, bw, point_a in zip(rows[1:], self.bandwidths, expected.tolist()):
+            if bw == 100:
+                self.assertEqual((int(row[5]), int(row[7])), (point_a, VALID))
+            else:
+                self.assertEqual((int(row[5]), int(row[7])), (-1, INVALID_BANDWIDTH))
+
+    def test_resume_skips_completed_chunks(self):
+        """Test that a resumed job only computes the chunks left by a crash"""
+        with self.assertRaises(RuntimeError):
+            run_batch_job(_FailingCalculator(fail_after=2), self.input, self.output, chunk_rows=10)
+        with open(os.path.join(self.output + '.parts', 'manifest.json')) as f:
+            self.assertEqual(sorted(json.load(f)['chunks']), ['0', '1'])
+        self.assertFalse(os.path.exists(self.output))
+
+        calc = _FailingCalculator()
+        summary = run_batch_job(calc, self.input, self.output, chunk_rows=10, resume=True)
+        self.assertEqual((summary['processed_chunks'], summary['skipped_chunks']), (1, 2))
+        self.assertEqual(calc.chunks, 1)
+        resumed = self.read_output()
+
+        run_batch_job(FrequencyCalculator(), self.input, self.output, chunk_rows=10)
+        self.assertEqual(resumed, self.read_output())
+
+    def test_changed_input_is_not_merged(self):
+        """Test that resuming over a changed input chunk fails"""
+        with self.assertRaises(RuntimeError):
+            run_batch_job(_FailingCalculator(fail_after=1), self.input, self.output, chunk_rows=10)
+        with open(self.input) as f:
+            text = f.read()
+        with open(self.input, 'w') as f:
+            f.write(text.replace('1300002,', '1300004,'))
+
+        with self.assertRaisesRegex(ValueError, 'chunk 0 .* changed'):
+            run_batch_job(FrequencyCalculator(), self.input, self.output, chunk_rows=10,
+                          resume=True)
+        with self.assertRaisesRegex(ValueError, 'different chunk size'):
+            run_batch_job(FrequencyCalculator(), self.input, self.output, chunk_rows=5,
+                          resume=True)
+        summary = run_batch_job(FrequencyCalculator(), self.input, self.output, chunk_rows=10)
+        self.assertEqual(summary['processed_chunks'], 3)
+
+    def test_user_work_dir_is_kept(self):
+        """Test that only the job's own files are deleted from a given work directory"""
+        work_dir = os.path.join(self.tmp.name, 'work')
+        os.makedirs(work_dir)
+        with open(os.path.join(work_dir, 'notes.txt'), 'w') as f:
+            f.write('keep')
+        with self.assertRaisesRegex(ValueError, 'holds no job manifest'):
+            run_batch_job(FrequencyCalculator(), self.input, self.output, work_dir=work_dir)
+        self.assertEqual(os.listdir(work_dir), ['notes.txt'])
+
+        os.remove(os.path.join(work_dir, 'notes.txt'))
+        with self.assertRaises(RuntimeError):
+            run_batch_job(_FailingCalculator(fail_after=1), self.input, self.output,
+                          chunk_rows=10, work_dir=work_dir)
+        with open(os.path.join(work_dir, 'notes.txt'), 'w') as f:
+            f.write('keep')
+        run_batch_job(FrequencyCalculator(), self.input, self.output, chunk_rows=10,
+                      work_dir=work_dir)
+        self.assertEqual(os.listdir(work_dir), ['notes.txt'])
+        self.assertEqual(len(self.read_output()), 26)
+
+    def test_invalid_input(self):
+        """Test missing columns and malformed values"""
+        with open(self.input, 'a') as f:
+            f.write('abc,n77,30,100\n')
+        with self.assertRaisesRegex(ValueError, 'Malformed input in chunk 2'):
+            run_batch_job(FrequencyCalculator(), self.input, self.output, chunk_rows=10)
+        with open(self.input, 'w') as f:
+            f.write('band,center_arfcn\nn77,650000\n')
+        with self.assertRaisesRegex(ValueError, 'Missing input columns: scs_khz, bandwidth_mhz'):
+            run_batch_job(FrequencyCalculator(), self.input, self.output)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
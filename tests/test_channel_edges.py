@@ -0,0 +1,63 @@
+"""
+Unit tests for channel edges and guard bands
+"""
+
+import unittest
+
+import numpy as np
+
+from src.band_data import MAX_RB_TABLE, MIN_GUARD_BAND_TABLE, get_min_guard_band
+from src.channel_edges import calculate_channel_edges, calculate_channel_edges_batch
+from src.frequency_calculator import FrequencyCalculator
+
+
+class TestChannelEdges(unittest.TestCase):
+    """Test cases for channel edge and guard band calculations"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calc = FrequencyCalculator()
+
+    def test_min_guard_band_table(self):
+        """Test the guard table against (BW - N_RB * 12 * SCS) / 2 - SCS / 2"""
+        self.assertEqual(set(MIN_GUARD_BAND_TABLE), set(MAX_RB_TABLE))
+        for scs, row in MAX_RB_TABLE.items():
+            self.assertEqual(set(MIN_GUARD_BAND_TABLE[scs]), set(row))
+            for bw, n_rb in row.items():
+                self.assertEqual(get_min_guard_band(scs, bw),
+                                 (bw * 1000 - n_rb * 12 * scs) / 2 - scs / 2, (scs, bw))
+        with self.assertRaises(ValueError):
+            get_min_guard_band(15, 100)
+
+    def test_channel_edges_n77(self):
+        """Test edges of an n77 100 MHz carrier"""
+        edges = calculate_channel_edges(self.calc, 'n77', 30, 100, 650000)
+        self.assertEqual(edges['point_a_arfcn'], 646724)
+        self.assertAlmostEqual(edges['channel_low_freq_mhz'], 3700.0)
+        self.assertAlmostEqual(edges['channel_high_freq_mhz'], 3800.0)
+        self.assertAlmostEqual(edges['tx_low_freq_mhz'], 3700.86)
+        self.assertAlmostEqual(edges['tx_high_freq_mhz'], 3799.14)
+        self.assertEqual((edges['guard_low_khz'], edges['guard_high_khz']), (860.0, 860.0))
+        self.assertEqual(edges['min_guard_khz'], 845.0)
+        self.assertTrue(edges['guard_ok'])
+
+    def test_batch_matches_scalar(self):
+        """Test that the batch form matches scalar calls across FR1 and FR2"""
+        cases = [('n1', 15, 5, 428000, 0), ('n77', 30, 100, 650000, 2),
+                 ('n48', 30, 20, 640000, 0), ('n257', 120, 400, 2060000, 0)]
+        bands, scs, bw, centers, offsets = (np.array(column) for column in zip(*cases))
+        batch = calculate_channel_edges_batch(self.calc, bands, scs, bw, centers, offsets)
+        for i, case in enumerate(cases):
+            scalar = calculate_channel_edges(self.calc, *case)
+            for name, value in scalar.items():
+                self.assertEqual(batch[name][i], value, (case, name))
+        self.assertTrue(batch['guard_ok'].all())
+
+    def test_invalid_carrier(self):
+        """Test that invalid carriers raise the scalar error message"""
+        with self.assertRaisesRegex(ValueError, 'Invalid bandwidth'):
+            calculate_channel_edges_batch(self.calc, 'n1', 15, [5, 100], 428000)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,89 @@
+"""
+Unit tests for the spectrum defragmentation optimizer
+"""
+
+import unittest
+
+import numpy as np
+
+from src.defrag import optimize_defragmentation
+from src.frequency_calculator import FrequencyCalculator
+
+
+def _channels(result, bandwidth):
+    """Channel edges in kHz of the re-placed n77 carriers"""
+    center = 3000000 + 15 * (result['carriers']['center_arfcn'] - 600000)
+    return center - np.asarray(bandwidth) * 500, center + np.asarray(bandwidth) * 500
+
+
+class TestDefrag(unittest.TestCase):
+    """Test cases for optimize_defragmentation"""
+
+    def setUp(self):
+        """Set up a calculator and a two-carrier site on n77 (3300-4200 MHz)"""
+        self.calc = FrequencyCalculator()
+        # 100 MHz carriers centered at 3500.01 and 3800.01 MHz: largest gap 350 MHz
+        self.carriers = {'carrier_id': ['a', 'b'], 'site_id': [1, 1], 'scs_khz': [30, 30],
+                         'bandwidth_mhz': [100, 100], 'center_arfcn': [633334, 653334]}
+
+    def test_fewest_moves_for_widest_block(self):
+        """Test that both carriers move to the band edges for the widest block"""
+        result = optimize_defragmentation(self.calc, 'n77', self.carriers)
+        self.assertAlmostEqual(result['initial_free_block_mhz'], 350.0, delta=0.03)
+        self.assertGreater(result['free_block_mhz'], 699.9)
+        self.assertEqual(result['moves'], 2)
+        low, high = _channels(result, self.carriers['bandwidth_mhz'])
+        self.assertGreaterEqual(low.min(), 3300000)
+        self.assertLessEqual(high.max(), 4200000)
+        for i, center in enumerate(result['carriers']['center_arfcn'].tolist()):
+            self.assertEqual(result['carriers']['point_a_arfcn'][i],
+                             self.calc.calculate_point_a_arfcn('n77', 30, 100, center))
+
+    def test_move_limit_and_pinned_carriers(self):
+        """Test the move limit and that pinned carriers stay"""
+        one_move = optimize_defragmentation(self.calc, 'n77', self.carriers, max_moves=1)
+        self.assertEqual(one_move['moves'], 1)
+        # 'b' moves next to 'a' at the low edge, freeing 3550-4200 MHz
+        self.assertAlmostEqual(one_move['free_block_mhz'], 650.0, delta=0.03)
+
+        pinned = optimize_defragmentation(self.calc, 'n77', dict(self.carriers, pinned=[False, True]))
+        self.assertEqual(pinned['carriers']['moved'].tolist(), [True, False])
+        self.assertAlmostEqual(pinned['free_block_mhz'], 450.0, delta=0.03)
+
+    def test_cluster_constraints(self):
+        """Test a random cluster: same-site carriers never overlap and the block never shrinks"""
+        rng = np.random.default_rng(7)
+        carriers = {name: [] for name in ('carrier_id', 'site_id', 'scs_khz', 'bandwidth_mhz',
+                                          'center_arfcn', 'pinned')}
+        for site in range(40):
+            low = 3300000
+            for _ in range(5):
+                bw = int(rng.choice([20, 40, 60, 100]))
+                center = 600000 - (-(low + int(rng.integers(0, 60)) * 1000 + bw * 500 - 3000000) // 15)
+                low = 3000000 + 15 * (center - 600000) + bw * 500
+                if low > 4200000:
+                    break
+                for name, value in zip(carriers, (len(carriers['carrier_id']), site, 30, bw,
+                                                  center, bool(rng.random() < 0.05))):
+                    carriers[name].append(value)
+
+        result = optimize_defragmentation(self.calc, 'n77', carriers, max_moves=15)
+        self.assertGreaterEqual(result['free_block_mhz'], result['initial_free_block_mhz'])
+        self.assertLessEqual(result['moves'], 15)
+        self.assertFalse(result['carriers']['moved'][np.array(carriers['pinned'])].any())
+        low, high = _channels(result, carriers['bandwidth_mhz'])
+        sites = np.array(carriers['site_id'])
+        for site in np.unique(sites).tolist():
+            order = np.argsort(low[sites == site])
+            self.assertTrue((low[sites == site][order][1:] >= high[sites == site][order][:-1]).all())
+
+    def test_invalid_input(self):
+        """Test missing columns and carriers outside the band"""
+        with self.assertRaises(ValueError):
+            optimize_defragmentation(self.calc, 'n77', {'carrier_id': [1]})
+        with self.assertRaises(ValueError):
+            optimize_defragmentation(self.calc, 'n77', dict(self.carriers, center_arfcn=[620000, 653334]))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
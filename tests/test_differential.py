@@ -0,0 +1,212 @@
+"""
+Differential tests for the Point A calculation engines
+Randomly generated valid and invalid inputs are run through every engine and
+the outputs and error classification must agree exactly with the scalar
+FrequencyCalculator.calculate_point_a_arfcn
+
+Set DIFFERENTIAL_SEED / DIFFERENTIAL_ROWS to reproduce or widen a run.
+"""
+
+import os
+import unittest
+
+import numpy as np
+
+from src.band_data import (NR_BANDS, MAX_RB_TABLE, VALID, INVALID_BAND, INVALID_SCS,
+                           INVALID_BANDWIDTH, UNSUPPORTED_BANDWIDTH, INVALID_ARFCN,
+                           INVALID_OFFSET_TO_CARRIER, GLOBAL_RASTER_RANGES)
+from src.frequency_calculator import FrequencyCalculator
+
+SEED = int(os.environ.get('DIFFERENTIAL_SEED', '20240601'))
+ROWS = int(os.environ.get('DIFFERENTIAL_ROWS', '2000000'))
+SCALAR_SAMPLE = 20000
+
+# Scalar error messages mapped to validation codes
+_MESSAGE_CODES = [
+    ('Unknown band', INVALID_BAND),
+    ('Invalid SCS', INVALID_SCS),
+    ('Invalid bandwidth', INVALID_BANDWIDTH),
+    ('Unsupported bandwidth', UNSUPPORTED_BANDWIDTH),
+    ('ARFCN', INVALID_ARFCN),
+    ('Invalid offsetToCarrier', INVALID_OFFSET_TO_CARRIER),
+]
+
+
+def generate_inputs(rng: np.random.Generator, rows: int):
+    """
+    Generate random (band, SCS, bandwidth, center ARFCN, offsetToCarrier) rows
+
+    About 70% of rows use a band-valid SCS/bandwidth combination with an ARFCN
+    inside the band; the rest draw every field independently from valid and
+    invalid candidates, and a few ARFCNs and offsets are out of range.
+    """
+    band_names = list(NR_BANDS) + ['n999', 'n4']
+    scs_values = sorted(MAX_RB_TABLE) + [0, 25, 240]
+    bw_values = sorted({bw for rbs in MAX_RB_TABLE.values() for bw in rbs}) + [0, 7, 1000]
+
+    valid_combos = np.array([(i, scs, bw) for i, band in enumerate(NR_BANDS.values())
+                             for scs in band['supported_scs']
+                             for bw in band['supported_bandwidths']])
+    pick = valid_combos[rng.integers(0, len(valid_combos), rows)]
+    band_idx, scs, bw = pick[:, 0], pick[:, 1], pick[:, 2]
+
+    independent = rng.random(rows) < 0.3
+    count = int(independent.sum())
+    band_idx[independent] = rng.integers(0, len(band_names), count)
+    scs[independent] = np.array(scs_values)[rng.integers(0, len(scs_values), count)]
+    bw[independent] = np.array(bw_values)[rng.integers(0, len(bw_values), count)]
+
+    # Center ARFCNs uniformly inside each band's DL range (band numbering)
+    low = np.zeros(len(band_names), dtype=np.int64)
+    high = np.full(len(band_names), GLOBAL_RASTER_RANGES[-1]['arfcn_high'], dtype=np.int64)
+    for i, band in enumerate(NR_BANDS.values()):
+        for bound, freq in ((low, band['dl_freq_low']), (high, band['dl_freq_high'])):
+            bound[i] = round((freq - band['freq_ref_offset']) * 1000 / band['delta_f_global']
+                             + band['arfcn_offset'])
+    center = rng.integers(low[band_idx], high[band_idx] + 1)
+
+    off_raster = rng.random(rows) < 0.02
+    center[off_raster] = np.where(rng.random(int(off_raster.sum())) < 0.5,
+                                  rng.integers(-1000, 0, int(off_raster.sum())),
+                                  rng.integers(3279166, 3280166, int(off_raster.sum())))
+
+    offset = np.where(rng.random(rows) < 0.5, 0, rng.integers(0, 300, rows))
+    bad_offset = rng.random(rows) < 0.01
+    offset[bad_offset] = rng.choice([-1, 2200, 10000], int(bad_offset.sum()))
+
+    return np.array(band_names)[band_idx], scs, bw, center, offset
+
+
+def scalar_engine(calc, bands, scs, bw, center, offset):
+    """Run the scalar method row by row, returning (Point A, codes, messages)"""
+    point_a = np.zeros(len(bands), dtype=np.int64)
+    codes = np.zeros(len(bands), dtype=np.int8)
+    messages = [''] * len(bands)
+    for i, (band, row_scs, row_bw, row_center, row_offset) in enumerate(
+            zip(bands.tolist(), scs.tolist(), bw.tolist(), center.tolist(), offset.tolist())):
+        try:
+            point_a[i] = calc.calculate_point_a_arfcn(band, row_scs, row_bw, row_center,
+                                                      offset_to_carrier_rb=row_offset)
+        except ValueError as e:
+            messages[i] = str(e)
+            codes[i] = next(code for prefix, code in _MESSAGE_CODES if str(e).startswith(prefix))
+    return point_a, codes, messages
+
+
+def batch_engine(calc, bands, scs, bw, center, offset):
+    """Run the vectorized integer engine, returning (Point A, codes)"""
+    codes = calc.classify_point_a_batch(bands, scs, bw, center, offset)
+    point_a = np.zeros(len(bands), dtype=np.int64)
+    valid = codes == VALID
+    point_a[valid] = calc.calculate_point_a_arfcn_batch(bands[valid], scs[valid], bw[valid],
+                                                        center[valid], offset[valid])
+    return point_a, codes
+
+
+def frequency_domain_engine(bands, scs, bw, center, offset):
+    """
+    Vectorized replica of the scalar frequency-domain steps (valid rows only)
+
+    Converts the center on the global raster range of the ARFCN and Point A
+    back on the raster range holding its frequency, in float64, so it must
+    agree with the integer engine on every row.
+    """
+    def raster(range_idx):
+        """Per-row (F_REF_Offs, Δf_global, N_REF_Offs) of the global raster range"""
+        return tuple(np.array([r[key] for r in GLOBAL_RASTER_RANGES])[range_idx]
+                     for key in ('freq_ref_offset', 'delta_f_global', 'arfcn_offset'))
+
+    combos, combo_idx = np.unique(scs * 10000 + bw, return_inverse=True)
+    n_rb = np.array([MAX_RB_TABLE[c // 10000][c % 10000] for c in combos.tolist()])[combo_idx]
+
+    freq_ref_offset, delta_f_global, arfcn_offset = raster(
+        np.searchsorted([r['arfcn_low'] for r in GLOBAL_RASTER_RANGES], center, side='right') - 1)
+    center_freq_mhz = freq_ref_offset + (delta_f_global * (center - arfcn_offset) / 1000.0)
+    half_grid_khz = (n_rb * 12 * scs) / 2
+    offset_khz = offset * 12 * scs
+    point_a_freq_mhz = center_freq_mhz - ((half_grid_khz + offset_khz) / 1000.0)
+
+    # Point A goes back to an ARFCN on the raster range containing its frequency
+    freq_ref_offset, delta_f_global, arfcn_offset = raster(
+        (np.searchsorted([r['freq_ref_offset'] for r in GLOBAL_RASTER_RANGES],
+                         point_a_freq_mhz + 1e-9, side='right') - 1).clip(0))
+    return np.rint((point_a_freq_mhz - freq_ref_offset) * 1000 / delta_f_global
+                   + arfcn_offset).astype(np.int64)
+
+
+class TestDifferential(unittest.TestCase):
+    """Differential tests between scalar, frequency-domain and integer engines"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate the random inputs once for all tests"""
+        cls.calc = FrequencyCalculator()
+        cls.rng = np.random.default_rng(SEED)
+        cls.inputs = generate_inputs(cls.rng, ROWS)
+
+    def test_inputs_cover_every_classification(self):
+        """Test that the generator produces every error class"""
+        codes = self.calc.classify_point_a_batch(*self.inputs)
+        for code in (VALID, INVALID_BAND, INVALID_SCS, INVALID_BANDWIDTH,
+                     UNSUPPORTED_BANDWIDTH, INVALID_ARFCN, INVALID_OFFSET_TO_CARRIER):
+            with self.subTest(code=code):
+                self.assertGreater(int((codes == code).sum()), 0)
+
+    def test_batch_matches_frequency_domain(self):
+        """Test the integer engine against the float frequency-domain steps on all rows"""
+        point_a, codes = batch_engine(self.calc, *self.inputs)
+        valid = codes == VALID
+        expected = frequency_domain_engine(*(column[valid] for column in self.inputs))
+        mismatches = np.flatnonzero(point_a[valid] != expected)
+        self.assertEqual(len(mismatches), 0,
+                         f"First mismatching row: {[c[valid][mismatches[:1]] for c in self.inputs]}")
+
+    def test_batch_matches_scalar(self):
+        """Test outputs and error classification against the scalar method"""
+        sample = self.rng.choice(ROWS, min(SCALAR_SAMPLE, ROWS), replace=False)
+        rows = [column[sample] for column in self.inputs]
+
+        scalar_point_a, scalar_codes, _ = scalar_engine(self.calc, *rows)
+        batch_point_a, batch_codes = batch_engine(self.calc, *rows)
+
+        np.testing.assert_array_equal(batch_codes, scalar_codes)
+        np.testing.assert_array_equal(batch_point_a, scalar_point_a)
+
+        valid = scalar_codes == VALID
+        bands = rows[0][valid]
+        scalar_freqs = [self.calc.arfcn_to_frequency(band, arfcn)
+                        for band, arfcn in zip(bands.tolist(), scalar_point_a[valid].tolist())]
+        np.testing.assert_array_equal(
+            self.calc.arfcn_to_frequency_batch(bands, batch_point_a[valid]), scalar_freqs
+        )
+
+    def test_carrier_layout_matches_point_a(self):
+        """Test that the fused carrier layout agrees with the Point A engines"""
+        point_a, codes = batch_engine(self.calc, *self.inputs)
+        valid = codes == VALID
+        layout = self.calc.calculate_carrier_layout_batch(*(column[valid] for column in self.inputs))
+        np.testing.assert_array_equal(layout['point_a_arfcn'], point_a[valid])
+
+        sample = self.rng.choice(ROWS, 2000, replace=False)
+        rows = [column[sample] for column in self.inputs]
+        scalar_point_a, scalar_codes, _ = scalar_engine(self.calc, *rows)
+        for i in np.flatnonzero(scalar_codes == VALID).tolist():
+            row = [column[i].item() for column in rows]
+            layout = self.calc.calculate_carrier_layout(*row[:4], offset_to_carrier_rb=row[4])
+            self.assertEqual(layout['point_a_arfcn'], scalar_point_a[i])
+
+    def test_batch_error_messages_match_scalar(self):
+        """Test that the batch method raises the scalar message for invalid rows"""
+        sample = self.rng.choice(ROWS, 2000, replace=False)
+        rows = [column[sample] for column in self.inputs]
+        _, codes, messages = scalar_engine(self.calc, *rows)
+
+        for i in np.flatnonzero(codes != VALID)[:200].tolist():
+            with self.subTest(row=[column[i] for column in rows]):
+                with self.assertRaises(ValueError) as ctx:
+                    self.calc.calculate_point_a_arfcn_batch(*(column[i:i + 1] for column in rows))
+                self.assertEqual(str(ctx.exception), messages[i])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
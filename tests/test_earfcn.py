@@ -0,0 +1,70 @@
+"""
+Unit tests for the LTE EARFCN to NR-ARFCN cross-mapping
+"""
+
+import unittest
+
+import numpy as np
+
+from src.band_data import LTE_BANDS
+from src.earfcn import earfcn_to_frequency_batch, map_earfcn_to_nr_batch
+from src.frequency_calculator import FrequencyCalculator
+
+
+class TestEarfcn(unittest.TestCase):
+    """Test cases for EARFCN conversion and DSS mapping"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calc = FrequencyCalculator()
+
+    def test_earfcn_to_frequency(self):
+        """Test EARFCN conversion at known channels of each band"""
+        result = earfcn_to_frequency_batch([300, 1575, 18300, 2525, 3100, 3625, 5110, 23060])
+        np.testing.assert_array_equal(result['lte_band'], [1, 3, 1, 5, 7, 8, 12, 12])
+        np.testing.assert_array_equal(result['uplink'],
+                                      [False, False, True, False, False, False, False, True])
+        np.testing.assert_array_equal(result['frequency_khz'],
+                                      [2140000, 1842500, 1950000, 881500, 2655000, 942500,
+                                       739000, 704000])
+        self.assertEqual(result['nr_band'].tolist()[4], 'n7')
+
+    def test_map_to_nr_round_trips(self):
+        """Test that every EARFCN maps to an aligned NR-ARFCN of the same frequency"""
+        earfcn = np.concatenate([np.arange(info[f'{link}_earfcn_offset'],
+                                           info[f'{link}_earfcn_high'] + 1)
+                                 for info in LTE_BANDS.values() for link in ('dl', 'ul')])
+        result = map_earfcn_to_nr_batch(self.calc, earfcn)
+        np.testing.assert_allclose(
+            self.calc.arfcn_to_frequency_batch(result['nr_band'], result['nr_arfcn']),
+            result['frequency_mhz'])
+        self.assertTrue(result['raster_aligned'].all())
+        np.testing.assert_array_equal(result['shift_7p5khz'], result['uplink'])
+
+    def test_point_a_on_lte_grid(self):
+        """Test Point A placement on the lowest LTE subcarrier"""
+        result = map_earfcn_to_nr_batch(self.calc, [300, 1575, 20400], [20, 10, 1.4])
+        np.testing.assert_array_equal(result['nr_arfcn'], [428000, 368500, 164800])
+        np.testing.assert_array_equal(result['lte_n_rb'], [100, 50, 6])
+        np.testing.assert_array_equal(result['point_a_arfcn'], [426200, 367600, 164692])
+        np.testing.assert_allclose(result['point_a_freq_mhz'], [2131.0, 1838.0, 823.46])
+
+        # Uplink: Point A stays on the unshifted grid, 7.5 kHz below the lowest LTE subcarrier
+        uplink = map_earfcn_to_nr_batch(self.calc, 18300, 20)
+        self.assertTrue(uplink['shift_7p5khz'])
+        self.assertEqual(uplink['point_a_arfcn'].item(), 388200)
+        lowest_subcarrier_mhz = (1950000 - 100 * 90 + 7.5) / 1000.0
+        self.assertAlmostEqual(uplink['point_a_freq_mhz'].item() + 0.0075, lowest_subcarrier_mhz)
+
+    def test_invalid_inputs(self):
+        """Test EARFCNs outside the DSS bands and invalid LTE bandwidths"""
+        with self.assertRaisesRegex(ValueError, 'EARFCN 600 outside'):
+            earfcn_to_frequency_batch([300, 600])
+        with self.assertRaises(ValueError):
+            earfcn_to_frequency_batch(-1)
+        with self.assertRaisesRegex(ValueError, 'Invalid LTE bandwidth 7.0 MHz'):
+            map_earfcn_to_nr_batch(self.calc, [300, 301], [20, 7])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
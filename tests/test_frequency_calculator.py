@@ -3,7 +3,11 @@ Unit tests for 5G NR frequency calculator
 Based on 3GPP TS 38.104 Release 16
 """
 
+import threading
 import unittest
+
+import numpy as np
+
 from src.frequency_calculator import FrequencyCalculator
 
 
@@ -17,7 +21,7 @@ class TestFrequencyCalculator(unittest.TestCase):
     def test_point_a_calculation_n77(self):
         """Test Point A calculation for Band n77"""
         # Test case: Band n77, SCS 30kHz, BW 100MHz, Center ARFCN 650000
-        # Expected Point A ARFCN: 646724 (3400.86 MHz)
+        # Expected Point A ARFCN: 646724 (3700.86 MHz)
         
         point_a_arfcn = self.calc.calculate_point_a_arfcn(
             band='n77',
@@ -31,22 +35,26 @@ class TestFrequencyCalculator(unittest.TestCase):
         
         # Verify Point A frequency
         point_a_freq = self.calc.arfcn_to_frequency('n77', point_a_arfcn)
-        self.assertAlmostEqual(point_a_freq, 3400.86, places=2,
+        self.assertAlmostEqual(point_a_freq, 3700.86, places=2,
                               msg="Point A frequency conversion failed")
     
     def test_arfcn_frequency_conversion_n77(self):
         """Test ARFCN to frequency conversion for Band n77"""
         # Test Point A ARFCN to frequency
         freq = self.calc.arfcn_to_frequency('n77', 646724)
-        self.assertAlmostEqual(freq, 3400.86, places=2)
+        self.assertAlmostEqual(freq, 3700.86, places=2)
         
         # Test center ARFCN to frequency  
         freq = self.calc.arfcn_to_frequency('n77', 650000)
-        self.assertAlmostEqual(freq, 3450.0, places=2)
+        self.assertAlmostEqual(freq, 3750.0, places=2)
         
         # Test some other known values
-        freq = self.calc.arfcn_to_frequency('n77', 620000)  # Reference point
-        self.assertAlmostEqual(freq, 3000.0, places=2)
+        freq = self.calc.arfcn_to_frequency('n77', 620000)  # Lower band edge
+        self.assertAlmostEqual(freq, 3300.0, places=2)
+        
+        # NR-ARFCNs are global: overlapping bands agree on every ARFCN
+        self.assertEqual(self.calc.arfcn_to_frequency('n77', 641668),
+                         self.calc.arfcn_to_frequency('n48', 641668))
     
     def test_point_a_calculation_multiple_cases(self):
         """Test Point A calculation for multiple bandwidth and SCS combinations"""
@@ -364,6 +372,354 @@ class TestFrequencyCalculator(unittest.TestCase):
                 self.assertAlmostEqual(freq, expected_freq, places=2,
                                      msg=f"Frequency conversion failed for {band} ARFCN {arfcn}")
 
+    
+    def test_point_a_batch_matches_scalar(self):
+        """Test vectorized Point A calculation against the scalar method"""
+        cases = [
+            ('n77', 30, 100, 650000),
+            ('n77', 15, 20, 650000),
+            ('n48', 30, 50, 641668),
+            ('n1', 15, 10, 432000),
+            ('n12', 15, 15, 147500),
+        ]
+        bands, scs, bw, centers = zip(*cases)
+        
+        point_a = self.calc.calculate_point_a_arfcn_batch(bands, scs, bw, centers)
+        expected = [self.calc.calculate_point_a_arfcn(*case) for case in cases]
+        self.assertEqual(point_a.tolist(), expected)
+        
+        freqs = self.calc.arfcn_to_frequency_batch(bands, point_a)
+        expected_freqs = [self.calc.arfcn_to_frequency(band, arfcn)
+                          for band, arfcn in zip(bands, expected)]
+        self.assertEqual(freqs.tolist(), expected_freqs)
+    
+    def test_point_a_batch_broadcasting(self):
+        """Test that scalar arguments broadcast against ARFCN arrays"""
+        point_a = self.calc.calculate_point_a_arfcn_batch('n77', 30, 100, np.arange(650000, 650003))
+        self.assertEqual(point_a.tolist(), [646724, 646725, 646726])
+    
+    def test_point_a_batch_invalid_inputs(self):
+        """Test error handling of the vectorized calculation"""
+        with self.assertRaises(ValueError):
+            self.calc.calculate_point_a_arfcn_batch(['n77', 'n999'], 30, 100, 650000)
+        with self.assertRaises(ValueError):
+            self.calc.calculate_point_a_arfcn_batch('n77', [30, 25], 100, 650000)
+        with self.assertRaises(ValueError):
+            self.calc.calculate_point_a_arfcn_batch('n77', 60, [30, 5], 650000)
+        with self.assertRaises(ValueError):
+            self.calc.arfcn_to_frequency_batch(['n77', 'n999'], 650000)
+
+    
+    def test_fr2_point_a_calculation(self):
+        """Test Point A calculation for FR2 band n257"""
+        # Center ARFCN 2079167 = 24250.08 + 60 kHz × 62500 = 28000.08 MHz
+        # N_RB 66 at 120 kHz: HalfGrid = 66 × 12 × 120 / 2 = 47.52 MHz
+        point_a_arfcn = self.calc.calculate_point_a_arfcn('n257', 120, 100, 2079167)
+        self.assertEqual(point_a_arfcn, 2078375)
+        
+        point_a_freq = self.calc.arfcn_to_frequency('n257', point_a_arfcn)
+        self.assertAlmostEqual(point_a_freq, 27952.56, places=2)
+        
+        band_info = self.calc.get_band_info('n257')
+        self.assertEqual(band_info['frequency_range'], 'FR2')
+        self.assertEqual(band_info['arfcn_offset'], 2016667)
+        self.assertEqual(band_info['delta_f_global'], 60.0)
+    
+    def test_global_raster_ranges(self):
+        """Test ARFCN to raster range resolution at the partition boundaries"""
+        from src.band_data import get_raster_range, get_raster_range_for_frequency
+        
+        test_cases = [
+            # (ARFCN, N_REF_Offs, Δf_global)
+            (0, 0, 5.0),
+            (599999, 0, 5.0),
+            (600000, 600000, 15.0),
+            (2016666, 600000, 15.0),
+            (2016667, 2016667, 60.0),
+            (3279165, 2016667, 60.0),
+        ]
+        for arfcn, arfcn_offset, delta_f_global in test_cases:
+            with self.subTest(arfcn=arfcn):
+                raster = get_raster_range(arfcn)
+                self.assertEqual(raster['arfcn_offset'], arfcn_offset)
+                self.assertEqual(raster['delta_f_global'], delta_f_global)
+        
+        for arfcn in [-1, 3279166]:
+            with self.assertRaises(ValueError):
+                get_raster_range(arfcn)
+        
+        self.assertEqual(get_raster_range_for_frequency(2999.995)['arfcn_offset'], 0)
+        self.assertEqual(get_raster_range_for_frequency(3000.0)['arfcn_offset'], 600000)
+        self.assertEqual(get_raster_range_for_frequency(24250.0)['arfcn_offset'], 2016667)
+    
+    def test_mixed_fr1_fr2_batch_conversion(self):
+        """Test converting a mixed FR1/FR2 batch in one call"""
+        bands = ['n1', 'n48', 'n77', 'n257', 'n261']
+        arfcns = [432000, 641668, 650000, 2079167, 2071667]
+        
+        freqs = self.calc.arfcn_to_frequency_batch(bands, arfcns)
+        expected = [self.calc.arfcn_to_frequency(band, arfcn) for band, arfcn in zip(bands, arfcns)]
+        self.assertEqual(freqs.tolist(), expected)
+        
+        # Without bands every row converts on the global raster all the same
+        freqs = self.calc.arfcn_to_frequency_batch(None, arfcns)
+        self.assertAlmostEqual(freqs[2], 3750.0, places=2)
+        self.assertAlmostEqual(freqs[3], 28000.08, places=2)
+        
+        with self.assertRaises(ValueError):
+            self.calc.arfcn_to_frequency_batch(None, [3279166])
+        
+        # The inverse conversion round-trips and rounds down between raster points
+        khz = np.rint(freqs * 1000).astype(np.int64)
+        self.assertEqual(self.calc.frequency_to_arfcn_batch(khz).tolist(), arfcns)
+        self.assertEqual(self.calc.frequency_to_arfcn_batch([3750014, 28000139]).tolist(),
+                         [650000, 2079167])
+        with self.assertRaises(ValueError):
+            self.calc.frequency_to_arfcn_batch([-5])
+        with self.assertRaises(ValueError):
+            self.calc.frequency_to_arfcn_batch([100000000])
+        
+        point_a = self.calc.calculate_point_a_arfcn_batch(['n77', 'n258'], [30, 120], [100, 400],
+                                                          [650000, 2050000])
+        self.assertEqual(point_a.tolist(), [
+            self.calc.calculate_point_a_arfcn('n77', 30, 100, 650000),
+            self.calc.calculate_point_a_arfcn('n258', 120, 400, 2050000),
+        ])
+
+    
+    def test_offset_to_carrier(self):
+        """Test Point A with a non-zero offsetToCarrier"""
+        # n48 50 MHz at 30 kHz: HalfGrid 23.94 MHz + 10 RB × 360 kHz = 27.54 MHz = 1836 ARFCN
+        point_a = self.calc.calculate_point_a_arfcn('n48', 30, 50, 641668, offset_to_carrier_rb=10)
+        self.assertEqual(point_a, 641668 - 1836)
+        
+        batch = self.calc.calculate_point_a_arfcn_batch('n48', 30, 50, 641668, [0, 10])
+        self.assertEqual(batch.tolist(), [640072, point_a])
+        
+        dl_point_a, ul_point_a = self.calc.calculate_point_a_arfcn_fdd('n1', 15, 10, 432000, 394000,
+                                                                       offset_to_carrier_rb=2)
+        self.assertEqual(dl_point_a, 431064 - 72)
+        self.assertEqual(ul_point_a, 393064 - 72)
+        
+        for offset in [-1, 2200]:
+            with self.assertRaises(ValueError):
+                self.calc.calculate_point_a_arfcn('n48', 30, 50, 641668, offset_to_carrier_rb=offset)
+
+    
+    def test_carrier_layout(self):
+        """Test the fused carrier layout with SSB and CORESET#0"""
+        layout = self.calc.calculate_carrier_layout('n1', 15, 10, 432000, ssb_arfcn=432000,
+                                                    coreset_zero=6)
+        self.assertEqual(layout['point_a_arfcn'], 431064)
+        self.assertEqual(layout['carrier_end_arfcn'], 432936)
+        self.assertEqual(layout['offset_to_point_a'], 16)
+        self.assertEqual(layout['k_ssb'], 0)
+        self.assertTrue(layout['ssb_in_carrier'])
+        # Index 6 at 15/15 kHz: 48 RB, 1 symbol, offset 12 RB below SSB CRB 16
+        self.assertEqual((layout['coreset0_n_rb'], layout['coreset0_start_crb']), (48, 4))
+        self.assertTrue(layout['coreset0_in_carrier'])
+        
+        # offsetToCarrier moves Point A down; the carrier itself stays put
+        shifted = self.calc.calculate_carrier_layout('n1', 15, 10, 432000, offset_to_carrier_rb=2)
+        self.assertEqual(shifted['point_a_arfcn'], 431064 - 72)
+        self.assertEqual(shifted['carrier_start_arfcn'], 431064)
+        
+        # FR2: offsetToPointA in 60 kHz RBs, k_SSB in units of the PDCCH SCS
+        layout = self.calc.calculate_carrier_layout('n257', 120, 100, 2079167, ssb_arfcn=2079167)
+        self.assertEqual((layout['offset_to_point_a'], layout['k_ssb']), (46, 0))
+        
+        batch = self.calc.calculate_carrier_layout_batch(['n1', 'n77'], [15, 30], [10, 100],
+                                                         [432000, 650000], ssb_arfcn=[432000, 650000],
+                                                         coreset_zero=[6, 12])
+        self.assertEqual(batch['point_a_arfcn'].tolist(), [431064, 646724])
+        self.assertEqual(batch['coreset0_start_crb'].tolist(), [4, 110])
+        self.assertEqual(batch['ssb_freq_mhz'].tolist(), [2160.0, 3750.0])
+        
+        with self.assertRaises(ValueError):
+            self.calc.calculate_carrier_layout('n1', 15, 10, 432000, ssb_arfcn=432001)
+        with self.assertRaises(ValueError):
+            self.calc.calculate_carrier_layout('n1', 15, 10, 432000, coreset_zero=0)
+        with self.assertRaises(ValueError):
+            self.calc.calculate_carrier_layout('n1', 15, 10, 432000, ssb_arfcn=432000,
+                                               coreset_zero=15)
+        with self.assertRaises(ValueError):
+            self.calc.calculate_carrier_layout_batch('n1', 15, 10, 432000, ssb_arfcn=[432000, 432001])
+    
+    def test_carrier_layout_ssb_scs(self):
+        """Test that the SSB SCS defaults to and must be one of the band's SSB SCS"""
+        # n1 carriers may use 30 kHz, its SSBs only 15 kHz
+        layout = self.calc.calculate_carrier_layout('n1', 30, 10, 432000, ssb_arfcn=432000)
+        self.assertEqual(layout['ssb_scs_khz'], 15)
+        self.assertEqual(layout['ssb_freq_mhz'], 2160.0)
+        batch = self.calc.calculate_carrier_layout_batch(['n1', 'n1', 'n77'], [15, 30, 30],
+                                                         [10, 10, 100], [432000, 432000, 650000],
+                                                         ssb_arfcn=[432000, 432000, 650000])
+        self.assertEqual(batch['ssb_scs_khz'].tolist(), [15, 15, 30])
+        
+        with self.assertRaisesRegex(ValueError, 'Invalid SSB SCS 30 kHz for band n1'):
+            self.calc.calculate_carrier_layout('n1', 30, 10, 432000, ssb_arfcn=432000,
+                                               ssb_scs_khz=30)
+        with self.assertRaisesRegex(ValueError, 'Invalid SSB SCS 15 kHz for band n77'):
+            self.calc.calculate_carrier_layout_batch(['n1', 'n77'], 30, [10, 100],
+                                                     [432000, 650000], ssb_arfcn=[432000, 650000],
+                                                     ssb_scs_khz=15)
+
+    
+    def test_solve_center_arfcn(self):
+        """Test the inverse solver against the forward Point A calculation"""
+        for band, point_a, offset in [('n77', 646724, 0), ('n1', 431064, 2), ('n257', 2078375, 0)]:
+            solutions = self.calc.solve_center_arfcn(band, point_a, offset)
+            self.assertGreater(len(solutions), 0)
+            for s in solutions:
+                with self.subTest(band=band, **s):
+                    self.assertEqual(self.calc.calculate_point_a_arfcn(
+                        band, s['scs_khz'], s['bandwidth_mhz'], s['center_arfcn'], offset_to_carrier_rb=offset
+                    ), point_a)
+            
+            batch = self.calc.solve_center_arfcn_batch(band, [point_a], offset)
+            self.assertEqual(batch['center_arfcn'].tolist(), [s['center_arfcn'] for s in solutions])
+            self.assertEqual(batch['n_rb'].tolist(), [s['n_rb'] for s in solutions])
+        
+        # n1 10 MHz at 15 kHz centered on 432000 is one of the solutions
+        self.assertIn({'scs_khz': 15, 'bandwidth_mhz': 10, 'n_rb': 52, 'center_arfcn': 432000},
+                      self.calc.solve_center_arfcn('n1', 431064))
+        # Point A at the top edge of n1 leaves no room for any carrier
+        self.assertEqual(self.calc.solve_center_arfcn('n1', 434000), [])
+        # Point A on the bottom edge of n77 (3300 MHz): the guard band below the
+        # RBs would put every channel edge under the band
+        self.assertEqual(self.calc.solve_center_arfcn('n77', 620000), [])
+        for s in self.calc.solve_center_arfcn('n77', 620100):
+            with self.subTest(band='n77', **s):
+                center_mhz = self.calc.arfcn_to_frequency('n77', s['center_arfcn'])
+                self.assertGreaterEqual(center_mhz - s['bandwidth_mhz'] / 2, 3300.0)
+        
+        batch = self.calc.solve_center_arfcn_batch(['n1', 'n77'], [434000, 646724])
+        self.assertEqual(set(batch['row'].tolist()), {1})
+        
+        with self.assertRaises(ValueError):
+            self.calc.solve_center_arfcn('n999', 431064)
+        with self.assertRaises(ValueError):
+            self.calc.solve_center_arfcn_batch('n1', -1)
+
+    
+    def test_validity_matrix(self):
+        """Test the band x SCS x bandwidth matrix against the validation chain"""
+        from src.band_data import (NR_BANDS, N_RB_MATRIX_SCS, N_RB_MATRIX_BANDWIDTHS, MAX_RB_TABLE,
+                                   is_valid_scs, is_valid_bandwidth, lookup_n_rb,
+                                   explain_combination, INVALID_BAND, INVALID_SCS,
+                                   INVALID_BANDWIDTH, UNSUPPORTED_BANDWIDTH, VALID)
+        for band in list(NR_BANDS) + ['n999']:
+            for scs in N_RB_MATRIX_SCS + (25,):
+                for bw in N_RB_MATRIX_BANDWIDTHS + (7,):
+                    expected = 0
+                    if is_valid_scs(band, scs) and is_valid_bandwidth(band, bw):
+                        expected = MAX_RB_TABLE.get(scs, {}).get(bw, 0)
+                    self.assertEqual(lookup_n_rb(band, scs, bw), expected, (band, scs, bw))
+        
+        explanation = explain_combination('n77', 30, 100)
+        self.assertEqual((explanation['code'], explanation['n_rb'], explanation['reason']),
+                         (VALID, 273, None))
+        self.assertEqual(explain_combination('n999', 30, 100)['code'], INVALID_BAND)
+        
+        explanation = explain_combination('n1', 60, 10)
+        self.assertEqual(explanation['code'], INVALID_SCS)
+        self.assertEqual(explanation['reason'], 'Invalid SCS 60 kHz for band n1')
+        self.assertEqual(explanation['valid_scs'], [15, 30])
+        
+        self.assertEqual(explain_combination('n1', 15, 100)['code'], INVALID_BANDWIDTH)
+        explanation = explain_combination('n48', 15, 60)
+        self.assertEqual(explanation['code'], UNSUPPORTED_BANDWIDTH)
+        self.assertNotIn(60, explanation['valid_bandwidths'])
+        self.assertIn(50, explanation['valid_bandwidths'])
+    
+    def test_concurrent_use_with_table_swaps(self):
+        """Test that threads sharing a calculator get exact results while tables are swapped"""
+        from src.band_data import compile_band_tables
+        
+        centers = np.arange(640000, 660000, 7)
+        expected = self.calc.calculate_point_a_arfcn_batch('n77', 30, 100, centers)
+        errors = []
+        stop = threading.Event()
+        
+        def work():
+            try:
+                for _ in range(20):
+                    np.testing.assert_array_equal(
+                        self.calc.calculate_point_a_arfcn_batch('n77', 30, 100, centers), expected)
+                    self.assertEqual(self.calc.calculate_point_a_arfcn('n77', 30, 100, 650000),
+                                     646724)
+            except Exception as error:
+                errors.append(error)
+        
+        def reload():
+            while not stop.is_set():
+                self.calc.reload_tables(compile_band_tables())
+        
+        reloader = threading.Thread(target=reload)
+        workers = [threading.Thread(target=work) for _ in range(4)]
+        reloader.start()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        stop.set()
+        reloader.join()
+        self.assertEqual(errors, [])
+        
+        self.assertFalse(self.calc.tables['n_rb'].flags.writeable)
+    
+    def test_point_a_round_trip_in_every_raster_range(self):
+        """Test that Point A and arfcn_to_frequency use the same raster in every range"""
+        # n1 at 15 kHz / 20 MHz has 106 RB, n77 at 30 kHz / 100 MHz 273 RB. 600100 puts
+        # Point A one range below the center.
+        cases = [('n1', 15, 20, 106, center) for center in (400000, 600100, 650000, 2100000)]
+        cases.append(('n77', 30, 100, 273, 650000))
+        for band, scs, bw, n_rb, center in cases:
+            with self.subTest(band=band, center=center):
+                point_a = self.calc.calculate_point_a_arfcn(band, scs, bw, center)
+                self.assertEqual(
+                    self.calc.calculate_point_a_arfcn_batch(band, scs, bw, [center]).tolist(),
+                    [point_a])
+                half_grid_mhz = n_rb * 6 * scs / 1000.0
+                self.assertAlmostEqual(self.calc.arfcn_to_frequency(band, center) -
+                                       self.calc.arfcn_to_frequency(band, point_a),
+                                       half_grid_mhz, places=6)
+                layout = self.calc.calculate_carrier_layout(band, scs, bw, center)
+                self.assertEqual(layout['point_a_arfcn'], point_a)
+                self.assertAlmostEqual(layout['point_a_freq_mhz'],
+                                       self.calc.arfcn_to_frequency(band, point_a), places=6)
+                self.assertAlmostEqual(layout['center_freq_mhz'],
+                                       self.calc.arfcn_to_frequency(band, center), places=6)
+    
+    def test_scalar_methods_follow_reloaded_tables(self):
+        """Test that the scalar methods use the tables swapped in by reload_tables"""
+        from src.band_data import compile_band_tables
+        
+        tables = compile_band_tables()
+        scs_idx = tables['scs_values'].tolist().index(30)
+        bw_idx = tables['bandwidth_values'].tolist().index(100)
+        band_idx = tables['band_names'].tolist().index('n77')
+        tables['n_rb'][band_idx, scs_idx, bw_idx] = 272
+        self.assertEqual(self.calc.calculate_point_a_arfcn('n77', 30, 100, 650000), 646724)
+        self.calc.reload_tables(tables)
+        
+        batch = self.calc.calculate_point_a_arfcn_batch('n77', 30, 100, [650000])
+        self.assertEqual(batch.tolist(), [646736])
+        self.assertEqual(self.calc.calculate_point_a_arfcn('n77', 30, 100, 650000), 646736)
+        layout = self.calc.calculate_carrier_layout('n77', 30, 100, 650000)
+        self.assertEqual((layout['n_rb'], layout['point_a_arfcn']), (272, 646736))
+        result = self.calc.calculate_point_a_result('n77', 30, 100, 650000)
+        self.assertEqual((result.n_rb, result.point_a_arfcn), (272, 646736))
+        self.assertIn({'scs_khz': 30, 'bandwidth_mhz': 100, 'n_rb': 272, 'center_arfcn': 650000},
+                      self.calc.solve_center_arfcn('n77', 646736))
+        
+        tables['n_rb'][band_idx, scs_idx, bw_idx] = 0
+        self.calc.reload_tables(tables)
+        with self.assertRaises(ValueError):
+            self.calc.calculate_point_a_arfcn('n77', 30, 100, 650000)
+        with self.assertRaises(TypeError):
+            self.calc.tables['n_rb'] = None
+
 
 if __name__ == '__main__':
     # Run specific test
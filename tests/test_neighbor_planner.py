@@ -0,0 +1,119 @@
+"""
+Unit tests for the neighbor-cell measurement object planner
+"""
+
+import unittest
+
+import numpy as np
+
+from src.frequency_calculator import FrequencyCalculator
+from src.neighbor_planner import plan_measurement_objects, plan_measurement_object_chunks
+
+# Per-layer carriers: (band, SCS, bandwidth, center/SSB ARFCN)
+_LAYERS = [('n77', 30, 100, 650000), ('n77', 30, 100, 650192), ('n1', 15, 10, 432000),
+           ('n48', 30, 50, 641668)]
+
+
+def _random_network(rng: np.random.Generator, num_sites: int):
+    """Generate a random cell table and site adjacency"""
+    cells_per_site = rng.integers(1, 4, num_sites)
+    site_id = np.repeat(np.arange(num_sites) * 10, cells_per_site)
+    layer = rng.integers(0, len(_LAYERS), len(site_id))
+    columns = list(zip(*_LAYERS))
+    cells = {
+        'cell_id': np.arange(len(site_id)) + 1000,
+        'site_id': site_id,
+        'band': np.array(columns[0])[layer],
+        'scs_khz': np.array(columns[1])[layer],
+        'bandwidth_mhz': np.array(columns[2])[layer],
+        'center_arfcn': np.array(columns[3])[layer],
+        'ssb_arfcn': np.array(columns[3])[layer],
+    }
+    edges = rng.integers(0, num_sites, (num_sites * 2, 2)) * 10
+    return cells, edges
+
+
+class TestNeighborPlanner(unittest.TestCase):
+    """Test cases for measurement object planning"""
+
+    def setUp(self):
+        """Set up a calculator"""
+        self.calc = FrequencyCalculator()
+
+    def test_small_network(self):
+        """Test measurement objects of a three-site network"""
+        cells = {'cell_id': [10, 11, 20, 30], 'site_id': [1, 1, 2, 3],
+                 'band': ['n77', 'n1', 'n77', 'n48'], 'scs_khz': [30, 15, 30, 30],
+                 'bandwidth_mhz': [100, 10, 100, 50],
+                 'center_arfcn': [650000, 432000, 650000, 641668],
+                 'ssb_arfcn': [650000, 432000, 650000, 641668]}
+        plan = {entry['cell_id']: entry['measurement_objects']
+                for entry in plan_measurement_objects(self.calc, cells, [(1, 2), (2, 99)])}
+
+        self.assertEqual([mo['ssb_arfcn'] for mo in plan[20]], [432000, 650000])
+        self.assertEqual([mo['serving'] for mo in plan[20]], [False, True])
+        self.assertEqual(plan[20][0]['ssb_freq_mhz'], 2160.0)
+        self.assertEqual(plan[30], [{'ssb_arfcn': 641668, 'ssb_scs_khz': 30, 'ssb_freq_mhz': 3625.02,
+                                     'band': 'n48', 'serving': True}])
+
+    def test_overlapping_bands(self):
+        """Test that n48 and n77 cells on one SSB ARFCN are separate measurement objects"""
+        cells = {'cell_id': [10, 20, 30], 'site_id': [1, 2, 2], 'band': ['n48', 'n77', 'n77'],
+                 'scs_khz': [30, 30, 30], 'bandwidth_mhz': [50, 100, 100],
+                 'center_arfcn': [641668, 641668, 650000],
+                 'ssb_arfcn': [641668, 641668, 650000]}
+        plan = {entry['cell_id']: entry['measurement_objects']
+                for entry in plan_measurement_objects(self.calc, cells, [(1, 2)])}
+
+        self.assertEqual([(mo['ssb_arfcn'], mo['band'], mo['serving']) for mo in plan[10]],
+                         [(641668, 'n48', True), (641668, 'n77', False), (650000, 'n77', False)])
+        self.assertEqual([(mo['band'], mo['serving']) for mo in plan[20]],
+                         [('n48', False), ('n77', True), ('n77', False)])
+        self.assertEqual({mo['ssb_freq_mhz'] for mo in plan[20][:2]}, {3625.02})
+
+    def test_matches_per_edge_reference(self):
+        """Test the grouped expansion against a per-edge Python reference"""
+        cells, edges = _random_network(np.random.default_rng(7), 300)
+        neighbors = {site: {site} for site in cells['site_id'].tolist()}
+        for u, v in edges.tolist():
+            neighbors[u].add(v)
+            neighbors[v].add(u)
+        site_freqs = {}
+        for site, ssb in zip(cells['site_id'].tolist(), cells['ssb_arfcn'].tolist()):
+            site_freqs.setdefault(site, set()).add(ssb)
+
+        for chunk_sites in (1, 17, 1000):
+            with self.subTest(chunk_sites=chunk_sites):
+                plan = list(plan_measurement_objects(self.calc, cells, edges, chunk_sites))
+                self.assertEqual(sorted(entry['cell_id'] for entry in plan),
+                                 cells['cell_id'].tolist())
+                for entry in plan:
+                    i = entry['cell_id'] - 1000
+                    site = cells['site_id'][i]
+                    expected = sorted(set().union(*(site_freqs[n] for n in neighbors[site])))
+                    self.assertEqual([mo['ssb_arfcn'] for mo in entry['measurement_objects']],
+                                     expected)
+
+    def test_chunks_are_columnar(self):
+        """Test that chunks are equal-length arrays covering every cell"""
+        cells, edges = _random_network(np.random.default_rng(3), 50)
+        chunks = list(plan_measurement_object_chunks(self.calc, cells, edges, chunk_sites=20))
+        self.assertEqual(len(chunks), 3)
+        for chunk in chunks:
+            self.assertEqual(len({len(column) for column in chunk.values()}), 1)
+        served = np.concatenate([chunk['cell_id'][chunk['serving']] for chunk in chunks])
+        self.assertEqual(sorted(served.tolist()), cells['cell_id'].tolist())
+
+    def test_invalid_input(self):
+        """Test that invalid carriers and missing columns are rejected"""
+        cells = {'cell_id': [1], 'site_id': [1], 'band': ['n1'], 'scs_khz': [15],
+                 'bandwidth_mhz': [100], 'center_arfcn': [432000], 'ssb_arfcn': [432000]}
+        with self.assertRaisesRegex(ValueError, 'Invalid bandwidth'):
+            list(plan_measurement_objects(self.calc, cells, []))
+        del cells['ssb_arfcn']
+        with self.assertRaisesRegex(ValueError, 'Missing cell columns'):
+            list(plan_measurement_objects(self.calc, cells, []))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
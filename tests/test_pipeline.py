@@ -0,0 +1,143 @@
+"""
+Unit tests for the streaming calculator pipeline
+"""
+
+import io
+import time
+import unittest
+
+import numpy as np
+
+from src.band_data import VALID
+from src.band_scan import band_scan_positions
+from src.frequency_calculator import FrequencyCalculator
+from src.pipeline import (PIPELINE_COLUMNS, CsvSink, Stage, conflict_chunk, csv_chunks,
+                          run_pipeline, ssb_chunk, standard_stages, validate_chunk)
+
+
+def _carriers(chunks, rows):
+    """Chunks of n77 / n1 carriers, some of them invalid"""
+    rng = np.random.default_rng(5)
+    for _ in range(chunks):
+        yield {'band': np.array(['n77', 'n1'])[rng.integers(0, 2, rows)],
+               'scs_khz': np.full(rows, 30), 'bandwidth_mhz': rng.choice([20, 40, 100], rows),
+               'center_arfcn': rng.integers(640000, 680000, rows),
+               'offset_to_carrier_rb': np.zeros(rows, dtype=np.int64)}
+
+
+def _tag(calc, chunk):
+    """Stage taking longer for some chunks, to shuffle the completion order"""
+    time.sleep(0.02 * (int(chunk['center_arfcn'][0]) % 3))
+    return chunk
+
+
+def _drop_odd(calc, chunk):
+    """Stage dropping chunks that start with an odd center ARFCN"""
+    return None if chunk['center_arfcn'][0] % 2 else chunk
+
+
+def _fail(calc, chunk):
+    raise RuntimeError('stage failed')
+
+
+class TestPipeline(unittest.TestCase):
+    """Test cases for run_pipeline and the standard stages"""
+
+    def setUp(self):
+        """Set up a calculator"""
+        self.calc = FrequencyCalculator()
+
+    def test_standard_stages_match_calculator(self):
+        """Test the standard stages against direct batch calls, in source order"""
+        chunks = []
+        metrics = run_pipeline(self.calc, _carriers(6, 500), standard_stages(workers=2),
+                               chunks.append)
+        self.assertEqual(metrics['rows'], 3000)
+        expected = list(_carriers(6, 500))
+        for chunk, source in zip(chunks, expected):
+            np.testing.assert_array_equal(chunk['center_arfcn'], source['center_arfcn'])
+            valid = chunk['status'] == VALID
+            self.assertTrue(valid.any() and not valid.all())
+            np.testing.assert_array_equal(
+                chunk['point_a_arfcn'][valid],
+                self.calc.calculate_point_a_arfcn_batch(chunk['band'][valid], 30,
+                                                        chunk['bandwidth_mhz'][valid],
+                                                        chunk['center_arfcn'][valid]))
+            self.assertTrue((chunk['ssb_gscn'][~valid] == -1).all())
+            for band in ('n77', 'n1'):
+                rows = valid & (chunk['band'] == band)
+                self.assertTrue(np.isin(chunk['ssb_gscn'][rows],
+                                        band_scan_positions(band)['gscn']).all())
+            self.assertFalse(chunk['guard_ok'][~valid].any())
+
+    def test_ssb_stage(self):
+        """Test that SSBs use the band's SSB SCS and stay on the band's raster positions"""
+        # n77 carries 30 kHz SSBs: 7.2 MHz fit in a 10 MHz carrier at 60 kHz
+        chunk = validate_chunk(self.calc, {
+            'band': np.array(['n77', 'n77']), 'scs_khz': np.array([60, 30]),
+            'bandwidth_mhz': np.array([10, 10]), 'center_arfcn': np.array([640000, 620000]),
+            'offset_to_carrier_rb': np.zeros(2, dtype=np.int64)})
+        chunk = ssb_chunk(self.calc, chunk)
+        self.assertEqual(chunk['status'].tolist(), [VALID, VALID])
+        self.assertTrue(chunk['ssb_in_channel'][0])
+        # 3300 MHz: the nearest GSCN (7707, 3299.52 MHz) is below the band
+        self.assertEqual(chunk['ssb_gscn'][1], band_scan_positions('n77')['gscn'][0])
+
+    def test_conflict_stage(self):
+        """Test that only overlapping carriers of one site conflict"""
+        # Channels (MHz): site 1 3690-3710, 3700-3720, 3720-3740; site 2 3705-3725
+        chunk = validate_chunk(self.calc, {
+            'band': np.full(5, 'n77'), 'scs_khz': np.full(5, 30),
+            'bandwidth_mhz': np.full(5, 20),
+            'center_arfcn': np.array([646667, 647333, 648667, 648000, 1]),
+            'offset_to_carrier_rb': np.zeros(5, dtype=np.int64),
+            'site_id': np.array([1, 1, 1, 2, 1])})
+        conflict = conflict_chunk(self.calc, chunk)['conflict']
+        self.assertEqual(conflict.tolist(), [True, True, False, False, False])
+        del chunk['site_id']
+        self.assertFalse(conflict_chunk(self.calc, chunk)['conflict'].any())
+
+    def test_order_drops_and_backpressure(self):
+        """Test source order with uneven workers, dropped chunks and bounded queues"""
+        chunks = []
+        metrics = run_pipeline(self.calc, _carriers(12, 10),
+                               [Stage('shuffle', _tag, workers=3), Stage('drop', _drop_odd)],
+                               chunks.append, queue_size=2)
+        expected = [chunk for chunk in _carriers(12, 10) if chunk['center_arfcn'][0] % 2 == 0]
+        self.assertEqual([c['center_arfcn'][0] for c in chunks],
+                         [c['center_arfcn'][0] for c in expected])
+        self.assertEqual(metrics['stages']['drop']['chunks'], 12)
+        self.assertEqual(metrics['chunks'], 12)
+        self.assertEqual(metrics['bottleneck'], 'shuffle')
+        for stage in metrics['stages'].values():
+            self.assertLessEqual(stage['queue_depth_max'], 2)
+
+    def test_csv_round_trip_with_process_stage(self):
+        """Test CSV source and sink around a stage running in a worker process"""
+        rows = ['band,scs_khz,bandwidth_mhz,center_arfcn,site_id'] + \
+            [f"n77,30,100,{650000 + i},7" for i in range(25)] + ['n1,60,20,431000,7']
+        out = io.StringIO()
+        stages = standard_stages()
+        stages[1] = Stage('point_a', stages[1].func, processes=True)
+        metrics = run_pipeline(self.calc, csv_chunks(io.StringIO('\n'.join(rows) + '\n'), 10),
+                               stages, CsvSink(out))
+        self.assertEqual(metrics['chunks'], 3)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], ','.join(PIPELINE_COLUMNS))
+        self.assertEqual(lines[1].split(',')[6], '646724')
+        self.assertEqual(lines[1].split(',')[-1], 'True')
+        self.assertEqual(lines[-1].split(',')[6], '-1')
+        self.assertEqual(lines[-1].split(',')[-1], 'False')
+
+    def test_errors(self):
+        """Test that stage errors stop the pipeline and bad stage lists are rejected"""
+        with self.assertRaises(RuntimeError):
+            run_pipeline(self.calc, _carriers(50, 10), [Stage('fail', _fail)], lambda chunk: None)
+        with self.assertRaises(ValueError):
+            run_pipeline(self.calc, [], [Stage('sink', _tag)], lambda chunk: None)
+        with self.assertRaises(ValueError):
+            Stage('bad', _tag, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
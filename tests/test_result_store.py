@@ -0,0 +1,74 @@
+"""
+Unit tests for the SQLite result store
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.frequency_calculator import FrequencyCalculator
+from src.result_store import ResultStore
+
+
+class TestResultStore(unittest.TestCase):
+    """Test cases for persisting and querying Point A results"""
+
+    def setUp(self):
+        """Set up a calculator and an in-memory store"""
+        self.calc = FrequencyCalculator()
+        self.store = ResultStore()
+
+    def tearDown(self):
+        """Close the store"""
+        self.store.close()
+
+    def test_compute_and_insert(self):
+        """Test that stored results match the scalar calculation"""
+        centers = np.array([650000, 650100, 650200])
+        inserted = self.store.compute_and_insert(self.calc, 'n77', 30, 100, centers)
+        self.assertEqual(inserted, 3)
+        self.assertEqual(self.store.count(), 3)
+        self.assertEqual(self.store.count('n48'), 0)
+
+        result = self.store.query_point_a_range('n77', 646724, 646724)
+        self.assertEqual(result['point_a_arfcn'].tolist(), [646724])
+        self.assertEqual(result['center_arfcn'].tolist(), [650000])
+        self.assertAlmostEqual(result['frequency_mhz'][0], 3700.86, places=2)
+
+    def test_range_queries(self):
+        """Test Point A and frequency range queries return sorted numpy arrays"""
+        self.store.compute_and_insert(self.calc, ['n77', 'n48', 'n77'], 30, [100, 50, 20],
+                                      [650000, 641668, 650000])
+
+        result = self.store.query_point_a_range('n77', 640000, 660000)
+        self.assertIsInstance(result['point_a_arfcn'], np.ndarray)
+        self.assertEqual(result['point_a_arfcn'].tolist(), [646724, 649388])
+        self.assertEqual(result['bandwidth_mhz'].tolist(), [100, 20])
+
+        result = self.store.query_frequency_range('n48', 3600.0, 3602.0)
+        self.assertEqual(result['point_a_arfcn'].tolist(), [640072])
+
+        result = self.store.query_frequency_range('n1', 0.0, 10000.0)
+        self.assertEqual(len(result['point_a_arfcn']), 0)
+
+    def test_invalid_batch_not_inserted(self):
+        """Test that an invalid batch raises and leaves the store unchanged"""
+        with self.assertRaises(ValueError):
+            self.store.compute_and_insert(self.calc, 'n77', 25, 100, [650000])
+        self.assertEqual(self.store.count(), 0)
+
+    def test_persistence(self):
+        """Test that results survive reopening a file-backed store"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'results.db')
+            with ResultStore(path) as store:
+                store.compute_and_insert(self.calc, 'n1', 15, 10, [432000])
+            with ResultStore(path) as store:
+                result = store.query_point_a_range('n1', 431064, 431064)
+                self.assertEqual(result['band'].tolist(), ['n1'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,112 @@
+"""
+Unit tests for the compact Point A result objects
+"""
+
+import io
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.band_data import compile_band_tables
+from src.frequency_calculator import FrequencyCalculator
+from src.results import PointAResult, PointAResultSet, RESULT_SET_COLUMNS
+
+
+class TestResults(unittest.TestCase):
+    """Test cases for PointAResult and PointAResultSet"""
+
+    def setUp(self):
+        """Set up a calculator and a mixed-band result set"""
+        self.calc = FrequencyCalculator()
+        self.bands = np.array(['n77', 'n1', 'n77', 'n48'], dtype='<U4')
+        self.scs = np.array([30, 15, 30, 30])
+        self.bw = np.array([100, 20, 50, 20])
+        self.centers = np.array([650000, 431000, 640000, 640000])
+        self.offsets = np.array([0, 2, 0, 0])
+        self.results = self.calc.calculate_point_a_result_set(self.bands, self.scs, self.bw,
+                                                              self.centers, self.offsets)
+
+    def test_scalar_result(self):
+        """Test the scalar record against the plain calculator and pickling"""
+        result = self.calc.calculate_point_a_result('n77', 30, 100, 650000)
+        self.assertEqual(result.point_a_arfcn, 646724)
+        self.assertEqual(result.n_rb, 273)
+        self.assertAlmostEqual(result.point_a_freq_mhz, 3700.86, places=3)
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+        self.assertEqual(result.to_dict()['band'], 'n77')
+
+    def test_result_set_matches_rows(self):
+        """Test that every row matches the scalar calculation"""
+        self.assertEqual(len(self.results), 4)
+        for i, row in enumerate(self.results):
+            self.assertEqual(row, self.calc.calculate_point_a_result(
+                str(self.bands[i]), int(self.scs[i]), int(self.bw[i]), int(self.centers[i]),
+                int(self.offsets[i])))
+        self.assertEqual(self.results[-1], list(self.results)[-1])
+
+    def test_slicing_and_filtering(self):
+        """Test slices, masks and select return compact result sets"""
+        self.assertIsInstance(self.results[1:3], PointAResultSet)
+        self.assertEqual(len(self.results[::2]), 2)
+        n77 = self.results.select(band='n77')
+        np.testing.assert_array_equal(n77.center_arfcn, [650000, 640000])
+        self.assertEqual(len(self.results.select(band='n77', bandwidth_mhz=50)), 1)
+        self.assertEqual(len(self.results.select(band='n999')), 0)
+        wide = self.results.filter(self.results.n_rb > 100)
+        self.assertEqual(wide.band.tolist(), ['n77', 'n1', 'n77'])
+
+    def test_export_and_persistence(self):
+        """Test array and CSV export, pickling and npz round trip"""
+        arrays = self.results.to_arrays()
+        self.assertEqual(tuple(arrays), RESULT_SET_COLUMNS)
+        np.testing.assert_array_equal(arrays['offset_to_carrier_rb'], self.offsets)
+
+        buffer = io.StringIO()
+        self.assertEqual(self.results.write_csv(buffer, chunk_size=3), 4)
+        lines = buffer.getvalue().splitlines()
+        self.assertEqual(lines[0], ','.join(RESULT_SET_COLUMNS))
+        self.assertEqual(len(lines), 5)
+
+        restored = pickle.loads(pickle.dumps(self.results))
+        self.assertEqual(list(restored), list(self.results))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'results.npz')
+            self.results.save(path)
+            self.assertEqual(list(PointAResultSet.load(path, self.calc)), list(self.results))
+
+    def test_compact_storage(self):
+        """Test that rows without offsets cost 12 bytes"""
+        results = self.calc.calculate_point_a_result_set('n77', 30, 100,
+                                                         np.arange(650000, 651000))
+        self.assertEqual(results.nbytes, 12 * 1000)
+        self.assertEqual(self.results.nbytes, 14 * 4)
+
+    def test_derived_from_producing_tables(self):
+        """Test that N_RB comes from the tables the rows were calculated with"""
+        tables = compile_band_tables()
+        band = tables['band_names'].tolist().index('n77')
+        scs, bw = (tables[name].tolist().index(value)
+                   for name, value in (('scs_values', 30), ('bandwidth_values', 100)))
+        tables['n_rb'][band, scs, bw] = 272
+        calc = FrequencyCalculator(tables=tables)
+        results = calc.calculate_point_a_result_set('n77', 30, 100, [650000])
+        self.assertEqual(results.n_rb.tolist(), [272])
+        self.assertEqual(results.point_a_arfcn.tolist(), [646736])
+        calc.reload_tables()
+        self.assertEqual(results.n_rb.tolist(), [272])
+        self.assertEqual(pickle.loads(pickle.dumps(results)).n_rb.tolist(), [272])
+
+    def test_unknown_band(self):
+        """Test that unknown bands are rejected"""
+        with self.assertRaises(ValueError):
+            PointAResultSet.from_arrays(self.calc, 'n999', 30, 100, 650000, 646724)
+        self.assertIsInstance(self.results[0], PointAResult)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
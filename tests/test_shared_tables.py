@@ -0,0 +1,108 @@
+"""
+Unit tests for shared-memory band tables
+"""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src import shared_tables
+from src.band_data import GLOBAL_RASTER_RANGES, compile_band_tables, tables_version
+from src.frequency_calculator import FrequencyCalculator
+from src.shared_tables import publish_tables, attach_tables
+
+
+def _worker_point_a(name, queue):
+    """Attach to published tables in a child process and calculate Point A"""
+    with attach_tables(name) as shared:
+        calc = shared.calculator()
+        queue.put(calc.calculate_point_a_arfcn_batch('n77', 30, 100, [650000]).tolist())
+
+
+class TestSharedTables(unittest.TestCase):
+    """Test cases for publishing and attaching band tables"""
+
+    def setUp(self):
+        """Publish the band tables"""
+        self.published = publish_tables()
+
+    def tearDown(self):
+        """Unlink the segment"""
+        self.published.close()
+
+    def test_attach_matches_compiled_tables(self):
+        """Test that attached arrays equal a local compilation"""
+        expected = compile_band_tables()
+        with attach_tables(self.published.name) as shared:
+            self.assertEqual(set(shared.tables), set(expected))
+            for name, array in expected.items():
+                with self.subTest(table=name):
+                    np.testing.assert_array_equal(shared.tables[name], array)
+                    self.assertFalse(shared.tables[name].flags.writeable)
+
+    def test_calculator_on_shared_tables(self):
+        """Test that a calculator backed by shared tables gives identical results"""
+        with attach_tables(self.published.name) as shared:
+            calc = shared.calculator()
+            point_a = calc.calculate_point_a_arfcn_batch(['n77', 'n1'], [30, 15], [100, 10],
+                                                         [650000, 432000])
+            self.assertEqual(point_a.tolist(), [646724, 431064])
+            expected = FrequencyCalculator().arfcn_to_frequency_batch(['n77', 'n1'], point_a)
+            np.testing.assert_array_equal(calc.arfcn_to_frequency_batch(['n77', 'n1'], point_a),
+                                          expected)
+
+    def test_calculator_outlives_handles(self):
+        """Test that calculators keep working after their handles are closed"""
+        with attach_tables(self.published.name) as shared:
+            attached = shared.calculator()
+        with publish_tables() as published:
+            owned = published.calculator()
+        with self.assertRaises(FileNotFoundError):
+            attach_tables(published.name)
+        for calc in (attached, owned):
+            self.assertEqual(calc.calculate_point_a_arfcn_batch('n77', 30, 100, [650000]).tolist(),
+                             [646724])
+
+    def test_stale_segment_rejected(self):
+        """Test that a segment published from other band data is never used"""
+        with mock.patch.object(shared_tables, 'tables_version', return_value=b'\0' * 32):
+            with self.assertRaises(ValueError):
+                attach_tables(self.published.name)
+
+    def test_version_covers_raster_ranges(self):
+        """Test that editing a raster range changes the band data version"""
+        version = tables_version()
+        with mock.patch.dict(GLOBAL_RASTER_RANGES[1], arfcn_offset=600001):
+            self.assertNotEqual(tables_version(), version)
+        self.assertEqual(tables_version(), version)
+
+    def test_worker_process(self):
+        """Test attaching from a separate process"""
+        ctx = multiprocessing.get_context('spawn')
+        queue = ctx.Queue()
+        process = ctx.Process(target=_worker_point_a, args=(self.published.name, queue))
+        process.start()
+        result = queue.get(timeout=30)
+        process.join(timeout=30)
+        self.assertEqual(result, [646724])
+        self.assertEqual(process.exitcode, 0)
+
+    def test_unrelated_process_leaves_segment(self):
+        """Test that a process with its own resource tracker does not unlink the segment"""
+        script = ('import sys; from src.shared_tables import attach_tables; '
+                  'attach_tables(sys.argv[1]).close()')
+        result = subprocess.run([sys.executable, '-c', script, self.published.name],
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual((result.returncode, result.stderr), (0, ''))
+        with attach_tables(self.published.name) as shared:
+            self.assertEqual(set(shared.tables), set(self.published.tables))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)